@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Benchmark decoding and ingestion of input dictionaries."""
+
+from conftest import DEPTH, LENGTH, WIDTH, peak_memory
+from generate import generate_records
+
+from foxplot import Fox
+from foxplot.decode import decode
+
+
+def load_records(path: str) -> int:
+    return sum(1 for _ in decode(path))
+
+
+def update(records) -> Fox:
+    fox = Fox.empty()
+    for record in records:
+        fox.unpack(record)
+    return fox
+
+
+def test_decode_json(measure, json_log):
+    measure(load_records, json_log)
+
+
+def test_decode_mpack(measure, mpack_log):
+    measure(load_records, mpack_log)
+
+
+def test_update(measure):
+    records = list(generate_records(LENGTH, WIDTH, DEPTH))
+    measure(update, records)
+
+
+def test_freeze(benchmark):
+    records = list(generate_records(LENGTH, WIDTH, DEPTH))
+    benchmark.pedantic(
+        Fox.freeze,
+        setup=lambda: ((update(records),), {}),
+        rounds=5,
+    )
+    if benchmark.stats is None:  # run once with --benchmark-disable
+        return
+    benchmark.extra_info["records_per_second"] = (
+        LENGTH / benchmark.stats.stats.mean
+    )
+    benchmark.extra_info["peak_memory"] = peak_memory(
+        Fox.freeze, update(records)
+    )
+
+
+def test_load_json(measure, json_log):
+    measure(Fox, json_log)
+
+
+def test_load_mpack(measure, mpack_log):
+    measure(Fox, mpack_log)
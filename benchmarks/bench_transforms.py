@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Benchmark transforms and plots of loaded series."""
+
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from foxplot import Fox
+from foxplot.cache import DEFAULT_MAX_BYTES, transform_cache
+from foxplot.functions import estimate_lag, estimate_lags
+from foxplot.node import Node
+from foxplot.series import Series
+
+# Maximum number of series in the node of transformed series.
+NODE_WIDTH = 16
+
+
+@pytest.fixture(scope="module")
+def fox(mpack_log) -> Fox:
+    fox = Fox(mpack_log)
+    fox.detect_time()
+    return fox
+
+
+@pytest.fixture(scope="module")
+def floats(fox) -> List[Series]:
+    """Floating-point series of the log, whatever its width and depth."""
+    series = [
+        leaf
+        for leaf in fox.data._leaves()
+        if leaf is not fox.data.time and leaf._dtype.kind == "f"
+    ]
+    if len(series) < 2:
+        pytest.skip("Log has fewer than two floating-point series")
+    return series
+
+
+@pytest.fixture(scope="module")
+def node(floats) -> Node:
+    """Node of floating-point series, keyed by their index."""
+    node = Node("/floats")
+    for i, leaf in enumerate(floats[:NODE_WIDTH]):
+        node._insert([i], leaf)
+    return node
+
+
+@pytest.fixture(autouse=True)
+def uncached():
+    """Measure transforms rather than lookups in the cache of results."""
+    transform_cache.resize(0)
+    yield
+    transform_cache.resize(DEFAULT_MAX_BYTES)
+
+
+def test_deriv(measure, floats):
+    measure(floats[0].deriv, "s")
+
+
+def test_deriv_cutoff(measure, floats):
+    measure(floats[0].deriv, "s", 0.1)
+
+
+def test_low_pass_filter(measure, floats):
+    measure(floats[0].low_pass_filter, 0.1)
+
+
+def test_estimate_lag(measure, fox, floats):
+    measure(estimate_lag, fox.data.time, floats[0], floats[1], 0.1)
+
+
+def test_estimate_lags(measure, fox, node):
+    measure(estimate_lags, fox.data.time, node, node, [0.1, 1.0])
+
+
+def test_plot(measure, fox, node):
+    with patch("webbrowser.open_new_tab"):
+        measure(fox.plot, node)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Compare benchmarks between two commits of the local repository.
+
+The benchmarks of the current working tree are run against the ``foxplot``
+package of each commit, checked out in a temporary git worktree, then
+compared with ``pytest-benchmark compare``.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_DIR = os.path.dirname(BENCHMARKS_DIR)
+
+
+def run_benchmarks(revision: str, output_dir: str, pytest_args) -> str:
+    """Run benchmarks against the package at a given revision.
+
+    Args:
+        revision: Git revision of the package to benchmark.
+        output_dir: Directory where the worktree and results are written.
+        pytest_args: Additional arguments forwarded to pytest.
+
+    Returns:
+        Path to the JSON file of benchmark results.
+    """
+    worktree = os.path.join(output_dir, f"worktree-{revision}")
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", worktree, revision],
+        cwd=REPOSITORY_DIR,
+        check=True,
+    )
+    try:
+        shutil.copytree(BENCHMARKS_DIR, os.path.join(worktree, "_benchmarks"))
+        output = os.path.join(output_dir, f"{revision}.json")
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "_benchmarks",
+                "-o",
+                "python_files=bench_*.py",
+                f"--benchmark-json={output}",
+                *pytest_args,
+            ],
+            cwd=worktree,
+            check=False,  # benchmarks may not apply to older revisions
+        )
+        return output
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", worktree],
+            cwd=REPOSITORY_DIR,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline", help="git revision to compare against")
+    parser.add_argument(
+        "contender",
+        nargs="?",
+        default="HEAD",
+        help="git revision to compare (default: HEAD)",
+    )
+    args, pytest_args = parser.parse_known_args()
+    with tempfile.TemporaryDirectory(prefix="foxplot-bench-") as output_dir:
+        results = [
+            run_benchmarks(revision, output_dir, pytest_args)
+            for revision in (args.baseline, args.contender)
+        ]
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from pytest_benchmark.cli import main; main()",
+                "compare",
+                "--columns=min,mean,median,rounds",
+                *results,
+            ],
+            check=True,
+        )
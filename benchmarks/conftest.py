@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Fixtures shared by benchmarks.
+
+The size of synthetic logs is configured by the ``FOXPLOT_BENCH_LENGTH``,
+``FOXPLOT_BENCH_WIDTH`` and ``FOXPLOT_BENCH_DEPTH`` environment variables.
+"""
+
+import os
+import tracemalloc
+
+import pytest
+from generate import write_log
+
+LENGTH = int(os.environ.get("FOXPLOT_BENCH_LENGTH", 10_000))
+WIDTH = int(os.environ.get("FOXPLOT_BENCH_WIDTH", 100))
+DEPTH = int(os.environ.get("FOXPLOT_BENCH_DEPTH", 3))
+
+
+def peak_memory(function, *args) -> int:
+    """Measure peak memory allocated by a function call.
+
+    Args:
+        function: Function to call.
+        args: Positional arguments of the function.
+
+    Returns:
+        Peak memory allocated during the call, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Benchmark a function and report throughput and peak memory."""
+
+    def run(function, *args, nb_records: int = LENGTH):
+        result = benchmark(function, *args)
+        if benchmark.stats is None:  # run once with --benchmark-disable
+            return result
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["records_per_second"] = nb_records / mean
+        benchmark.extra_info["peak_memory"] = peak_memory(function, *args)
+        return result
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def json_log(tmp_path_factory) -> str:
+    """Path to a synthetic line-delimited JSON log."""
+    path = str(tmp_path_factory.mktemp("logs") / "log.jsonl")
+    write_log(path, LENGTH, WIDTH, DEPTH)
+    return path
+
+
+@pytest.fixture(scope="session")
+def mpack_log(tmp_path_factory) -> str:
+    """Path to a synthetic MessagePack log."""
+    path = str(tmp_path_factory.mktemp("logs") / "log.mpack")
+    write_log(path, LENGTH, WIDTH, DEPTH)
+    return path
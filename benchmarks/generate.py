@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Generate synthetic logs of configurable width, depth and length."""
+
+import argparse
+import json
+import math
+from typing import Any, Dict, Generator
+
+import msgpack
+
+
+def generate_record(index: int, width: int, depth: int) -> Dict[str, Any]:
+    """Generate a synthetic input dictionary.
+
+    Args:
+        index: Index of the dictionary in the log.
+        width: Number of series (leaves) in the dictionary, besides time.
+        depth: Nesting depth of the series in the dictionary.
+
+    Returns:
+        Dictionary with a "time" key and ``width`` leaves mixing floats,
+        integers, booleans and strings.
+    """
+    time = 1e-3 * index
+    record: Dict[str, Any] = {"time": time}
+    for leaf in range(width):
+        node = record
+        for level in range(depth - 1):
+            node = node.setdefault(f"node{level}_{leaf % (level + 2)}", {})
+        kind = leaf % 10
+        if kind == 0:
+            value: Any = index
+        elif kind == 1:
+            value = (index // 100) % 2 == 0
+        elif kind == 2:
+            value = ("idle", "run", "stop")[(index // 1000) % 3]
+        else:  # floating-point value
+            value = math.sin(time * (leaf + 1))
+        node[f"leaf{leaf}"] = value
+    return record
+
+
+def generate_records(
+    length: int, width: int, depth: int
+) -> Generator[Dict[str, Any], None, None]:
+    """Generate a series of synthetic input dictionaries.
+
+    Args:
+        length: Number of dictionaries.
+        width: Number of series in each dictionary, besides time.
+        depth: Nesting depth of the series in each dictionary.
+
+    Yields:
+        Synthetic dictionaries.
+    """
+    for index in range(length):
+        yield generate_record(index, width, depth)
+
+
+def write_log(path: str, length: int, width: int, depth: int) -> None:
+    """Write a synthetic log file.
+
+    Args:
+        path: Output path, ending with ".json", ".jsonl" or ".mpack".
+        length: Number of dictionaries.
+        width: Number of series in each dictionary, besides time.
+        depth: Nesting depth of the series in each dictionary.
+    """
+    records = generate_records(length, width, depth)
+    if path.endswith(".mpack"):
+        with open(path, "wb") as file:
+            for record in records:
+                file.write(msgpack.packb(record))
+    else:  # line-delimited JSON
+        with open(path, "w", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="output file (.json, .jsonl or .mpack)")
+    parser.add_argument("--length", type=int, default=10_000)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+    write_log(args.path, args.length, args.width, args.depth)
@@ -9,10 +9,30 @@
 
 __version__ = "2.1.0"
 
+from typing import TYPE_CHECKING
+
 from .decode import decode
-from .fox import Fox
+
+if TYPE_CHECKING:
+    from .fox import Fox
 
 __all__ = [
     "Fox",
     "decode",
 ]
+
+
+def __getattr__(name: str):
+    """Import :class:`Fox` on first access, along with NumPy.
+
+    This keeps ``import foxplot`` fast, for instance to run ``foxplot
+    --help``.
+
+    Args:
+        name: Name of the attribute to get.
+    """
+    if name == "Fox":
+        from .fox import Fox
+
+        return Fox
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Memoization of series transforms with least-recently-used eviction."""
+
+import functools
+import inspect
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+import numpy as np
+
+# Default memory budget of the cache of transform results, in bytes.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+Method = TypeVar("Method", bound=Callable[..., Any])
+
+# Cached result, weak references to its sources, size of its values in
+# bytes and versions of its series when it was stored.
+Entry = Tuple[Any, Tuple[weakref.ref, ...], int, Tuple[int, ...]]
+
+
+def _series(result: Any) -> List[Any]:
+    return result._leaves() if hasattr(result, "_leaves") else [result]
+
+
+def _nbytes(result: Any) -> int:
+    if isinstance(result, np.ndarray):
+        return int(result.nbytes)
+    return sum(int(leaf._nbytes) for leaf in _series(result))
+
+
+def _versions(result: Any) -> Tuple[int, ...]:
+    return tuple(getattr(leaf, "_version", 0) for leaf in _series(result))
+
+
+def _freeze(result: Any) -> None:
+    """Make the values of a result read-only, as it is shared by callers.
+
+    Args:
+        result: Array, series or node of series.
+    """
+    if isinstance(result, np.ndarray):
+        result.flags.writeable = False
+        return
+    for leaf in _series(result):
+        for stored in vars(leaf).values():  # without decoding values
+            if isinstance(stored, np.ndarray):
+                stored.flags.writeable = False
+
+
+class TransformCache:
+    """Results of series transforms, evicted least recently used first.
+
+    Entries are keyed on the identity and version of the source series (the
+    version changes when values are written to), the identity of its time
+    values (which change when the time index is set), the name of the
+    transform and its parameters. Entries keep weak references to their
+    sources, so that they do not keep series alive, and are dropped once a
+    source is garbage-collected, as its identity may then be reused.
+
+    Cached results are shared by all callers, so their values are read-only,
+    and a result whose values are replaced is recomputed on the next call.
+    Values written through other references to the array of a series, such
+    as ``np.asarray(series)``, are not tracked.
+
+    Attributes:
+        hits: Number of calls whose result was found in the cache.
+        max_bytes: Memory budget for the values of cached results, in bytes.
+        misses: Number of calls whose result was computed.
+    """
+
+    __dead: List[Hashable]
+    __entries: "OrderedDict[Hashable, Entry]"
+    __lock: threading.Lock
+    __nbytes: int
+    hits: int
+    max_bytes: int
+    misses: int
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory budget for the values of cached results, in
+                bytes. Set to zero to disable caching.
+        """
+        self.__dead = []
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__nbytes = 0
+        self.hits = 0
+        self.max_bytes = max_bytes
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        with self.__lock:
+            self.__purge()
+            return len(self.__entries)
+
+    def __purge(self) -> None:
+        """Drop entries whose sources were garbage-collected.
+
+        Weak reference callbacks may run in any thread, including one that
+        holds the lock, so they only record the keys that this function
+        then drops with the lock held.
+        """
+        while self.__dead:
+            key = self.__dead.pop()
+            entry = self.__entries.get(key)
+            if entry is not None and any(ref() is None for ref in entry[1]):
+                del self.__entries[key]
+                self.__nbytes -= entry[2]
+
+    def __expire(self, key: Hashable) -> Callable[[weakref.ref], None]:
+        """Get the weak reference callback of the sources of an entry.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            Callback recording the entry for removal.
+        """
+        dead = self.__dead
+        return lambda ref: dead.append(key)
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics."""
+        with self.__lock:
+            self.__dead.clear()
+            self.__entries.clear()
+            self.__nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with the numbers of hits, misses and entries, the
+            memory used by cached values and the memory budget, in bytes.
+        """
+        with self.__lock:
+            self.__purge()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.__entries),
+                "nbytes": self.__nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached result and mark it as recently used.
+
+        Args:
+            key: Key of the result.
+
+        Returns:
+            Cached result, or ``None`` if the key is not in the cache.
+        """
+        with self.__lock:
+            self.__purge()
+            entry = self.__entries.get(key)
+            if entry is not None and _versions(entry[0]) != entry[3]:
+                del self.__entries[key]  # values of the result were replaced
+                self.__nbytes -= entry[2]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, result: Any, sources: Tuple[Any, ...]):
+        """Store a result, evicting least recently used ones over budget.
+
+        Args:
+            key: Key of the result.
+            result: Result to store.
+            sources: Objects whose identities are part of the key. The
+                result is not stored if they do not support weak references.
+        """
+        expire = self.__expire(key)
+        try:
+            refs = tuple(weakref.ref(source, expire) for source in sources)
+        except TypeError:  # source without weak references, e.g. a list
+            return
+        nbytes = _nbytes(result)
+        with self.__lock:
+            self.__purge()
+            if nbytes > self.max_bytes:
+                return
+            old = self.__entries.pop(key, None)
+            if old is not None:
+                self.__nbytes -= old[2]
+            _freeze(result)
+            self.__entries[key] = (result, refs, nbytes, _versions(result))
+            self.__nbytes += nbytes
+            while self.__nbytes > self.max_bytes:
+                _, (_, _, evicted, _) = self.__entries.popitem(last=False)
+                self.__nbytes -= evicted
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the memory budget, evicting results over it.
+
+        Args:
+            max_bytes: New memory budget, in bytes.
+        """
+        with self.__lock:
+            self.__purge()
+            self.max_bytes = max_bytes
+            while self.__nbytes > self.max_bytes:
+                _, (_, _, evicted, _) = self.__entries.popitem(last=False)
+                self.__nbytes -= evicted
+
+
+# Cache shared by the transforms of all series.
+transform_cache = TransformCache()
+
+
+def _identify(arg: Any) -> Tuple[Hashable, Tuple[Any, ...]]:
+    """Get the key and sources of an argument.
+
+    Args:
+        arg: Argument of a transform.
+
+    Returns:
+        Pair of the key of the argument and the objects it refers to.
+    """
+    time_index = getattr(arg, "_time_index", None)
+    if time_index is None:  # not a series
+        return arg, ()
+    times = time_index.values
+    key = ("series", id(arg), arg._version, id(times))
+    return key, (arg,) if times is None else (arg, times)
+
+
+def memoize(method: Method) -> Method:
+    """Cache the results of a series transform in :data:`transform_cache`.
+
+    Args:
+        method: Series method whose arguments, other than series, are
+            hashable.
+
+    Returns:
+        Method returning cached results for the same series, time values
+        and arguments.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        if transform_cache.max_bytes <= 0:
+            return method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        keys: List[Hashable] = [method.__qualname__]
+        sources: List[Any] = []
+        for name, arg in bound.arguments.items():
+            arg_key, refs = _identify(arg)
+            keys.append((name, arg_key))
+            sources.extend(refs)
+        key = tuple(keys)
+        try:
+            hash(key)
+        except TypeError:  # unhashable argument
+            return method(self, *args, **kwargs)
+        result = transform_cache.get(key)
+        if result is None:
+            result = method(self, *args, **kwargs)
+            transform_cache.put(key, result, tuple(sources))
+        return result
+
+    return wrapper  # type: ignore[return-value]
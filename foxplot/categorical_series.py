@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Series of repeated values stored as integer codes into categories."""
+
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .cache import memoize
+from .exceptions import FoxplotError
+from .labeled_series import LabeledSeries
+from .resample import Aggregation, resample_values
+from .series import Series
+from .time_index import TimeIndex
+
+
+class CategoricalSeries(Series):
+    """Dictionary-encoded time series.
+
+    Each value of the series is stored as an integer code indexing into an
+    array of categories. This is a compact representation for series that
+    repeat a few values many times, such as status names or modes.
+    """
+
+    _categories: NDArray
+    _codes: NDArray
+
+    def __init__(
+        self,
+        label: str,
+        codes: NDArray,
+        categories: NDArray,
+        times: Union[None, NDArray[np.float64], TimeIndex],
+    ):
+        """Initialize a new categorical series.
+
+        Args:
+            label: Label of the series in the input data.
+            codes: Integer codes, one per time index, indexing categories.
+            categories: Distinct values of the series.
+            times: Corresponding time index, shared with other series, or
+                time values as a NumPy array.
+        """
+        LabeledSeries.__init__(self, label)
+        self._categories = categories
+        self._codes = codes
+        self._time_index = TimeIndex.wrap(times)
+
+    def __len__(self) -> int:
+        """Length of the indexed series."""
+        return self._codes.shape[0]
+
+    @property
+    def _dtype(self) -> np.dtype:
+        """Data type of the decoded values of the series."""
+        return self._categories.dtype
+
+    @property
+    def _nbytes(self) -> int:
+        """Memory used by the codes and categories of the series, in bytes."""
+        return self._codes.nbytes + self._categories.nbytes
+
+    @property  # type: ignore[misc]
+    def _values(self) -> NDArray:
+        """Decoded values of the series."""
+        return self._categories[self._codes]
+
+    @memoize
+    def resample(self, period: float, how: Aggregation = "last") -> Series:
+        """Resample the series at a uniform rate.
+
+        Args:
+            period: Time between two consecutive output values.
+            how: Aggregation of the values received during each period. Only
+                the "last" value received applies to categories.
+
+        Returns:
+            Resampled categorical series.
+        """
+        if how != "last":
+            raise FoxplotError(f"Cannot aggregate categories with '{how}'")
+        times = self._times
+        if times is None:
+            raise FoxplotError(f"Unset time values for series '{self._label}'")
+        time_index = self._time_index.uniform(period)
+        assert time_index.values is not None
+        return CategoricalSeries(
+            label=f"resample({self._label}, {period=}, {how=})",
+            codes=resample_values(times, self._codes, time_index.values, how),
+            categories=self._categories,
+            times=time_index,
+        )
@@ -8,13 +8,16 @@
 """Command-line entry point for foxplot."""
 
 import argparse
+import json
+import sys
 from datetime import datetime
-from typing import List, Union
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
-from .fox import Fox
-from .functions import estimate_lag as estimate_lag_func
-from .node import Node
-from .series import Series
+from .exceptions import FoxplotError
+
+if TYPE_CHECKING:  # other modules are imported once arguments are parsed
+    from .fox import Fox
+    from .timestamps import EpochUnit
 
 
 def parse_command_line_arguments() -> argparse.Namespace:
@@ -23,14 +26,41 @@ def parse_command_line_arguments() -> argparse.Namespace:
     Returns:
         Parsed command-line arguments.
     """
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("file", nargs="?", default=None)
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        epilog="Run `foxplot convert --help` to convert files to columnar "
+        "formats.",
+    )
+    parser.add_argument(
+        "file",
+        nargs="*",
+        help="files or glob patterns to read from, concatenated in time "
+        "order (default: standard input)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="SPEC",
+        help="render the plots of a JSON spec file to HTML files, "
+        "see `Fox.plot_many` for its format",
+    )
     parser.add_argument(
         "-l",
         "--left",
         nargs="*",
         help="series to plot using the (default) left axis",
     )
+    parser.add_argument(
+        "--float32",
+        action="store_true",
+        default=False,
+        help="store values in single precision to halve memory usage",
+    )
+    parser.add_argument(
+        "--describe",
+        action="store_true",
+        default=False,
+        help="print summary statistics of all series",
+    )
     parser.add_argument(
         "-i",
         "--interactive",
@@ -38,16 +68,59 @@ def parse_command_line_arguments() -> argparse.Namespace:
         default=False,
         help="interact with the data from a Python interpreter",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes rendering batch plots",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=".",
+        help="directory to write batch plots to",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="print a summary of time and memory spent loading data",
+    )
+    parser.add_argument(
+        "--relative-time",
+        action="store_true",
+        default=False,
+        help="start the time of each run from zero",
+    )
     parser.add_argument(
         "-r",
         "--right",
         nargs="*",
         help="series to plot using the right axis",
     )
+    parser.add_argument(
+        "--run",
+        action="append",
+        metavar="NAME=FILE",
+        help="load a file (or glob pattern) under a run name, "
+        "repeat to compare several runs",
+    )
+    parser.add_argument(
+        "--shared-data",
+        action="store_true",
+        default=False,
+        help="write data once for all batch plots rather than in each page",
+    )
     parser.add_argument(
         "-t",
         "--time",
-        help="key to use as time index for the series",
+        help="label of the series to use as time index, e.g. header/stamp",
+    )
+    parser.add_argument(
+        "--time-unit",
+        choices=["s", "ms", "us", "ns"],
+        help="unit of numeric time values (default: guessed from epoch times)",
     )
     parser.add_argument(
         "--title",
@@ -58,31 +131,179 @@ def parse_command_line_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def parse_convert_arguments(argv: List[str]) -> argparse.Namespace:
+    """Parse command-line arguments of the convert subcommand.
+
+    Args:
+        argv: Arguments following ``foxplot convert``.
+
+    Returns:
+        Parsed command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="foxplot convert",
+        description="Convert dictionary series to a columnar file: NPZ, "
+        "Parquet or Arrow IPC depending on the output extension.",
+    )
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="files or glob patterns to read dictionary series from",
+    )
+    parser.add_argument(
+        "output", help="output .npz, .parquet, .arrow or .feather file"
+    )
+    parser.add_argument(
+        "--float32",
+        action="store_true",
+        default=False,
+        help="store values in single precision to halve file size",
+    )
+    parser.add_argument(
+        "-l",
+        "--labels",
+        nargs="*",
+        help="labels of series or nodes to convert (default: all)",
+    )
+    return parser.parse_args(argv)
+
+
+def convert(argv: List[str]) -> None:
+    """Convert dictionary series to a columnar file.
+
+    Args:
+        argv: Arguments following ``foxplot convert``.
+    """
+    args = parse_convert_arguments(argv)
+    from .fox import Fox
+
+    fox = Fox(
+        args.input,
+        dtype="float32" if args.float32 else None,
+        progress=sys.stderr.isatty(),
+    )
+    fox.export(args.output, labels=args.labels)
+
+
 def get_function_description(f):
     """Get the short description of a function as a string."""
     return f.__doc__.split("\n")[0]
 
 
+def parse_runs(runs: List[str]) -> dict:
+    """Parse runs given on the command line.
+
+    Args:
+        runs: Runs of the form ``NAME=FILE``.
+
+    Returns:
+        Dictionary of file names (or glob patterns) by run name.
+    """
+    files = {}
+    for run in runs:
+        name, sep, filename = run.partition("=")
+        if not sep or not name or not filename:
+            raise FoxplotError(f"Run '{run}' is not of the form NAME=FILE")
+        files[name] = filename
+    return files
+
+
+def configure_time(
+    fox: "Fox",
+    key: Optional[str],
+    unit: Optional["EpochUnit"] = None,
+    runs: Sequence[str] = (),
+) -> None:
+    """Set the time index of loaded data.
+
+    Args:
+        fox: Loaded data.
+        key: Label of the series to use as time index, or ``None`` to detect
+            it.
+        unit: Unit of numeric time values, guessed if ``None``.
+        runs: Names of the runs being compared, if any. The label of the time
+            index is then relative to each run.
+    """
+    if not key:
+        fox.detect_time(unit)
+        return
+    keys = key.strip("/").split("/")
+    for prefix in [[name] for name in runs] or [[]]:
+        fox.set_time(fox.data._get_child(prefix + keys), unit)
+
+
 def main() -> None:
     """Entry point for command-line execution."""
+    if sys.argv[1:2] == ["convert"]:
+        convert(sys.argv[2:])
+        return
     args = parse_command_line_arguments()
 
-    fox = Fox(args.file or "stdin")
-    if args.time:
-        fox.set_time(getattr(fox.data, args.time))
-    else:  # not args.time:
-        fox.detect_time()
+    # Import NumPy and data structures after parsing (fast --help)
+    from .fox import Fox
+    from .functions import estimate_lag as estimate_lag_func
+    from .functions import estimate_lags as estimate_lags_func
+
+    nothing_to_plot = not (
+        args.left or args.right or args.batch or args.describe
+    )
+    interactive = args.interactive or nothing_to_plot
+
+    source = parse_runs(args.run) if args.run else args.file or "stdin"
+
+    # Start the interactive shell right away while files load in the
+    # background (the standard input is kept for the shell)
+    background = interactive and (bool(args.file) or bool(args.run))
+    fox = Fox(
+        source,
+        dtype="float32" if args.float32 else None,
+        profile=args.profile,
+        on_stats=(
+            (lambda stats: print(stats.summary(), file=sys.stderr))
+            if args.profile
+            else None
+        ),
+        progress=sys.stderr.isatty() and not background,
+        background=background,
+        on_loaded=lambda fox: configure_time(
+            fox,
+            args.time,
+            args.time_unit,
+            list(source) if args.run else [],
+        ),
+        relative_time=args.relative_time,
+        time_key=args.time,
+    )
+
+    if args.describe:
+        fox.wait()  # describe all data, even when loading in the background
+        print(fox.describe())
+        if not (interactive or args.batch or args.left or args.right):
+            return
+
+    if args.batch:
+        with open(args.batch, "r", encoding="utf-8") as file:
+            plots = json.load(file)
+        paths = fox.plot_many(
+            plots,
+            args.output_dir,
+            workers=args.jobs,
+            shared_data=args.shared_data,
+        )
+        print("\n".join(paths))
+        if not (interactive or args.left or args.right):
+            return
 
-    nothing_to_plot = not args.left and not args.right
     user_ns = {
         "data": fox.data,
         "fox": fox,
     }
     functions = {
         "estimate_lag": estimate_lag_func,
+        "estimate_lags": estimate_lags_func,
     }
     user_ns.update(functions)
-    if args.interactive or nothing_to_plot:
+    if interactive:
         usage = (
             "Welcome to foxplot!\n"
             "\n"
@@ -101,26 +322,27 @@ def main() -> None:
                 f"- `{key}`: {get_function_description(func)}"
                 for key, func in functions.items()
             )
+            + (
+                "\n\nData is loading in the background: series are "
+                "available once loaded,\nand `fox.wait()` waits for the "
+                "whole file.\n"
+                if background
+                else ""
+            )
         )
         __import__("IPython").embed(
             header=usage,
             user_ns={
                 "data": fox.data,
                 "estimate_lag": estimate_lag_func,
+                "estimate_lags": estimate_lags_func,
                 "fox": fox,
             },
         )
     else:  # not args.interactive
-        left_labels = args.left if args.left else []
-        right_labels = args.right if args.right else []
-        left_series: List[Union[Series, Node]] = [
-            fox.get_series(label) for label in left_labels
-        ]
-        right_series: List[Union[Series, Node]] = [
-            fox.get_series(label) for label in right_labels
-        ]
+        # Labels are resolved by plot, in each run when comparing runs
         fox.plot(
-            left_series,
-            right_series,
+            args.left if args.left else [],
+            args.right if args.right else [],
             args.title,
         )
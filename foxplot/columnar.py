@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Read and write series as columns of NPZ, Parquet or Arrow IPC files.
+
+Columns are named after the labels of their series, for instance
+``/observation/cpu_temperature``. Categorical series are stored as
+dictionary-encoded columns: in NPZ files, their codes are stored under their
+label, with -1 for missing values, and their categories under the label
+prefixed by :data:`CATEGORIES_PREFIX`.
+"""
+
+import logging
+import struct
+import zipfile
+from pathlib import PosixPath
+from typing import Dict, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .categorical_series import CategoricalSeries
+from .exceptions import FoxplotError
+from .series import Series
+from .time_index import TimeIndex
+
+CATEGORIES_PREFIX = "categories:"
+
+ARROW_SUFFIXES = (".arrow", ".feather")
+SUFFIXES = (".npz", ".parquet") + ARROW_SUFFIXES
+
+
+def is_columnar(file_path: Union[str, PosixPath]) -> bool:
+    """Check whether a file has a columnar format we read.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        True if the file is an NPZ, Parquet or Arrow IPC file.
+    """
+    return str(file_path).endswith(SUFFIXES)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exn:
+        raise FoxplotError(
+            "Parquet and Arrow IPC files require pyarrow, "
+            "install it with `pip install pyarrow`"
+        ) from exn
+    return pyarrow
+
+
+def _split_categories(series: CategoricalSeries):
+    """Get codes and categories with missing values coded as -1.
+
+    Args:
+        series: Categorical series.
+
+    Returns:
+        Pair of codes and categories, the latter as an array of strings.
+    """
+    codes, categories = series._codes, series._categories
+    if len(categories) > 0 and categories[0] is None:
+        codes = codes.astype(np.result_type(codes.dtype, np.int8)) - 1
+        categories = categories[1:]
+    return codes, categories.astype(str)
+
+
+def _merge_categories(
+    label: str, codes: NDArray, categories: NDArray, times: TimeIndex
+) -> CategoricalSeries:
+    """Build a categorical series from codes with -1 for missing values.
+
+    Args:
+        label: Label of the series.
+        codes: Category codes, -1 for missing values.
+        categories: Array of category strings.
+        times: Time index of the series.
+
+    Returns:
+        Categorical series.
+    """
+    categories = np.asarray(categories, dtype=object)
+    if np.any(codes < 0):
+        codes = codes + 1
+        categories = np.concatenate((np.array([None]), categories))
+    return CategoricalSeries(label, codes, categories, times)
+
+
+def _exportable(label: str, series: Series) -> bool:
+    if isinstance(series, CategoricalSeries):
+        return True
+    if series._values.dtype.kind not in "biuf":
+        logging.warning("Skipping '%s' as its values are not numbers", label)
+        return False
+    return True
+
+
+def write_columns(
+    file_path: Union[str, PosixPath], series_dict: Dict[str, Series]
+) -> None:
+    """Write series as the columns of a file.
+
+    The format is chosen from the file extension: ``.npz`` for NumPy,
+    ``.parquet`` for Parquet, ``.arrow`` or ``.feather`` for Arrow IPC.
+    Series of mixed-type values are skipped.
+
+    Args:
+        file_path: Path to the output file.
+        series_dict: Series to write, by column name.
+    """
+    file_path = str(file_path)
+    series_dict = {
+        label: series
+        for label, series in series_dict.items()
+        if _exportable(label, series)
+    }
+    if file_path.endswith(".npz"):
+        arrays: Dict[str, NDArray] = {}
+        for label, series in series_dict.items():
+            if isinstance(series, CategoricalSeries):
+                codes, categories = _split_categories(series)
+                arrays[label] = codes
+                arrays[CATEGORIES_PREFIX + label] = categories
+            else:  # numeric series
+                arrays[label] = series._values
+        with open(file_path, "wb") as file:
+            np.savez(file, **arrays)  # type: ignore[arg-type]
+        return
+    if not file_path.endswith(SUFFIXES):
+        raise FoxplotError(f"Unknown columnar format for '{file_path}'")
+    pa = _import_pyarrow()
+    columns = {}
+    for label, series in series_dict.items():
+        if isinstance(series, CategoricalSeries):
+            codes, categories = _split_categories(series)
+            columns[label] = pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(categories)
+            )
+        else:  # numeric series
+            columns[label] = pa.array(series._values)
+    table = pa.table(columns)
+    if file_path.endswith(".parquet"):
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, file_path)
+    else:  # Arrow IPC
+        import pyarrow.feather
+
+        # Uncompressed so that columns can be memory-mapped when reading
+        pyarrow.feather.write_feather(
+            table, file_path, compression="uncompressed"
+        )
+
+
+def _memmap_npz(file_path: str) -> Dict[str, NDArray]:
+    """Memory-map the arrays of an uncompressed NPZ file.
+
+    Files written by :func:`write_columns` are uncompressed. Compressed
+    members, if any, are read to memory.
+
+    Args:
+        file_path: Path to the NPZ file.
+
+    Returns:
+        Arrays of the file by name.
+    """
+    arrays: Dict[str, NDArray] = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as fp:
+        for info in archive.infolist():
+            name = info.filename.removesuffix(".npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+            # Skip the local file header to the beginning of member data
+            fp.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", fp.read(4))
+            fp.seek(name_length + extra_length, 1)
+            version = np.lib.format.read_magic(fp)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(fp)
+            else:  # version 2.0 or later
+                header = np.lib.format.read_array_header_2_0(fp)
+            shape, fortran_order, dtype = header
+            if np.prod(shape) == 0:  # cannot memory-map an empty array
+                arrays[name] = np.empty(shape, dtype=dtype)
+                continue
+            arrays[name] = np.memmap(
+                file_path,
+                dtype=dtype,
+                mode="r",
+                offset=fp.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            ).view(np.ndarray)
+    return arrays
+
+
+def _read_npz(file_path: str, times: TimeIndex) -> Dict[str, Series]:
+    arrays = _memmap_npz(file_path)
+    series_dict: Dict[str, Series] = {}
+    for label, array in arrays.items():
+        if label.startswith(CATEGORIES_PREFIX):
+            continue
+        categories = arrays.get(CATEGORIES_PREFIX + label)
+        if categories is not None:
+            series_dict[label] = _merge_categories(
+                label, np.asarray(array), categories, times
+            )
+        else:  # numeric series
+            series_dict[label] = Series(label, array, times)
+    return series_dict
+
+
+def _read_arrow(file_path: str, times: TimeIndex) -> Dict[str, Series]:
+    pa = _import_pyarrow()
+    if file_path.endswith(".parquet"):
+        import pyarrow.parquet
+
+        table = pyarrow.parquet.read_table(file_path, memory_map=True)
+    else:  # Arrow IPC
+        import pyarrow.feather
+
+        table = pyarrow.feather.read_table(file_path, memory_map=True)
+    series_dict: Dict[str, Series] = {}
+    for label, column in zip(table.column_names, table.columns):
+        column = column.combine_chunks()
+        if pa.types.is_dictionary(column.type):
+            codes = column.indices.fill_null(-1).to_numpy()
+            categories = column.dictionary.to_numpy(zero_copy_only=False)
+            series_dict[label] = _merge_categories(
+                label, codes, categories, times
+            )
+        else:  # numbers, without copy unless there are missing values
+            values = column.to_numpy(zero_copy_only=False)
+            series_dict[label] = Series(label, values, times)
+    return series_dict
+
+
+def read_columns(
+    file_path: Union[str, PosixPath], times: TimeIndex
+) -> Dict[str, Series]:
+    """Read series from the columns of a file.
+
+    Columns of NPZ and Arrow IPC files are memory-mapped rather than copied
+    when possible: they are only read from disk when accessed.
+
+    Args:
+        file_path: Path to the input file.
+        times: Time index shared by all output series.
+
+    Returns:
+        Series by column name.
+    """
+    file_path = str(file_path)
+    if file_path.endswith(".npz"):
+        return _read_npz(file_path, times)
+    if not file_path.endswith(SUFFIXES):
+        raise FoxplotError(f"Unknown columnar format for '{file_path}'")
+    return _read_arrow(file_path, times)
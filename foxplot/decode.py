@@ -6,54 +6,113 @@
 
 """Decode a series of dictionaries from file."""
 
+import codecs
+import io
 import json
+import os
 import sys
 from pathlib import PosixPath
-from typing import Generator, Union
-
-import mpacklog
+from time import perf_counter
+from typing import Generator, Optional, Union
 
 from .exceptions import FoxplotError
+from .ingest_stats import IngestStats
 
 
-def decode(file_path: Union[str, PosixPath]) -> Generator[dict, None, None]:
+def decode(
+    file_path: Union[str, PosixPath],
+    stats: Optional[IngestStats] = None,
+) -> Generator[dict, None, None]:
     """Unpack a series of dictionaries from a given file.
 
     Args:
         file_path: Path to the file to read from (can be "stdin").
+        stats: If set, record the number of bytes read and the time spent
+            reading them to these measurements.
 
     Yields:
         Unpacked dictionaries.
     """
     file_path = str(file_path)
     if file_path == "stdin":
-        yield from decode_json(file=sys.stdin)
+        stdin = sys.stdin
+        if isinstance(stdin, io.TextIOWrapper):  # read bytes, not characters
+            stdin = stdin.buffer  # type: ignore[assignment]
+        yield from decode_json(file=stdin, stats=stats)
     elif file_path.endswith(".json") or file_path.endswith(".jsonl"):
-        with open(file_path, "r", encoding="utf-8") as file:
-            yield from decode_json(file=file)
+        with open(file_path, "rb") as file:
+            yield from decode_json(file=file, stats=stats)
     elif file_path.endswith(".mpack"):
-        yield from mpacklog.read_log(file_path)
+        yield from decode_mpack(file_path, stats)
     else:  # unknown file extension
         raise FoxplotError(f"Unknown file type in '{file_path}'")
 
 
-def decode_json(file, chunk_size=100_000) -> Generator[dict, None, None]:
+def decode_mpack(
+    file_path: str, stats: Optional[IngestStats] = None
+) -> Generator[dict, None, None]:
+    """Decode dictionaries from a MessagePack file.
+
+    Args:
+        file_path: Path to the file to read from.
+        stats: If set, record the number of bytes read, as the file is read,
+            to these measurements.
+
+    Yields:
+        dict: Dictionary read from file.
+    """
+    import mpacklog  # only needed for MessagePack input
+
+    # mpacklog opens the file itself: hand it a descriptor, closed when it
+    # is done reading, whose offset is the number of bytes read so far
+    fd = os.open(file_path, os.O_RDONLY)
+    counted = 0
+    for unpacked in mpacklog.read_log(fd):  # type: ignore[arg-type]
+        if stats is not None:
+            offset = os.lseek(fd, 0, os.SEEK_CUR)
+            stats.bytes_read += offset - counted
+            counted = offset
+        yield unpacked
+
+
+def _read(file, chunk_size: int, stats: Optional[IngestStats]):
+    if stats is None:
+        return file.read(chunk_size)
+    start = perf_counter()
+    data = file.read(chunk_size)
+    stats.durations["read"] += perf_counter() - start
+    stats.bytes_read += len(data)
+    return data
+
+
+def decode_json(
+    file,
+    chunk_size: int = 100_000,
+    stats: Optional[IngestStats] = None,
+) -> Generator[dict, None, None]:
     """Decode dictionaries from a line-delimited JSON file.
 
     Args:
-        file: File stream (for instance ``sys.stdin``).
-        chunk_size: Number of bytes read at a time from the standard input.
+        file: Binary stream of UTF-8 text, or text stream (for instance
+            ``sys.stdin``).
+        chunk_size: Number of bytes, or characters for text streams, read at
+            a time from the file.
+        stats: If set, record the number of bytes (characters for text
+            streams) read and the time spent reading them to these
+            measurements.
 
     Yields:
         dict: Dictionary read from file.
     """
     decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
     buffer = ""
     while True:
-        data = file.read(chunk_size)
+        data = _read(file, chunk_size, stats)
         if not data:  # end of file
+            utf8.decode(b"", final=True)  # raise on a truncated character
             break
-        buffer += data
+        buffer += utf8.decode(data) if isinstance(data, bytes) else data
         while buffer:
             try:
                 result, index = decoder.raw_decode(buffer)
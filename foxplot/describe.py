@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Summary statistics of series, computed in one pass over their values."""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .hot_series import HotSeries
+from .node import HotArray, Node
+from .series import Series
+
+# Label of a series and function getting its values.
+Column = Tuple[str, Callable[[], NDArray]]
+
+# Statistics of each series, in the order of columns of a description.
+STATISTICS = (
+    "count",
+    "nan_count",
+    "min",
+    "max",
+    "mean",
+    "std",
+    "first",
+    "last",
+    "changes",
+)
+
+# Number of values processed at once, small enough to stay in cache while
+# all statistics are updated.
+CHUNK_SIZE = 1 << 16
+
+
+class _Accumulator:
+    """Running statistics of numbers, updated one chunk at a time.
+
+    Means and variances of chunks are combined with the parallel algorithm of
+    Chan et al., which is numerically stable.
+    """
+
+    changes: int
+    count: int
+    first: Optional[float]
+    last: Optional[float]
+    m2: float
+    max: float
+    mean: float
+    min: float
+    nan_count: int
+    nb_numbers: int
+
+    def __init__(self):
+        """Initialize statistics of an empty series."""
+        self.changes = 0
+        self.count = 0
+        self.first = None
+        self.last = None
+        self.m2 = 0.0
+        self.max = np.nan
+        self.mean = np.nan
+        self.min = np.nan
+        self.nan_count = 0
+        self.nb_numbers = 0
+
+    def update(self, chunk: NDArray[np.float64]) -> None:
+        """Update statistics with the next values of the series.
+
+        Args:
+            chunk: Next values, with NaN for missing ones.
+        """
+        if chunk.size < 1:
+            return
+        is_nan = np.isnan(chunk)
+        numbers = chunk[~is_nan]
+        different = chunk[1:] != chunk[:-1]
+        different &= ~(is_nan[1:] & is_nan[:-1])  # NaN to NaN is no change
+        self.changes += int(np.count_nonzero(different))
+        if self.last is not None and not (
+            chunk[0] == self.last
+            or (np.isnan(chunk[0]) and np.isnan(self.last))
+        ):
+            self.changes += 1
+        if self.first is None:
+            self.first = float(chunk[0])
+        self.last = float(chunk[-1])
+        self.count += chunk.size
+        self.nan_count += chunk.size - numbers.size
+        if numbers.size < 1:
+            return
+        mean = float(numbers.mean())
+        m2 = float(np.square(numbers - mean).sum())
+        if self.nb_numbers < 1:
+            self.min = float(numbers.min())
+            self.max = float(numbers.max())
+            self.mean, self.m2 = mean, m2
+        else:  # combine with previous chunks
+            self.min = min(self.min, float(numbers.min()))
+            self.max = max(self.max, float(numbers.max()))
+            total = self.nb_numbers + numbers.size
+            delta = mean - self.mean
+            self.mean += delta * numbers.size / total
+            self.m2 += m2 + delta**2 * self.nb_numbers * numbers.size / total
+        self.nb_numbers += numbers.size
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get statistics as a dictionary.
+
+        Returns:
+            Dictionary of statistics, see :data:`STATISTICS`.
+        """
+        std = (
+            float(np.sqrt(self.m2 / self.nb_numbers))
+            if self.nb_numbers > 0
+            else np.nan
+        )
+        return {
+            "count": self.count,
+            "nan_count": self.nan_count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "std": std,
+            "first": self.first,
+            "last": self.last,
+            "changes": self.changes,
+        }
+
+
+def describe_values(
+    values: NDArray, chunk_size: int = CHUNK_SIZE
+) -> Dict[str, Any]:
+    """Compute summary statistics of the values of a series.
+
+    Args:
+        values: Values of the series.
+        chunk_size: Number of values processed at once.
+
+    Returns:
+        Dictionary of statistics, see :data:`STATISTICS`. Minimum, maximum,
+        mean and standard deviation are NaN for values that are not numbers,
+        and missing values are counted as NaN.
+    """
+    if values.dtype.kind in "biuf":
+        accumulator = _Accumulator()
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+            accumulator.update(chunk.astype(np.float64, copy=False))
+        return accumulator.as_dict()
+    changes = np.count_nonzero(values[1:] != values[:-1])
+    return {
+        "count": len(values),
+        "nan_count": sum(value is None for value in values),
+        "min": np.nan,
+        "max": np.nan,
+        "mean": np.nan,
+        "std": np.nan,
+        "first": values[0] if len(values) > 0 else None,
+        "last": values[-1] if len(values) > 0 else None,
+        "changes": int(changes),
+    }
+
+
+def _received_array(hot: HotSeries) -> NDArray:
+    """Get the values received so far by a hot series as an array.
+
+    Args:
+        hot: Series still receiving values.
+
+    Returns:
+        Floating-point array for numbers, object array otherwise.
+    """
+    values = hot._received_values()
+    if {type(value) for value in values} <= {bool, int, float, type(None)}:
+        return np.array(
+            [np.nan if value is None else value for value in values],
+            dtype=np.float64,
+        )
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def collect_columns(item: Any) -> List[Column]:
+    """Collect the series to describe from a series or a tree.
+
+    Args:
+        item: Series, node, or hot series obtained while loading.
+
+    Returns:
+        Label and function getting the values of each series, in depth-first
+        order. Series still loading are described from the values received
+        so far.
+    """
+    if isinstance(item, HotArray):
+        try:
+            array = np.array(item._received_values(), dtype=np.float64)
+        except (TypeError, ValueError):  # not a homogeneous array yet
+            return []
+        sep = "/" if not item._label.endswith("/") else ""
+
+        def component(i: int) -> Column:
+            return (f"{item._label}{sep}{i}", lambda: array[:, i])
+
+        nb_components = array.shape[1] if array.ndim == 2 else 0
+        return [component(i) for i in range(nb_components)]
+    if isinstance(item, HotSeries):
+        return [(item._label, lambda: _received_array(item))]
+    if isinstance(item, Series):
+        return [(item._label, lambda: item._values)]
+    if isinstance(item, Node):
+        return [
+            column
+            for _, child in item._items()
+            for column in collect_columns(child)
+        ]
+    raise TypeError(f"Cannot describe {type(item)}")
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+class Description:
+    """Summary statistics of series, one row per series.
+
+    Attributes:
+        rows: Statistics of each series, by label. See :data:`STATISTICS`.
+    """
+
+    rows: Dict[str, Dict[str, Any]]
+
+    def __init__(self, rows: Dict[str, Dict[str, Any]]):
+        """Initialize description from its rows.
+
+        Args:
+            rows: Statistics of each series, by label.
+        """
+        self.rows = rows
+
+    def __getitem__(self, label: str) -> Dict[str, Any]:
+        """Get the statistics of a series.
+
+        Args:
+            label: Label of the series.
+        """
+        return self.rows[label]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the labels of described series."""
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        """Number of described series."""
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        """Table of statistics."""
+        return self.table()
+
+    def table(self) -> str:
+        """Format statistics as a table with one line per series.
+
+        Returns:
+            Table of statistics with aligned columns.
+        """
+        header = ["label", *STATISTICS]
+        lines = [header] + [
+            [label, *(_format(row[key]) for key in STATISTICS)]
+            for label, row in self.rows.items()
+        ]
+        widths = [
+            max(len(line[i]) for line in lines) for i in range(len(header))
+        ]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(line, widths))
+            ).rstrip()
+            for line in lines
+        )
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Vectorized search of threshold crossings and intervals in series."""
+
+from typing import Literal, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .exceptions import FoxplotError
+
+Direction = Literal["up", "down", "both"]
+
+# Number of values evaluated at once when searching many series, so that
+# conditions on thousands of long series do not copy them all at once.
+CHUNK_SIZE = 1 << 22
+
+
+def hysteresis_state(
+    values: NDArray, threshold: float, hysteresis: float = 0.0
+) -> NDArray[np.int8]:
+    """Get whether values are above a threshold, with hysteresis.
+
+    The state switches to above when a value exceeds ``threshold +
+    hysteresis / 2``, and to below when a value falls under ``threshold -
+    hysteresis / 2``. Values in between, including NaNs, keep the previous
+    state.
+
+    Args:
+        values: Values of a series.
+        threshold: Threshold value.
+        hysteresis: Width of the band around the threshold in which the
+            state does not change.
+
+    Returns:
+        State at each index: 1 above the threshold, 0 below, and -1 before
+        the first value that decides the state.
+    """
+    if hysteresis < 0.0:
+        raise FoxplotError(f"Invalid hysteresis {hysteresis}")
+    decided = np.full(len(values), -1, dtype=np.int8)
+    with np.errstate(invalid="ignore"):
+        decided[values > threshold + 0.5 * hysteresis] = 1
+        decided[values < threshold - 0.5 * hysteresis] = 0
+    # Repeat the last decided state, as in forward_fill
+    positions = np.where(decided >= 0, np.arange(len(values)), 0)
+    np.maximum.accumulate(positions, out=positions)
+    return decided[positions]
+
+
+def debounce(
+    state: NDArray[np.int8],
+    times: NDArray[np.float64],
+    min_duration: float,
+) -> NDArray[np.int8]:
+    """Ignore changes of state that last less than a minimum duration.
+
+    Args:
+        state: State at each index.
+        times: Time values of the series.
+        min_duration: Minimum duration of a state, in seconds. Shorter
+            states, including a last one that is not confirmed by the end
+            of the series, are replaced by the state before them.
+
+    Returns:
+        Debounced state at each index.
+    """
+    if min_duration <= 0.0 or len(state) < 1:
+        return state
+    starts = np.flatnonzero(np.diff(state)) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.append(starts[1:], len(state))
+    durations = np.append(times[starts[1:]], times[-1]) - times[starts]
+    kept = np.where(durations >= min_duration, np.arange(len(starts)), 0)
+    np.maximum.accumulate(kept, out=kept)  # first run is always kept
+    return np.repeat(state[starts][kept], ends - starts)
+
+
+def crossing_indices(
+    state: NDArray[np.int8], direction: Direction = "both"
+) -> NDArray[np.int64]:
+    """Find indices at which a state changes.
+
+    Args:
+        state: State at each index, as returned by :func:`hysteresis_state`.
+        direction: Either "up" for changes from below to above, "down" for
+            changes from above to below, or "both".
+
+    Returns:
+        Indices of the first value after each change.
+    """
+    if direction not in ("up", "down", "both"):
+        raise FoxplotError(f"Unknown crossing direction '{direction}'")
+    changes = np.diff(state.astype(np.int16))
+    changes[state[:-1] < 0] = 0  # first decided state is not a crossing
+    if direction == "up":
+        return np.flatnonzero(changes > 0) + 1
+    if direction == "down":
+        return np.flatnonzero(changes < 0) + 1
+    return np.flatnonzero(changes) + 1
+
+
+def find_intervals(
+    mask: NDArray[np.bool_],
+    times: NDArray[np.float64],
+    min_duration: float = 0.0,
+) -> Tuple[NDArray[np.int64], NDArray[np.float64]]:
+    """Find intervals where a condition holds, in many series at once.
+
+    Args:
+        mask: Boolean array with one series per row, set where the
+            condition holds.
+        times: Time values, one per column.
+        min_duration: Minimum duration of an interval, in seconds.
+
+    Returns:
+        Pair of the row of each interval and an array of shape
+        ``(nb_intervals, 2)`` with the start and end time of each interval.
+        Intervals start at the first value where the condition holds and end
+        at the first value where it does not, or at the last time value.
+        They are sorted by row, then by start time.
+    """
+    nb_rows, nb_values = mask.shape
+    padded = np.zeros((nb_rows, nb_values + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges > 0)
+    _, ends = np.nonzero(edges < 0)  # same order as starts
+    intervals = np.empty((len(starts), 2))
+    intervals[:, 0] = times[starts]
+    intervals[:, 1] = times[np.minimum(ends, nb_values - 1)]
+    if min_duration > 0.0:
+        long_enough = intervals[:, 1] - intervals[:, 0] >= min_duration
+        return rows[long_enough], intervals[long_enough]
+    return rows, intervals
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Lazy arithmetic on series, evaluated in a single pass."""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .exceptions import FoxplotError
+from .series import Series, _as_float, _operator_label, _requested_dtype
+from .time_index import TimeIndex
+
+# Operators of binary expressions: NumPy ufunc and numexpr symbol.
+_BINARY = {
+    "+": (np.add, "+"),
+    "-": (np.subtract, "-"),
+    "*": (np.multiply, "*"),
+    "/": (np.true_divide, "/"),
+}
+
+# Data types that numexpr computes with.
+_NUMEXPR_DTYPES = ("bool", "int32", "int64", "float32", "float64")
+
+Operand = Union["Expression", Series, int, float]
+
+
+def _import_numexpr():
+    try:
+        import numexpr
+    except ImportError:
+        return None
+    return numexpr
+
+
+class Expression:
+    """Arithmetic expression on series, evaluated on demand.
+
+    Operations on an expression build a tree rather than computing values.
+    Calling :func:`evaluate` computes the whole tree at once: with numexpr,
+    if it is installed, in a single fused loop; otherwise with NumPy, writing
+    intermediate results to the same temporary buffers. The result is cached,
+    so that evaluating an expression again is free.
+
+    Attributes:
+        label: Label of the series the expression evaluates to.
+        op: Operator of the expression: "+", "-", "*", "/", "neg", "abs", or
+            "series" for the leaf expression of a series.
+        operands: Operands of the operator: expressions or scalars.
+        series: Series of a leaf expression, ``None`` otherwise.
+    """
+
+    __result: Optional[Series]
+    label: str
+    op: str
+    operands: Tuple[Union["Expression", int, float], ...]
+    series: Optional[Series]
+
+    def __init__(
+        self,
+        op: str,
+        operands: Tuple[Union["Expression", int, float], ...],
+        label: str,
+        series: Optional[Series] = None,
+    ):
+        """Initialize a new expression.
+
+        Args:
+            op: Operator of the expression.
+            operands: Operands of the operator.
+            label: Label of the series the expression evaluates to.
+            series: Series of a leaf expression.
+        """
+        self.__result = series
+        self.label = label
+        self.op = op
+        self.operands = operands
+        self.series = series
+
+    @staticmethod
+    def wrap(operand: Operand) -> Union["Expression", int, float]:
+        """Get the expression of an operand.
+
+        Args:
+            operand: Expression, series or scalar.
+
+        Returns:
+            Expression of a series, or the operand itself otherwise.
+        """
+        if isinstance(operand, Series):
+            return Expression("series", (), operand._label, series=operand)
+        if isinstance(operand, (Expression, int, float, np.number)):
+            return operand
+        raise TypeError(f"Unsupported operand type {type(operand)}")
+
+    def __repr__(self) -> str:
+        """String representation of the expression."""
+        return f"Lazy expression: {self.label}"
+
+    def __binary(self, symbol: str, other: Operand, reflected: bool = False):
+        operand = Expression.wrap(other)
+        other_label = (
+            operand.label if isinstance(operand, Expression) else str(other)
+        )
+        if reflected:
+            return Expression(
+                symbol,
+                (operand, self),
+                _operator_label(symbol, other_label, self.label),
+            )
+        return Expression(
+            symbol,
+            (self, operand),
+            _operator_label(symbol, self.label, other_label),
+        )
+
+    def __add__(self, other: Operand) -> "Expression":
+        """Sum of two operands."""
+        return self.__binary("+", other)
+
+    def __radd__(self, other: Operand) -> "Expression":
+        """Sum of two operands."""
+        return self.__binary("+", other, reflected=True)
+
+    def __sub__(self, other: Operand) -> "Expression":
+        """Difference between two operands."""
+        return self.__binary("-", other)
+
+    def __rsub__(self, other: Operand) -> "Expression":
+        """Difference between two operands."""
+        return self.__binary("-", other, reflected=True)
+
+    def __mul__(self, other: Operand) -> "Expression":
+        """Elementwise product between two operands."""
+        return self.__binary("*", other)
+
+    def __rmul__(self, other: Operand) -> "Expression":
+        """Elementwise product between two operands."""
+        return self.__binary("*", other, reflected=True)
+
+    def __truediv__(self, other: Operand) -> "Expression":
+        """Elementwise ratio between two operands."""
+        return self.__binary("/", other)
+
+    def __rtruediv__(self, other: Operand) -> "Expression":
+        """Elementwise ratio between two operands."""
+        return self.__binary("/", other, reflected=True)
+
+    def __neg__(self) -> "Expression":
+        """Unitary minus applied to the expression."""
+        return Expression("neg", (self,), f"-{self.label}")
+
+    def abs(self) -> "Expression":
+        """Absolute value of the expression."""
+        return Expression("abs", (self,), f"abs({self.label})")
+
+    def leaves(self) -> List[Series]:
+        """Get the series the expression is computed from.
+
+        Returns:
+            Series of the leaves of the expression tree, without duplicates.
+        """
+        leaves: Dict[int, Series] = {}
+        stack: List[Expression] = [self]
+        while stack:
+            expression = stack.pop()
+            if expression.series is not None:
+                leaves[id(expression.series)] = expression.series
+            stack.extend(  # reversed so that leaves are listed left to right
+                operand
+                for operand in reversed(expression.operands)
+                if isinstance(operand, Expression)
+            )
+        return list(leaves.values())
+
+    def __time_index(self, leaves: List[Series]) -> TimeIndex:
+        time_index = leaves[0]._time_index
+        for series in leaves[1:]:
+            if len(series) != len(leaves[0]):
+                raise FoxplotError(
+                    f"Series '{series._label}' and '{leaves[0]._label}' "
+                    "have different lengths"
+                )
+            if not series._time_index.matches(time_index):
+                raise FoxplotError(
+                    f"Series '{series._label}' and '{leaves[0]._label}' "
+                    "have different time indexes"
+                )
+        return time_index
+
+    def evaluate(self) -> Series:
+        """Compute the series of the expression.
+
+        Returns:
+            Series of the expression, sharing the time index of its first
+            leaf series.
+        """
+        if self.__result is not None:
+            return self.__result
+        leaves = self.leaves()
+        if not leaves:
+            raise FoxplotError(f"Expression '{self.label}' has no series")
+        time_index = self.__time_index(leaves)
+        arrays = [_as_float(series._values) for series in leaves]
+        numexpr = _import_numexpr()
+        if numexpr is not None and all(
+            array.dtype.name in _NUMEXPR_DTYPES for array in arrays
+        ):
+            values = self.__evaluate_numexpr(numexpr)
+        else:  # NumPy with reused temporary buffers
+            values, _ = self.__evaluate_numpy(self.__references(), {})
+        self.__result = Series(
+            label=self.label,
+            values=np.asarray(values),
+            times=time_index,
+            float_dtype=_requested_dtype(*leaves),
+        )
+        return self.__result
+
+    def __references(self) -> Dict[int, int]:
+        """Count references to each sub-expression in the tree.
+
+        Returns:
+            Number of parents of each sub-expression, by identifier.
+        """
+        counts: Dict[int, int] = {}
+        stack: List[Expression] = [self]
+        while stack:
+            expression = stack.pop()
+            counts[id(expression)] = counts.get(id(expression), 0) + 1
+            if counts[id(expression)] == 1:  # visit children once
+                stack.extend(
+                    operand
+                    for operand in expression.operands
+                    if isinstance(operand, Expression)
+                )
+        return counts
+
+    def __evaluate_numexpr(self, numexpr) -> NDArray:
+        variables: Dict[str, NDArray] = {}
+        names: Dict[int, str] = {}
+
+        def to_string(operand: Union[Expression, int, float]) -> str:
+            if not isinstance(operand, Expression):
+                return repr(float(operand))
+            if operand.series is not None:
+                key = id(operand.series)
+                if key not in names:
+                    names[key] = f"v{len(names)}"
+                    variables[names[key]] = _as_float(operand.series._values)
+                return names[key]
+            args = [to_string(arg) for arg in operand.operands]
+            if operand.op == "neg":
+                return f"(-{args[0]})"
+            if operand.op == "abs":
+                return f"abs({args[0]})"
+            return f"({args[0]} {_BINARY[operand.op][1]} {args[1]})"
+
+        string = to_string(self)
+        return numexpr.evaluate(string, local_dict=variables)
+
+    def __evaluate_numpy(
+        self,
+        references: Dict[int, int],
+        cache: Dict[int, NDArray],
+    ) -> Tuple[NDArray, bool]:
+        """Evaluate the expression with NumPy.
+
+        Args:
+            references: Number of parents of each sub-expression.
+            cache: Values of sub-expressions already evaluated, by identifier.
+
+        Returns:
+            Pair of values and a flag that is set when the values are in a
+            temporary buffer that can be overwritten.
+        """
+        if self.__result is not None:
+            return _as_float(self.__result._values), False
+        if id(self) in cache:  # shared sub-expression
+            return cache[id(self)], False
+        args: List[Union[NDArray, int, float]] = []
+        buffers: List[NDArray] = []
+        for operand in self.operands:
+            if isinstance(operand, Expression):
+                values, temporary = operand.__evaluate_numpy(references, cache)
+                args.append(values)
+                if temporary:
+                    buffers.append(values)
+            else:  # scalar
+                args.append(operand)
+        dtype = np.result_type(*args)
+        if self.op == "/" and dtype.kind != "f":
+            dtype = np.result_type(dtype, np.float64)
+        shape = np.broadcast_shapes(*(np.shape(arg) for arg in args))
+        out = next(
+            (
+                buffer
+                for buffer in buffers
+                if buffer.dtype == dtype and buffer.shape == shape
+            ),
+            None,
+        )
+        if self.op == "neg":
+            result = np.negative(args[0], out=out)
+        elif self.op == "abs":
+            result = np.abs(args[0], out=out)
+        else:  # binary operator
+            result = _BINARY[self.op][0](args[0], args[1], out=out)
+        if references.get(id(self), 1) > 1:
+            cache[id(self)] = result
+            return result, False
+        return result, True
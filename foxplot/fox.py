@@ -6,22 +6,52 @@
 
 """The :class:`Fox` class is where we manipulate dictionary-series data."""
 
+import glob
 import logging
+import os
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import reduce
 from pathlib import PosixPath
-from typing import Dict, List, Optional, Union
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-import uplot
 from numpy.typing import NDArray
-from uplot.plot2 import add_series as _uplot_add_series
-from uplot.plot2 import prepare_data as _uplot_prepare_data
-from uplot.utils import js as _uplot_js
 
+from .cache import transform_cache
+from .categorical_series import CategoricalSeries
+from .columnar import is_columnar, read_columns, write_columns
 from .decode import decode
+from .describe import Description, collect_columns, describe_values
+from .events import CHUNK_SIZE as EVENTS_CHUNK_SIZE
+from .events import find_intervals
+from .exceptions import FoxplotError
+from .expression import Expression
+from .hot_series import HotSeries
+from .ingest_stats import IngestStats
 from .node import Node
+from .parallel import parallel_map
+from .progress import Progress
+from .render import TIME_LABEL, PlotPage, page_path, write_page, write_payload
+from .resample import Aggregation, interpolate_values
 from .series import Series
+from .time_index import TimeIndex
+from .timestamps import EpochUnit, parse_times
 
-_INTEGER_VALUE_FMT = _uplot_js(
+_INTEGER_VALUE_CODE = (
     "(self, rawValue) => {"
     "if (rawValue === null) return '--';"
     "const v = rawValue;"
@@ -33,46 +63,574 @@ _INTEGER_VALUE_FMT = _uplot_js(
 )
 
 
+_TIME_KEYS = ("time", "timestamp")
+
+Plottable = Union[Series, Node, HotSeries, Expression, str]
+
+
+def _integer_value_fmt() -> str:
+    """Get the legend formatter of integer values, with k/M/B suffixes.
+
+    Returns:
+        JavaScript value formatter for uPlot.
+    """
+    from uplot.utils import js
+
+    return js(_INTEGER_VALUE_CODE)
+
+
 def _is_integer_valued(values: NDArray[np.float64]) -> bool:
     finite = values[np.isfinite(values)]
     return len(finite) > 0 and bool(np.all(finite == np.floor(finite)))
 
 
+def _plot_values(series: Series) -> NDArray:
+    """Get numeric values to plot for a given series.
+
+    Args:
+        series: Series to plot.
+
+    Returns:
+        Values of the series, or category codes for categorical series.
+    """
+    if isinstance(series, CategoricalSeries):
+        return series._codes
+    values = series._values
+    if values.dtype == bool:
+        return values.astype(np.int8)
+    return values
+
+
+def _expand_filenames(
+    filename: Union[str, PosixPath, Sequence[Union[str, PosixPath]]],
+) -> List[str]:
+    """Expand glob patterns in input file names.
+
+    Args:
+        filename: File name, glob pattern such as ``run.*.mpack``, or list
+            of file names and patterns.
+
+    Returns:
+        List of file names, where each pattern is replaced by the sorted
+        list of files it matches.
+    """
+    patterns = (
+        [filename] if isinstance(filename, (str, PosixPath)) else filename
+    )
+    filenames: List[str] = []
+    for pattern in map(str, patterns):
+        is_pattern = any(char in pattern for char in "*?[")
+        if is_pattern and not os.path.exists(pattern):
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise FoxplotError(f"No file matches '{pattern}'")
+            filenames.extend(matches)
+        else:  # not a pattern, or a file whose name looks like one
+            filenames.append(pattern)
+    if len(filenames) > 1:
+        for name in filenames:
+            if name == "stdin" or is_columnar(name):
+                raise FoxplotError(f"Cannot read '{name}' with other files")
+    return filenames
+
+
+def _decode_file(
+    filename: str, root: str = "/"
+) -> Tuple[Node, int, IngestStats]:
+    """Decode a file to a data tree whose series still receive values.
+
+    This function runs in worker processes when loading several files.
+
+    Args:
+        filename: Path to the file.
+        root: Label of the root of the data tree.
+
+    Returns:
+        Data tree, number of dictionaries decoded and loading measurements.
+    """
+    stats = IngestStats()
+    start = perf_counter()
+    data = Node(root)
+    length = 0
+    for unpacked in decode(filename, stats):
+        data._update(length, unpacked)
+        length += 1
+    stats.durations["decode"] += perf_counter() - start
+    stats.nb_records = length
+    return data, length, stats
+
+
+def _concatenate(target: Node, parts: List[Tuple[Node, int]]) -> int:
+    """Append data trees decoded from several files, in time order.
+
+    Files are concatenated in the order of their first time value, so that
+    series forward-fill their last value across file boundaries. Series that
+    are missing from a file repeat their last value from previous files.
+
+    Args:
+        target: Empty tree to append data trees to.
+        parts: Data trees and their number of dictionaries, in file order.
+
+    Returns:
+        Number of dictionaries in the concatenated tree.
+    """
+
+    def start_time(data: Node) -> Any:
+        for key in _TIME_KEYS:
+            child = data.__dict__.get(key)
+            if isinstance(child, HotSeries):
+                return child._first_value()
+        return None
+
+    start_times = [start_time(data) for data, _ in parts]
+    if all(isinstance(t, (int, float)) for t in start_times):
+        order = sorted(range(len(parts)), key=start_times.__getitem__)
+        parts = [parts[i] for i in order]
+    length = 0
+    for data, part_length in parts:
+        target._merge(data, length)
+        length += part_length
+    return length
+
+
+def _align(series: Series, times: NDArray[np.float64]) -> NDArray:
+    """Get plot values of a series at given times.
+
+    Args:
+        series: Series with time values.
+        times: Sorted times to align the series on.
+
+    Returns:
+        Last value of the series at each time, NaN outside of its time
+        range.
+    """
+    series_times = series._times
+    assert series_times is not None
+    aligned = interpolate_values(
+        series_times,
+        _plot_values(series).astype(np.float64),
+        times,
+        "zoh",
+    )
+    aligned[times > series_times[-1]] = np.nan
+    return aligned
+
+
 class Fox:
     """Frequent Observation diXionaries, our main class.
 
     Our main class to read, access and manipulate series of dictionary data.
     """
 
+    __error: Optional[Exception]
+    __float_dtype: Optional[np.dtype]
+    __loaded: threading.Event
+    __relative_time: bool
+    __runs: Dict[str, TimeIndex]
     __source: Union[str, PosixPath]
-    __times: Optional[NDArray[np.float64]]
+    __sparse_threshold: float
+    __stats: IngestStats
+    __time_key: Optional[str]
     data: Node
     length: int
+    time_index: TimeIndex
 
     @staticmethod
     def empty() -> "Fox":
         """Initialize from empty time series."""
         return Fox(filename=None)
 
-    def __init__(self, filename: Union[str, PosixPath, None]) -> None:
+    def __init__(
+        self,
+        filename: Union[
+            str,
+            PosixPath,
+            Sequence[Union[str, PosixPath]],
+            Dict[str, Union[str, PosixPath, Sequence[Union[str, PosixPath]]]],
+            None,
+        ],
+        dtype: Optional[str] = None,
+        sparse_threshold: float = 0.05,
+        profile: bool = False,
+        on_stats: Optional[Callable[[IngestStats], None]] = None,
+        progress: bool = False,
+        background: bool = False,
+        on_loaded: Optional[Callable[["Fox"], None]] = None,
+        workers: Optional[int] = None,
+        relative_time: bool = False,
+        time_key: Optional[str] = None,
+    ) -> None:
         """Initialize time series.
 
         Args:
             filename: Name (e.g. "stdin") or path of file to read time series
-                from, or ``None`` to start from an empty state.
+                from, or ``None`` to start from an empty state. Files written
+                by :func:`Fox.export` are read directly. Several files, such
+                as rotated logs, can be given as a list or a glob pattern
+                like ``run.*.mpack``: their dictionaries are concatenated in
+                the order of their first time value, or of their names if
+                they have no time key. To compare several runs, give a
+                dictionary of files by run name: each run is then loaded
+                under its name, e.g. ``data.nominal`` and ``data.faulty``,
+                with its own time index set from its time key.
+            dtype: Floating-point type used to store values, for instance
+                "float32" to halve memory usage. By default, values are
+                stored in single precision only when it represents them
+                exactly. Time keys are always stored in full precision.
+            sparse_threshold: Series updated in less than this ratio of input
+                dictionaries, such as events or error codes, only store the
+                values they receive. Their full arrays of values are computed
+                on demand. Set to zero to store all series densely.
+            profile: If set, measure peak memory allocated while loading,
+                which slows down loading. Other measurements returned by
+                :func:`Fox.stats` are always collected.
+            on_stats: Function called with loading measurements once loading
+                is complete, for instance to forward them to a metrics
+                pipeline.
+            progress: If set, report bytes consumed, records per second and
+                remaining time to the standard error while loading.
+            background: If set, return immediately and load data in a
+                background thread. The data tree is populated as input
+                dictionaries are decoded, and series block until loading is
+                complete when they are accessed. Call :func:`Fox.wait` to
+                wait for the whole data.
+            on_loaded: Function called with this instance once loading is
+                complete, before :func:`Fox.wait` returns.
+            workers: Number of worker processes decoding files in parallel
+                when reading several files. Defaults to the number of
+                processors.
+            relative_time: If set, time values of each run start from zero,
+                so that runs recorded at different times can be overlaid.
+            time_key: Label of the series to use as time, such as
+                ``/header/stamp``, if it is not a root "time" or "timestamp"
+                key. Like these keys, it is stored in full precision whatever
+                the storage type, so that epoch times stay distinct. When
+                comparing runs, the label is relative to each run.
+
+        Loading in the foreground can be interrupted by a keyboard interrupt
+        (Ctrl-C), in which case the data loaded so far is kept.
         """
-        self.__source = filename or "custom data"
-        self.__times = None
+        float_dtype = np.dtype(dtype) if dtype is not None else None
+        if float_dtype is not None and float_dtype.kind != "f":
+            raise FoxplotError(f"Storage type '{dtype}' is not floating-point")
+        self.__error = None
+        self.__float_dtype = float_dtype
+        self.__loaded = threading.Event()
+        self.__relative_time = relative_time
+        self.__runs = {}
+        self.__sparse_threshold = sparse_threshold
+        self.__source = (
+            filename
+            if filename is None or isinstance(filename, (str, PosixPath))
+            else ", ".join(map(str, filename))  # also run names
+        ) or "custom data"
+        self.__stats = IngestStats()
+        self.__time_key = time_key
         self.data = Node("/")
         self.length = 0
-        if filename is not None:
-            for unpacked in decode(filename):
+        self.time_index = TimeIndex()
+        if filename is None:
+            self.__loaded.set()
+            return
+        filenames: Union[List[str], Dict[str, List[str]]] = (
+            {name: _expand_filenames(f) for name, f in filename.items()}
+            if isinstance(filename, dict)
+            else _expand_filenames(filename)
+        )
+        if background:
+            threading.Thread(
+                target=self.__load_in_background,
+                args=(
+                    filenames,
+                    profile,
+                    progress,
+                    workers,
+                    on_stats,
+                    on_loaded,
+                ),
+                daemon=True,
+            ).start()
+        else:  # load in the foreground
+            self.__load(filenames, profile, progress, workers)
+            if on_stats is not None:
+                on_stats(self.__stats)
+            if on_loaded is not None:
+                on_loaded(self)
+            self.__loaded.set()
+
+    def __load_in_background(
+        self,
+        filenames: Union[List[str], Dict[str, List[str]]],
+        profile: bool,
+        progress: bool,
+        workers: Optional[int],
+        on_stats: Optional[Callable[[IngestStats], None]],
+        on_loaded: Optional[Callable[["Fox"], None]],
+    ) -> None:
+        """Load data from a background thread, see :func:`Fox.__init__`."""
+        try:
+            self.__load(filenames, profile, progress, workers)
+            if on_stats is not None:
+                on_stats(self.__stats)
+            if on_loaded is not None:
+                on_loaded(self)
+        except Exception as exn:
+            self.__error = exn
+            self.freeze()  # release series waiting for their values
+        finally:
+            self.__loaded.set()
+
+    def __load(
+        self,
+        filenames: Union[List[str], Dict[str, List[str]]],
+        profile: bool,
+        progress: bool,
+        workers: Optional[int],
+    ) -> None:
+        """Load data from files, measuring time spent in each stage.
+
+        Args:
+            filenames: Names (e.g. "stdin") or paths of files to read from,
+                or dictionary of them by run name.
+            profile: If set, measure peak memory allocated while loading.
+            progress: If set, report progress to the standard error.
+            workers: Number of worker processes decoding several files.
+        """
+        stats = self.__stats
+        if isinstance(filenames, list) and is_columnar(filenames[0]):
+            start = perf_counter()
+            self.__load_columns(filenames[0])
+            stats.durations["read"] += perf_counter() - start
+            stats.nb_leaves = sum(1 for _ in self.data._leaves())
+            stats.nb_records = self.length
+            return
+        reporter: Optional[Progress] = None
+        if progress:
+            all_files = (
+                filenames
+                if isinstance(filenames, list)
+                else [f for run in filenames.values() for f in run]
+            )
+            reporter = Progress(
+                None
+                if all_files == ["stdin"]
+                else sum(map(os.path.getsize, all_files))
+            )
+        if profile:
+            tracemalloc.start()
+        try:
+            try:
+                if isinstance(filenames, dict):
+                    self.__load_runs(filenames, workers, reporter)
+                elif len(filenames) == 1:
+                    self.__decode(filenames[0], reporter)
+                else:  # several files
+                    parts: Dict[int, Tuple[Node, int]] = {}
+                    jobs = [(filename, "/") for filename in filenames]
+                    try:
+                        self.__decode_files(jobs, workers, reporter, parts)
+                    finally:  # keep decoded files if interrupted
+                        self.length = _concatenate(
+                            self.data, [parts[i] for i in sorted(parts)]
+                        )
+            except KeyboardInterrupt:
+                stats.interrupted = True
+                logging.warning(
+                    "Loading interrupted after %d records, "
+                    "keeping the data loaded so far",
+                    self.length,
+                )
+            if reporter is not None:
+                reporter.close(stats.bytes_read, self.length)
+            frozen = perf_counter()
+            self.freeze()
+            stats.durations["freeze"] += perf_counter() - frozen
+        finally:
+            if profile:
+                stats.peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        # Time spent decoding includes time spent reading from the input
+        stats.durations["decode"] -= stats.durations["read"]
+        stats.nb_leaves = sum(1 for _ in self.data._leaves())
+        stats.nb_records = self.length
+
+    def __decode(self, filename: str, reporter: Optional[Progress]) -> None:
+        """Decode dictionaries from a file and unpack them.
+
+        Args:
+            filename: Name (e.g. "stdin") or path of file to read from.
+            reporter: Progress reporter, if any.
+        """
+        stats = self.__stats
+        start = perf_counter()
+        try:
+            for unpacked in decode(filename, stats):
+                decoded = perf_counter()
+                stats.durations["decode"] += decoded - start
                 self.unpack(unpacked)
-            self.data._freeze(self.length)
+                if reporter is not None:
+                    reporter.update(stats.bytes_read, self.length)
+                start = perf_counter()
+                stats.durations["update"] += start - decoded
+        finally:
+            stats.durations["decode"] += perf_counter() - start
+
+    def __decode_files(
+        self,
+        jobs: List[Tuple[str, str]],
+        workers: Optional[int],
+        reporter: Optional[Progress],
+        parts: Dict[int, Tuple[Node, int]],
+    ) -> None:
+        """Decode several files in parallel worker processes.
+
+        Args:
+            jobs: Path of each file to read from, with the root label of its
+                data tree.
+            workers: Number of worker processes, or ``None`` to use the
+                number of processors.
+            reporter: Progress reporter, if any.
+            parts: Dictionary filled with the data tree and number of
+                dictionaries of each file, by job index, as files are
+                decoded. It holds the files decoded so far if decoding is
+                interrupted.
+        """
+
+        def decode_all() -> Generator[
+            Tuple[int, Tuple[Node, int, IngestStats]], None, None
+        ]:
+            if workers == 1:
+                for i, job in enumerate(jobs):
+                    yield i, _decode_file(*job)
+                return
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_decode_file, *job): i
+                    for i, job in enumerate(jobs)
+                }
+                try:
+                    for future in as_completed(futures):
+                        yield futures[future], future.result()
+                finally:
+                    executor.shutdown(cancel_futures=True)
+
+        stats = self.__stats
+        nb_records = 0
+        for i, (data, length, part_stats) in decode_all():
+            parts[i] = (data, length)
+            stats.bytes_read += part_stats.bytes_read
+            for stage in ("read", "decode"):
+                stats.durations[stage] += part_stats.durations[stage]
+            nb_records += length
+            if reporter is not None:
+                reporter.update(stats.bytes_read, nb_records)
+
+    def __load_runs(
+        self,
+        runs: Dict[str, List[str]],
+        workers: Optional[int],
+        reporter: Optional[Progress],
+    ) -> None:
+        """Load several runs under their names, decoding files in parallel.
+
+        Args:
+            runs: Paths of the files of each run, by run name.
+            workers: Number of worker processes, or ``None`` to use the
+                number of processors.
+            reporter: Progress reporter, if any.
+        """
+        jobs = [
+            (filename, f"/{name}")
+            for name, filenames in runs.items()
+            for filename in filenames
+        ]
+        parts: Dict[int, Tuple[Node, int]] = {}
+        try:
+            self.__decode_files(jobs, workers, reporter, parts)
+        finally:  # keep decoded files if interrupted
+            for name in runs:
+                run_parts = [
+                    parts[i] for i in sorted(parts) if jobs[i][1] == f"/{name}"
+                ]
+                if not run_parts:
+                    continue
+                node = Node(f"/{name}")
+                length = _concatenate(node, run_parts)
+                time_index = TimeIndex()
+                self.__freeze_tree(node, length, time_index)
+                self.data.__dict__[name] = node
+                self.__runs[name] = time_index
+                self.length = max(self.length, length)
+                for key in _TIME_KEYS:
+                    if isinstance(node.__dict__.get(key), Series):
+                        self.set_time(node.__dict__[key])
+                        break
+
+    def __load_columns(self, filename: Union[str, PosixPath]) -> None:
+        """Load series from a columnar file written by :func:`Fox.export`.
+
+        Args:
+            filename: Path to the NPZ, Parquet or Arrow IPC file.
+        """
+        for label, series in read_columns(filename, self.time_index).items():
+            keys = [
+                int(key) if key.isdigit() else key
+                for key in label.strip("/").split("/")
+            ]
+            self.data._insert(keys, series)
+            self.length = len(series)
+
+    def __select(self, label: str) -> Union[Node, Series]:
+        """Get the node or series at a given label.
+
+        Args:
+            label: Label in the data tree, for example ``/observation``.
+
+        Returns:
+            Node or series at this label.
+        """
+        child: Union[Node, Series] = self.data
+        for key in label.strip("/").split("/"):
+            if not key:
+                continue
+            if not isinstance(child, Node):
+                raise FoxplotError(f"{child._label} is not a node")
+            if key.isdigit() and key not in child.__dict__:
+                key = int(key)  # type: ignore[assignment]
+            if key not in child.__dict__:
+                raise FoxplotError(f"No series or node at label '{label}'")
+            child = child.__dict__[key]
+        return child
+
+    def __resolve(self, item: Plottable) -> List[Any]:
+        """Resolve labels to the nodes or series they designate.
+
+        Args:
+            item: Node, series, or label of a node or series. When comparing
+                runs, a label that is not found from the root of the data
+                tree designates the node or series at this label in each run.
+
+        Returns:
+            List of nodes or series designated by the item.
+        """
+        if not isinstance(item, str):
+            return [item]
+        try:
+            return [self.__select(item)]
+        except FoxplotError:
+            matches = []
+            for name in self.__runs:
+                try:
+                    matches.append(self.__select(f"/{name}/{item.strip('/')}"))
+                except FoxplotError:
+                    continue
+            if not matches:
+                raise
+            return matches
 
     def __list_to_dict(
-        self, series_list: List[Union[Series, Node]]
-    ) -> Dict[str, NDArray[np.float64]]:
+        self, series_list: List[Plottable]
+    ) -> Dict[str, Series]:
         """Convert a list of series (or nodes) to a dictionary.
 
         The output dictionary has one key per series in the list. Nodes are
@@ -80,42 +638,274 @@ class Fox:
         are series.
 
         Args:
-            series_list: Input list of series;
+            series_list: Input list of series, nodes, lazy expressions or
+                labels.
 
         Returns:
-            Dictionary mapping series names to their values.
+            Dictionary mapping series names to the series.
         """
         series_dict = {}
-        for series in series_list:
-            if isinstance(series, Series):
-                series_dict[series._label] = series._values
-            elif isinstance(series, Node):
-                for key, child in series._items():
-                    label = series._label + f"/{key}"
-                    if isinstance(child, Series):
-                        series_dict[label] = child._values
-                    else:
-                        logging.warning(
-                            "Skipping '%s' as it is not an indexed series",
-                            label,
-                        )
-            else:
-                raise TypeError(
-                    f"Series '{series}' has unhandled type {type(series)}"
-                )
+        for item in series_list:
+            for series in self.__resolve(item):
+                if isinstance(series, HotSeries):  # obtained while loading
+                    series = series._wait()
+                elif isinstance(series, Expression):
+                    series = series.evaluate()
+                if isinstance(series, Series):
+                    series_dict[series._label] = series
+                elif isinstance(series, Node):
+                    for key, child in series._items():
+                        label = series._label + f"/{key}"
+                        if isinstance(child, Series):
+                            series_dict[label] = child
+                        else:
+                            logging.warning(
+                                "Skipping '%s' as it is not an indexed series",
+                                label,
+                            )
+                else:
+                    raise TypeError(
+                        f"Series '{series}' has unhandled type {type(series)}"
+                    )
         return series_dict
 
-    def detect_time(self) -> None:
-        """Search for a time key in root keys."""
-        candidates = ("time", "timestamp")
-        for key in candidates:
-            if key in self.data.__dict__:
-                self.set_time(self.data.__dict__[key])
-                print(
-                    f'Detected "{key}" as time key from the input '
-                    "(call `fox.set_time` to select a different one)"
+    def cache_info(self) -> Dict[str, int]:
+        """Get statistics of the cache of series transforms.
+
+        Results of transforms such as :func:`Series.deriv`,
+        :func:`Series.low_pass_filter` or :func:`Series.resample` are cached,
+        so that calling them again with the same parameters is instant.
+
+        Returns:
+            Dictionary with the numbers of hits, misses and entries, the
+            memory used by cached values and the memory budget, in bytes.
+        """
+        return transform_cache.info()
+
+    def clear_cache(self) -> None:
+        """Remove all results from the cache of series transforms."""
+        transform_cache.clear()
+
+    def describe(
+        self,
+        selection: Optional[Union[Plottable, Sequence[Plottable]]] = None,
+        workers: Optional[int] = None,
+    ) -> Description:
+        """Compute summary statistics of many series.
+
+        Statistics of each series are computed in a single pass over its
+        values, and series are processed in a pool of threads. This function
+        does not wait for data to load: series that are still loading are
+        described from the values they received so far.
+
+        Args:
+            selection: Series, node, lazy expression or label to describe, or
+                list of them. Defaults to the whole data tree.
+            workers: Number of threads, see :func:`parallel_map`.
+
+        Returns:
+            Table with the count, number of missing values, minimum, maximum,
+            mean, standard deviation, first and last values, and number of
+            value changes of each series.
+        """
+        is_list = isinstance(selection, (list, tuple))
+        selected = cast(
+            List[Plottable],
+            selection
+            if is_list
+            else [self.data if selection is None else selection],
+        )
+        columns = [
+            column
+            for entry in selected
+            for item in self.__resolve(entry)
+            for column in collect_columns(
+                item.evaluate() if isinstance(item, Expression) else item
+            )
+        ]
+        rows = parallel_map(
+            lambda column: describe_values(column[1]()), columns, workers
+        )
+        return Description(
+            {label: row for (label, _), row in zip(columns, rows)}
+        )
+
+    def detect_time(self, unit: Optional[EpochUnit] = None) -> None:
+        """Search for a time key in root keys.
+
+        When comparing runs, the time key of each run is searched in the root
+        keys of this run.
+
+        Args:
+            unit: Unit of numeric time values, see :func:`Fox.set_time`.
+        """
+        roots = {"the input": self.data}
+        if self.__runs:
+            roots = {f'run "{name}"': self.data[name] for name in self.__runs}
+        for source, root in roots.items():
+            for key in _TIME_KEYS:
+                if key in root.__dict__:
+                    self.set_time(root.__dict__[key], unit)
+                    print(
+                        f'Detected "{key}" as time key from {source} '
+                        "(call `fox.set_time` to select a different one)"
+                    )
+                    break
+
+    def export(
+        self,
+        path: Union[str, PosixPath],
+        labels: Optional[List[str]] = None,
+    ) -> None:
+        """Write series to a columnar file, named after their labels.
+
+        The format is chosen from the file extension: ``.npz`` for NumPy,
+        which is always available, ``.parquet`` for Parquet and ``.arrow`` or
+        ``.feather`` for Arrow IPC, which require pyarrow. Exported files can
+        be read back by :class:`Fox`, which is much faster than decoding
+        dictionaries.
+
+        Args:
+            path: Path to the output file.
+            labels: Labels of series or nodes to export, for instance
+                ``["/time", "/observation"]``. All series are exported if
+                ``None``.
+        """
+        self.wait()
+        selection = (
+            [self.data] if labels is None else map(self.__select, labels)
+        )
+        series_dict: Dict[str, Series] = {}
+        for child in selection:
+            if isinstance(child, Series):
+                series_dict[child._label] = child
+            else:  # child is a Node
+                for leaf in child._leaves():
+                    series_dict[leaf._label] = leaf
+        write_columns(path, series_dict)
+
+    def find(
+        self,
+        condition: Callable[[NDArray], NDArray],
+        selection: Optional[Union[Plottable, Sequence[Plottable]]] = None,
+        min_duration: float = 0.0,
+        workers: Optional[int] = None,
+    ) -> Dict[str, NDArray[np.float64]]:
+        """Find intervals where a condition holds in many series.
+
+        The condition is evaluated on blocks of series at once, one series
+        per row, for instance ``fox.find(lambda x: x > 20.0, "/motors")``.
+        Blocks are processed in a pool of threads.
+
+        Args:
+            condition: Function of an array of values, with one series per
+                row, returning a boolean array of the same shape.
+            selection: Series, node, lazy expression or label to search, or
+                list of them. Defaults to the whole data tree. Only numeric
+                series are searched.
+            min_duration: Minimum duration of an interval, in seconds.
+            workers: Number of threads, see :func:`parallel_map`.
+
+        Returns:
+            Dictionary mapping the label of each series where the condition
+            holds to an array of shape ``(nb_intervals, 2)`` with the start
+            and end time of each interval.
+        """
+        self.wait()
+        is_list = isinstance(selection, (list, tuple))
+        selected = cast(
+            List[Plottable],
+            selection
+            if is_list
+            else [self.data if selection is None else selection],
+        )
+        groups: Dict[int, List[Series]] = {}
+        for entry in selected:
+            for item in self.__resolve(entry):
+                if isinstance(item, HotSeries):  # obtained while loading
+                    item = item._wait()
+                elif isinstance(item, Expression):
+                    item = item.evaluate()
+                leaves = item._leaves() if isinstance(item, Node) else [item]
+                for leaf in leaves:
+                    if not isinstance(leaf, CategoricalSeries) and (
+                        leaf._dtype.kind in "biuf"
+                    ):
+                        key = id(leaf._time_index)
+                        groups.setdefault(key, []).append(leaf)
+        blocks: List[List[Series]] = []
+        for leaves in groups.values():
+            nb_rows = max(1, EVENTS_CHUNK_SIZE // max(1, len(leaves[0])))
+            blocks.extend(
+                leaves[start : start + nb_rows]
+                for start in range(0, len(leaves), nb_rows)
+            )
+
+        def search(block: List[Series]) -> Tuple[NDArray, NDArray]:
+            times = block[0]._times
+            if times is None:
+                raise FoxplotError(
+                    f"Unset time values for series '{block[0]._label}'"
                 )
-                return
+            values = np.stack([leaf._values for leaf in block])
+            mask = np.asarray(condition(values), dtype=bool)
+            if mask.shape != values.shape:
+                raise FoxplotError(
+                    f"Condition returned shape {mask.shape} for values of "
+                    f"shape {values.shape}"
+                )
+            return find_intervals(mask, times, min_duration)
+
+        intervals: Dict[str, NDArray[np.float64]] = {}
+        for block, (rows, found) in zip(
+            blocks, parallel_map(search, blocks, workers)
+        ):
+            bounds = np.searchsorted(rows, np.arange(len(block) + 1))
+            for row, leaf in enumerate(block):
+                if bounds[row + 1] > bounds[row]:  # rows are sorted
+                    intervals[leaf._label] = found[
+                        bounds[row] : bounds[row + 1]
+                    ]
+        return intervals
+
+    def freeze(self) -> None:
+        """Convert series that are still receiving values to NumPy arrays.
+
+        Floating-point values are stored with the storage type of this
+        instance, except for root time keys and the time key given at
+        initialization, which keep their full precision.
+        """
+        self.__freeze_tree(self.data, self.length, self.time_index)
+
+    def __freeze_tree(
+        self, node: Node, length: int, time_index: TimeIndex
+    ) -> None:
+        """Freeze the series of a data tree, see :func:`Fox.freeze`.
+
+        Args:
+            node: Root of the data tree.
+            length: Number of values in each output series.
+            time_index: Time index shared by all output series.
+        """
+        paths = [[key] for key in _TIME_KEYS]
+        if self.__time_key:
+            paths.append(self.__time_key.strip("/").split("/"))
+        for path in paths:
+            parent: Any = node
+            for key in path[:-1]:
+                parent = parent.__dict__.get(key)
+                if not isinstance(parent, Node):
+                    break
+            if not isinstance(parent, Node):
+                continue
+            child = parent.__dict__.get(path[-1])
+            if isinstance(child, HotSeries):
+                parent.__dict__[path[-1]] = child._freeze(
+                    length, time_index=time_index
+                )
+        node._freeze(
+            length, self.__float_dtype, time_index, self.__sparse_threshold
+        )
 
     def get_series(self, label: str) -> Series:
         """Get time-series data from a given label.
@@ -127,67 +917,264 @@ class Fox:
         Returns:
             Corresponding time series.
         """
+        self.wait()
         keys = label.strip("/").split("/")
         series = self.data._get_child(keys)
         if not isinstance(series, Series):
             raise TypeError(f"Series {label} is not finalized")
         return series
 
+    def map(
+        self,
+        function: Callable[[Series], Any],
+        selection: Optional[Union[Plottable, Sequence[Plottable]]] = None,
+        workers: Optional[int] = None,
+    ) -> Any:
+        """Apply a function to many series in a pool of threads.
+
+        NumPy releases the global interpreter lock in most array operations,
+        so that functions spending their time in them, such as ``lambda
+        series: series.resample(0.01)`` or ``np.fft.rfft``, run on several
+        cores at once. Functions that loop over values in Python, such as
+        :func:`Series.deriv`, hold the lock and do not run faster. Outputs do
+        not depend on the number of threads.
+
+        Args:
+            function: Function applied to each series.
+            selection: Series, node, lazy expression or label to apply the
+                function to, or list of them. Defaults to the whole data tree.
+            workers: Number of threads, see :func:`parallel_map`.
+
+        Returns:
+            Output of the function for a series, or node with the same
+            structure for a node, where each series is replaced by the output
+            of the function. A list of such results, in the same order, if
+            the selection is a list or a label designating several runs.
+        """
+        self.wait()
+        is_list = isinstance(selection, (list, tuple))
+        selected = cast(
+            List[Plottable],
+            selection
+            if is_list
+            else [self.data if selection is None else selection],
+        )
+        items = [item for entry in selected for item in self.__resolve(entry)]
+        group = Node(self.data._label)
+        for i, item in enumerate(items):
+            if isinstance(item, HotSeries):  # obtained while loading
+                item = item._wait()
+            elif isinstance(item, Expression):
+                item = item.evaluate()
+            if not isinstance(item, (Series, Node)):
+                raise TypeError(f"Cannot map over {type(item)}")
+            group.__dict__[i] = item  # type: ignore[index]
+        mapped = cast(Dict[Any, Any], group._map(function, workers).__dict__)
+        outputs = [mapped[i] for i in range(len(items))]
+        return outputs if is_list or len(outputs) != 1 else outputs[0]
+
     def plot(
         self,
-        left: Union[Series, Node, List[Union[Series, Node]]],
-        right: Optional[Union[Series, Node, List[Union[Series, Node]]]] = None,
+        left: Union[Plottable, Sequence[Plottable]],
+        right: Optional[Union[Plottable, Sequence[Plottable]]] = None,
         title: Optional[str] = None,
     ) -> None:
         """Plot a set of indexed series.
 
+        Series with different time indices, such as series from different
+        runs, are overlaid on the union of their time values.
+
         Args:
-            left: Series to plot on the left axis.
+            left: Series to plot on the left axis. Series and nodes can also
+                be given by label, such as ``/observation/cpu_temperature``:
+                when comparing runs, a label that is not a run name selects
+                the series at this label in every run.
             right: Series to plot on the right axis.
             title: Plot title.
         """
-        if isinstance(left, (Node, Series)):
-            left = [left]
-        if isinstance(right, (Node, Series)):
-            right = [right]
+        import uplot  # slow to import, only needed when plotting
+
+        self.wait()
         if title is None:
             title = f"Plot from {self.__source}"
-
-        times: NDArray[np.float64] = (
-            self.__times
-            if self.__times is not None
-            else np.array(range(self.length), dtype=np.float64)
+        page = self.__plot_page(left, right, title)
+        assert page.arrays is not None
+        nb_left = page.nb_left
+        uplot.plot2(
+            page.arrays[0],
+            page.arrays[1 : 1 + nb_left],
+            page.arrays[1 + nb_left :],
+            title=title,
+            timestamped=page.timestamped,
+            series=page.series,
         )
 
-        left_series: Dict[str, NDArray[np.float64]] = self.__list_to_dict(left)
-        right_series: Dict[str, NDArray[np.float64]] = {}
-        if right is not None:
-            right_series = self.__list_to_dict(right)
+    def __plot_page(
+        self,
+        left: Union[Plottable, Sequence[Plottable]],
+        right: Optional[Union[Plottable, Sequence[Plottable]]],
+        title: str,
+    ) -> PlotPage:
+        """Prepare the arrays and options of a plot.
+
+        Args:
+            left: Series to plot on the left axis.
+            right: Series to plot on the right axis.
+            title: Plot title.
+
+        Returns:
+            Plot page.
+        """
+        from uplot.plot2 import add_series
+
+        def as_list(items) -> List[Plottable]:
+            if items is None:
+                return []
+            return list(items) if isinstance(items, (list, tuple)) else [items]
+
+        left_series = self.__list_to_dict(as_list(left))
+        right_series = self.__list_to_dict(as_list(right))
+        all_series = list(left_series.values()) + list(right_series.values())
+
+        time_indices = list(
+            {id(s._time_index): s._time_index for s in all_series}.values()
+        )
+        time_label = f"{TIME_LABEL}:" + "+".join(
+            str(id(index)) for index in time_indices
+        )
+        labels = list(left_series.keys()) + list(right_series.keys())
+        times: NDArray[np.float64]
+        if len(time_indices) > 1:  # overlay series on all their times
+            all_times = [
+                index.values
+                for index in time_indices
+                if index.values is not None
+            ]
+            if len(all_times) < len(time_indices):
+                raise FoxplotError(
+                    "Cannot overlay series with different unset time values"
+                )
+            times = reduce(np.union1d, all_times)
+            values = parallel_map(
+                lambda series: _align(series, times), all_series
+            )
+        else:  # all series share the same time index
+            index = time_indices[0] if time_indices else self.time_index
+            length = len(all_series[0]) if all_series else self.length
+            times = (
+                index.values
+                if index.values is not None
+                else np.arange(length, dtype=np.float64)
+            )
+            values = [_plot_values(series) for series in all_series]
+        # series keep their labels when sliced: label their values with
+        # their times, on which the data shared by pages is keyed
+        labels = [f"{label}@{time_label}" for label in labels]
+        axes = {index.axis for index in time_indices}
+        if len(axes) > 1:
+            raise FoxplotError("Cannot plot spectra and time series together")
+        frequency_axis = axes == {"frequency"}
+        timestamped = (
+            all(index.values is not None for index in time_indices)
+            and not self.__relative_time
+            and not frequency_axis
+        )
 
-        left_values = list(left_series.values())
-        right_values = list(right_series.values())
-        data = _uplot_prepare_data(times, left_values, right_values)
         series_opts: Dict = {}
-        _uplot_add_series(
+        add_series(
             series_opts,
-            data,
+            [times, *values],
             len(left_series),
             list(left_series.keys()),
             list(right_series.keys()),
         )
-        for i, values in enumerate(left_values + right_values):
-            if _is_integer_valued(values):
-                series_opts["series"][i + 1]["value"] = _INTEGER_VALUE_FMT
+        if frequency_axis:
+            series_opts["series"][0]["label"] = "Frequency (Hz)"
+        integer_valued = parallel_map(_is_integer_valued, values)
+        for i, is_integer in enumerate(integer_valued):
+            if is_integer:
+                series_opts["series"][i + 1]["value"] = _integer_value_fmt()
 
-        uplot.plot2(
-            times,
-            left_values,
-            right_values,
+        return PlotPage(
             title=title,
-            timestamped=self.__times is not None,
+            labels=[time_label, *labels],
+            arrays=[times, *values],
+            nb_left=len(left_series),
             series=series_opts["series"],
+            timestamped=timestamped,
         )
 
+    def plot_many(
+        self,
+        plots: List[dict],
+        directory: Union[str, PosixPath] = ".",
+        workers: int = 1,
+        shared_data: bool = False,
+    ) -> List[str]:
+        """Render several plots to HTML files from the same data.
+
+        Each plot is a dictionary with the following keys:
+
+        - ``left``: labels of series or nodes to plot on the left axis,
+          for instance ``["/observation/cpu_temperature"]``.
+        - ``right`` (optional): labels of series to plot on the right axis.
+        - ``title`` (optional): plot title.
+        - ``name`` (optional): name of the HTML file, ``plot-<i>`` by
+          default.
+
+        Args:
+            plots: Specification of each plot.
+            directory: Directory to write HTML files to.
+            workers: Number of worker processes rendering pages in parallel.
+            shared_data: If set, write data to a single ``data.js`` file in
+                the output directory, read by all pages, rather than
+                embedding it in each page. Series plotted in several pages
+                are then written once.
+
+        Returns:
+            Paths to the HTML files, in the order of plots.
+        """
+        self.wait()
+        directory = str(directory)
+        os.makedirs(directory, exist_ok=True)
+
+        pages: List[PlotPage] = []
+        paths: List[str] = []
+        for i, spec in enumerate(plots):
+            title = spec.get("title", f"Plot from {self.__source}")
+            pages.append(
+                self.__plot_page(spec["left"], spec.get("right"), title)
+            )
+            paths.append(page_path(directory, spec.get("name", f"plot-{i}")))
+
+        payload: Optional[str] = None
+        payload_indices: Optional[Dict[str, int]] = None
+        if shared_data:
+            payload = "data.js"
+            shared: Dict[str, NDArray] = {}
+            for page in pages:
+                assert page.arrays is not None
+                shared.update(zip(page.labels, page.arrays))
+                page.arrays = None  # no need to send them to workers
+            payload_indices = {label: i for i, label in enumerate(shared)}
+            write_payload(
+                os.path.join(directory, payload), list(shared.values())
+            )
+
+        if workers <= 1:
+            return [
+                write_page(page, path, payload, payload_indices)
+                for page, path in zip(pages, paths)
+            ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    write_page, page, path, payload, payload_indices
+                )
+                for page, path in zip(pages, paths)
+            ]
+            return [future.result() for future in futures]
+
     def unpack(self, unpacked: dict) -> None:
         """Append data from an unpacked dictionary.
 
@@ -197,20 +1184,132 @@ class Fox:
         self.data._update(self.length, unpacked)
         self.length += 1
 
-    def set_time(self, time: Series):
+    def resample(self, period: float, how: Aggregation = "last") -> "Fox":
+        """Resample all series at a uniform rate.
+
+        Args:
+            period: Time between two consecutive output values.
+            how: Aggregation of the values received during each period: their
+                "mean", "min", "max", or the "last" value received. Series
+                whose values are not numbers are always resampled with
+                "last".
+
+        Returns:
+            New instance where all series share the same uniform time index.
+            When comparing runs, series of each run share the uniform time
+            index of their run instead.
+        """
+
+        def resample_series(series: Series) -> Series:
+            numeric = series._dtype.kind in "biuf"
+            return series.resample(period, how if numeric else "last")
+
+        resampled = Fox.empty()
+        resampled.__float_dtype = self.__float_dtype
+        resampled.__source = self.__source
+        resampled.__sparse_threshold = self.__sparse_threshold
+        resampled.__time_key = self.__time_key
+        resampled.__relative_time = self.__relative_time
+        resampled.data = self.data._map(resample_series, workers=None)
+        if self.__runs:  # series of each run share the index of their run
+            resampled.__runs = {
+                name: index.uniform(period)
+                for name, index in self.__runs.items()
+            }
+            resampled.length = max(map(len, resampled.__runs.values()))
+        else:  # all series share the root time index
+            resampled.time_index = self.time_index.uniform(period)
+            resampled.length = len(resampled.time_index)
+        return resampled
+
+    def set_cache_limit(self, max_bytes: int) -> None:
+        """Set the memory budget of the cache of series transforms.
+
+        Least recently used results are evicted when the values of cached
+        results take more memory than this budget.
+
+        Args:
+            max_bytes: Memory budget in bytes. Set to zero to disable caching.
+        """
+        transform_cache.resize(max_bytes)
+
+    def stats(self) -> IngestStats:
+        """Get measurements collected while loading data.
+
+        Returns:
+            Loading measurements: time spent in each stage, bytes read,
+            records per second, number of series and peak memory.
+        """
+        return self.__stats
+
+    def set_time(self, time: Series, unit: Optional[EpochUnit] = None):
         """Set label of time index in input dictionaries.
 
+        All series in the data tree share the same time index, so that
+        changing time values does not need to walk the tree. When comparing
+        runs, each run has its own time index, and setting the time of a run
+        only changes the time index of this run. The time index of the input
+        series itself, for instance that of a slice, is left unchanged.
+
+        Time values are parsed in a single vectorized pass. ISO 8601 strings,
+        such as ``2024-03-01T12:00:00.25Z``, and integer epoch times are
+        stored exactly as integer nanoseconds, while floating-point values
+        are stored as seconds.
+
         Args:
             time: Time index as a series.
+            unit: Unit of numeric time values: "s", "ms", "us" or "ns". By
+                default, it is guessed from the magnitude of epoch times.
+
+        Raises:
+            FoxplotError: If the series does not have one value per time of
+                the time index.
         """
-        time._values = time._values.astype(np.float64)
-        self.__times = time._values
+        if isinstance(time, CategoricalSeries):  # parse each string once
+            times = parse_times(time._categories, unit)[time._codes]
+        else:  # numbers or datetimes
+            if self.__float_dtype is not None and time._values.dtype in (
+                np.float16,
+                np.float32,
+            ):
+                logging.warning(
+                    "Time values of '%s' are stored in %s: load them with "
+                    "`time_key` to keep their full precision",
+                    time._label,
+                    time._values.dtype,
+                )
+            times = parse_times(time._values, unit)
+        run = time._label.strip("/").split("/")[0]
+        index = self.__runs.get(run, self.time_index)
+        if index.values is not None and len(times) != len(index):
+            raise FoxplotError(
+                f"Series '{time._label}' has {len(times)} values for a time "
+                f"index of length {len(index)}"
+            )
+        if run in self.__runs and self.__relative_time and len(times) > 0:
+            times = times - times[0]
+        if times.dtype == np.int64:
+            index.set_nanoseconds(times)
+        else:  # seconds
+            index.set_values(times)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until data is loaded.
+
+        Args:
+            timeout: Maximum duration to wait for, in seconds. Wait until
+                loading is complete if ``None``.
 
-        def set_series_times(series: Union[Series, Node]):
-            if isinstance(series, Series):
-                series._times = self.__times
-            if isinstance(series, Node):
-                for _, child in series._items():
-                    set_series_times(child)
+        Returns:
+            True if loading is complete, False if the timeout expired.
 
-        set_series_times(self.data)
+        Raises:
+            FoxplotError: If loading in the background failed.
+        """
+        if not self.__loaded.wait(timeout):
+            return False
+        if self.__error is not None:
+            raise FoxplotError(
+                f"Loading from {self.__source} failed: {self.__error}"
+            ) from self.__error
+        return True
@@ -7,11 +7,14 @@
 """Functions that can be applied to series."""
 
 import logging
+from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from numpy.typing import NDArray
 
+from .exceptions import FoxplotError
 from .node import Node
-from .series import Series
+from .series import Series, _as_float
 
 
 def estimate_lag(
@@ -38,17 +41,20 @@ def estimate_lag(
     """
     label = f"lag(input={input._label}, output={output._label})"
     nb_steps = len(time)
+    times = time._values
+    input_values = _as_float(input._values)
+    output_values = _as_float(output._values)
     slopes = [np.nan]
     lags = [np.nan]
     fitting_errors = [np.nan]
     dots = np.zeros(3)
     for i in range(nb_steps - 1):
-        dt = time._values[i + 1] - time._values[i]
+        dt = times[i + 1] - times[i]
         if time_constant < 2 * dt:
             logging.warning(
                 "Nyquist-Shannon sampling theorem: "
                 "at time=%f, dt=%f but time_constant=%f",
-                time._values[i],
+                times[i],
                 dt,
                 time_constant,
             )
@@ -56,8 +62,8 @@ def estimate_lag(
             lags.append(np.nan)
             fitting_errors.append(np.nan)
             continue
-        x = input._values[i] - output._values[i]
-        y = output._values[i + 1] - output._values[i]
+        x = input_values[i] - output_values[i]
+        y = output_values[i + 1] - output_values[i]
         if np.isnan(dt) or np.isnan(x) or np.isnan(y):
             slopes.append(np.nan)
             lags.append(np.nan)
@@ -97,8 +103,154 @@ def estimate_lag(
     }
     node.__dict__.update(
         {
-            key: Series(f"{label}/{key}", value, times=time._values)
+            key: Series(f"{label}/{key}", value, times=time._time_index)
             for key, value in children.items()
         }
     )
     return node
+
+
+def _stack_channels(
+    channels: Union[Node, NDArray],
+    keys: Optional[List[Union[str, int]]] = None,
+) -> Tuple[List[Union[str, int]], NDArray]:
+    """Stack the series of a node, or the columns of an array, side by side.
+
+    Args:
+        channels: Node whose children are series, or array with one column
+            per channel.
+        keys: If set, keys of the children of the node to stack, in order.
+
+    Returns:
+        Pair of channel keys and array of shape ``(nb_steps, nb_channels)``.
+    """
+    if isinstance(channels, Node):
+        series = {
+            key: child
+            for key, child in channels._items()
+            if isinstance(child, Series)
+        }
+        if keys is None:
+            keys = list(series.keys())
+        elif set(keys) != set(series.keys()):
+            raise FoxplotError(
+                f"Children {list(series.keys())} of '{channels._label}' "
+                f"do not match channels {keys}"
+            )
+        values = np.stack([series[key]._values for key in keys], axis=1)
+        return keys, _as_float(values)
+    values = _as_float(np.asarray(channels))
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    if values.ndim != 2:
+        raise FoxplotError(f"Expected a 2D array, got shape {values.shape}")
+    return list(range(values.shape[1])), values
+
+
+def estimate_lags(
+    time: Series,
+    inputs: Union[Node, NDArray],
+    outputs: Union[Node, NDArray],
+    time_constants: Sequence[float],
+) -> Node:
+    """Estimate the lags of many input-output pairs and time constants.
+
+    This function computes the same estimates as :func:`estimate_lag` for
+    all pairs of input and output channels and all time constants in a
+    single pass over time, where each step updates all regressions at once.
+
+    Args:
+        time: Times corresponding to inputs and outputs.
+        inputs: Node whose child series are inputs, or array of shape
+            ``(nb_steps, nb_channels)`` with one input per column.
+        outputs: Node whose child series are outputs, with the same keys as
+            inputs, or array with one output per column.
+        time_constants: Time-constants of the estimation's sliding window.
+
+    Returns:
+        Tree of estimates, where ``node[channel][j]`` is the node returned
+        by :func:`estimate_lag` for the channel and ``time_constants[j]``.
+        Channels are keyed like the children of the input node, or by
+        column index for arrays.
+    """
+    input_keys, input_values = _stack_channels(inputs)
+    output_keys, output_values = _stack_channels(
+        outputs, input_keys if isinstance(inputs, Node) else None
+    )
+    if len(input_keys) != len(output_keys):
+        raise FoxplotError(
+            f"Inputs {input_keys} and outputs {output_keys} do not match"
+        )
+    times = time._values
+    nb_steps = len(times)
+    if input_values.shape[0] != nb_steps or output_values.shape[0] != nb_steps:
+        raise FoxplotError("Inputs and outputs should have one row per time")
+    taus = np.asarray(time_constants, dtype=np.float64)[:, np.newaxis]
+    shape = (len(taus), len(input_keys))
+
+    # Time is the last axis so that the values of each series are contiguous
+    slopes = np.full((*shape, nb_steps), np.nan)
+    lags = np.full((*shape, nb_steps), np.nan)
+    fitting_errors = np.full((*shape, nb_steps), np.nan)
+    dot_xx = np.zeros(shape)
+    dot_xy = np.zeros(shape)
+    dot_yy = np.zeros(shape)
+    nb_nyquist = np.zeros(len(taus), dtype=int)
+    for i in range(nb_steps - 1):
+        dt = times[i + 1] - times[i]
+        x = input_values[i] - output_values[i]
+        y = output_values[i + 1] - output_values[i]
+        undersampled = taus < 2 * dt  # Nyquist-Shannon sampling theorem
+        nb_nyquist += undersampled[:, 0]
+        valid = ~undersampled & ~(np.isnan(dt) | np.isnan(x) | np.isnan(y))
+        forgetting_factor = np.exp(-dt / taus)
+        dot_xx = np.where(valid, forgetting_factor * dot_xx + x * x, dot_xx)
+        dot_xy = np.where(valid, forgetting_factor * dot_xy + x * y, dot_xy)
+        dot_yy = np.where(valid, forgetting_factor * dot_yy + y * y, dot_yy)
+        valid &= dot_xx >= 1e-10
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = dot_xy / dot_xx
+        out_of_range = valid & ((slope < 1e-10) | (slope > 0.9999999999))
+        dot_xx[out_of_range] = 0.0
+        dot_xy[out_of_range] = 0.0
+        dot_yy[out_of_range] = 0.0
+        valid &= ~out_of_range
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # slope = 1.0 - exp(-dt / lag)
+            lag = -dt / np.log(1.0 - slope)
+        total_error = slope**2 * dot_xx - 2 * dot_xy * slope + dot_yy
+        # forgetting factor is exp(-dt / time_constant)
+        fitting_error = (1.0 - forgetting_factor) * total_error
+        slopes[:, :, i + 1] = np.where(valid, slope, np.nan)
+        lags[:, :, i + 1] = np.where(valid, lag, np.nan)
+        fitting_errors[:, :, i + 1] = np.where(valid, fitting_error, np.nan)
+    for tau, count in zip(taus[:, 0], nb_nyquist):
+        if count > 0:
+            logging.warning(
+                "Nyquist-Shannon sampling theorem: %d timesteps are longer "
+                "than half of time_constant=%f",
+                count,
+                tau,
+            )
+
+    input_label = inputs._label if isinstance(inputs, Node) else "array"
+    output_label = outputs._label if isinstance(outputs, Node) else "array"
+    root = Node(f"lags(input={input_label}, output={output_label})")
+    children = {
+        "fitting_error": fitting_errors,
+        "lag": lags,
+        "slope": slopes,
+    }
+    for c, channel in enumerate(input_keys):
+        for j, tau in enumerate(taus[:, 0]):
+            label = f"{root._label}/{channel}/{j}"
+            for key, values in children.items():
+                root._insert(
+                    [channel, j, key],
+                    Series(
+                        f"{label}/{key}",
+                        values[j, c],
+                        times=time._time_index,
+                    ),
+                )
+    return root
@@ -6,12 +6,97 @@
 
 """Series data unpacked from input dictionaries."""
 
-from typing import Any, Dict
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
+from numpy.typing import NDArray
 
+from .categorical_series import CategoricalSeries
 from .labeled_series import LabeledSeries
 from .series import Series
+from .sparse_series import SparseSeries, forward_fill
+from .time_index import TimeIndex
+
+if TYPE_CHECKING:
+    from .node import Node
+
+
+def _smallest_int_dtype(low: int, high: int) -> np.dtype:
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(object)
+
+
+def _numeric_array(
+    values: List[Any],
+    missing: bool,
+    float_dtype: Optional[np.dtype] = None,
+) -> NDArray:
+    """Convert numbers to the most compact array that holds them exactly.
+
+    Args:
+        values: List of booleans, integers, floats or ``None``.
+        missing: If set, the output array needs to represent missing values,
+            which rules out boolean and integer arrays.
+        float_dtype: If set, store floating-point values with this type
+            rather than the most compact exact one.
+
+    Returns:
+        Boolean, integer, single- or double-precision array.
+    """
+    kinds = {type(value) for value in values}
+    if kinds == {bool} and not missing:
+        return np.array(values, dtype=bool)
+    if kinds == {int} and not missing:
+        low, high = min(values), max(values)
+        return np.array(values, dtype=_smallest_int_dtype(low, high))
+    array = np.array(
+        [np.nan if value is None else value for value in values],
+        dtype=np.float64,
+    )
+    if float_dtype is not None:
+        return array.astype(float_dtype)
+    return _single_if_exact(array)
+
+
+def _single_if_exact(array: NDArray[np.float64]) -> NDArray:
+    """Convert an array to single precision if no value changes.
+
+    Args:
+        array: Double-precision array, possibly with NaNs.
+
+    Returns:
+        Single-precision array if it represents all values exactly, input
+        array otherwise.
+    """
+    with np.errstate(over="ignore"):
+        single = array.astype(np.float32)
+    if np.all((single == array) | np.isnan(array)):
+        return single
+    return array
+
+
+def _prepend_missing(array: NDArray) -> NDArray:
+    """Prepend the value used before a series receives its first value.
+
+    Args:
+        array: Values received by the series, one per row.
+
+    Returns:
+        Array of values with a missing row at index zero.
+    """
+    extended = np.empty((array.shape[0] + 1, *array.shape[1:]), array.dtype)
+    extended[1:] = array
+    if array.dtype.kind == "f":
+        extended[0] = np.nan
+    elif array.dtype.kind == "O":
+        extended[0] = None
+    else:  # booleans and integers are only used when nothing is missing
+        extended[0] = 0
+    return extended
 
 
 class HotSeries(LabeledSeries):
@@ -19,9 +104,15 @@ class HotSeries(LabeledSeries):
 
     Internally, this datastructure maps time indexes (the corresponding times
     themselves are stored in a different list) to values.
+
+    When data is loaded in the background, users may get a hot series from
+    the data tree before it is frozen. Accessing its series attributes, for
+    instance ``data.foo.deriv()``, then blocks until the series is frozen.
     """
 
+    __frozen: Optional[Union[Series, "Node"]]
     __indexed_values: Dict[int, Any]
+    __ready: threading.Event
 
     def __init__(self, label: str):
         """Initialize a new indexed series.
@@ -30,7 +121,39 @@ class HotSeries(LabeledSeries):
             label: Label of the series in the input data.
         """
         super().__init__(label)
+        self.__frozen = None
         self.__indexed_values = {}
+        self.__ready = threading.Event()
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the frozen series, waiting for it if needed.
+
+        Args:
+            name: Attribute name.
+
+        Returns:
+            Attribute of the frozen series.
+        """
+        if name.startswith("_HotSeries__"):  # not initialized yet
+            raise AttributeError(name)
+        return getattr(self._wait(), name)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the series to pickle it.
+
+        Returns:
+            Label and values of the series.
+        """
+        return {"label": self._label, "indexed_values": self.__indexed_values}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the series from a pickled state.
+
+        Args:
+            state: Label and values of the series.
+        """
+        self.__init__(state["label"])  # type: ignore[misc]
+        self.__indexed_values = state["indexed_values"]
 
     def __len__(self):
         """Length of the indexed series."""
@@ -50,24 +173,145 @@ class HotSeries(LabeledSeries):
         """
         self.__indexed_values[index] = value
 
-    def _freeze(self, max_index: int) -> Series:
-        """Get indexed series as a list of values.
+    def _first_value(self) -> Any:
+        """Get the value received at the smallest time index.
+
+        Returns:
+            First value of the series, or ``None`` if it is empty.
+        """
+        if not self.__indexed_values:
+            return None
+        return self.__indexed_values[min(self.__indexed_values)]
+
+    def _merge(self, other: "HotSeries", offset: int) -> None:
+        """Append the values of a series decoded from a later input.
+
+        Args:
+            other: Series decoded from the later input.
+            offset: Time index of the first dictionary of the later input.
+        """
+        for index, value in other.__indexed_values.items():
+            self.__indexed_values[offset + index] = value
+
+    def _wait(self) -> Union[Series, "Node"]:
+        """Wait until the series is frozen.
+
+        Returns:
+            Frozen series, or node for hot arrays.
+        """
+        self.__ready.wait()
+        assert self.__frozen is not None
+        return self.__frozen
+
+    def _freeze(
+        self,
+        max_index: int,
+        float_dtype: Optional[np.dtype] = None,
+        time_index: Optional[TimeIndex] = None,
+        sparse_threshold: float = 0.0,
+    ) -> Union[Series, "Node"]:
+        """Get indexed series as an array of values.
+
+        The storage type is inferred from all values of the series: booleans,
+        the smallest integer type holding all integers, single precision when
+        it represents all numbers exactly, and dictionary-encoded categories
+        for strings. Other combinations of types are stored as objects.
 
         Args:
-            max_index: The output list will range from 0 (first time from the
+            max_index: The output array will range from 0 (first time from the
                 input) to this maximum index (excluded).
+            float_dtype: If set, store floating-point values with this type
+                rather than the most compact exact one.
+            time_index: Time index shared with other series, if any.
+            sparse_threshold: Non-string series updated in less than this
+                ratio of time indices are stored sparsely.
+
+        Returns:
+            Indexed series as an array of values, where missing values repeat
+            the last value received.
+        """
+        self.__frozen = self._convert(
+            max_index, float_dtype, time_index, sparse_threshold
+        )
+        self.__ready.set()
+        return self.__frozen
+
+    def _received_values(self) -> List[Any]:
+        """Get a copy of the values received so far, in reception order.
 
         Returns:
-            Indexed series as a list of values.
+            Values received so far. The copy is safe to take while values are
+            inserted from another thread.
         """
-        last_value = None
-        values = []
-        for index in range(max_index):
-            last_value = self.__indexed_values.get(index, last_value)
-            values.append(last_value)
-        array = (
-            np.array(values, dtype=np.float64)
-            if isinstance(last_value, (int, float))
-            else np.array(values)
+        return list(self.__indexed_values.values())
+
+    def _sorted_items(self) -> Tuple[NDArray[np.int64], List[Any]]:
+        """Get indexed values sorted by time index.
+
+        Returns:
+            Pair of sorted time indices and their values.
+        """
+        indices = np.fromiter(
+            self.__indexed_values.keys(),
+            dtype=np.int64,
+            count=len(self.__indexed_values),
+        )
+        values = list(self.__indexed_values.values())
+        if np.any(indices[1:] < indices[:-1]):
+            order = np.argsort(indices, kind="stable")
+            indices = indices[order]
+            values = [values[i] for i in order]
+        return indices, values
+
+    def _convert(
+        self,
+        max_index: int,
+        float_dtype: Optional[np.dtype],
+        time_index: Optional[TimeIndex],
+        sparse_threshold: float,
+    ) -> Union[Series, "Node"]:
+        """Convert indexed values to a series, see :func:`_freeze`."""
+        indices, values = self._sorted_items()
+
+        missing = (
+            max_index > 0 and (len(indices) < 1 or indices[0] > 0)
+        ) or any(value is None for value in values)
+
+        kinds = {type(value) for value in values if value is not None}
+        if kinds and kinds <= {str}:
+            categories: Dict[Any, int] = {None: 0} if missing else {}
+            codes = [categories.setdefault(v, len(categories)) for v in values]
+            code_dtype = _smallest_int_dtype(0, len(categories))
+            return CategoricalSeries(
+                label=self._label,
+                codes=forward_fill(
+                    indices,
+                    _prepend_missing(np.array(codes, code_dtype)),
+                    max_index,
+                ),
+                categories=np.array(
+                    list(categories.keys()),
+                    dtype=object if missing else None,
+                ),
+                times=time_index,
+            )
+        if kinds <= {bool, int, float}:
+            array = _numeric_array(values, missing, float_dtype)
+        else:  # mixed types
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+        if len(indices) < sparse_threshold * max_index:
+            return SparseSeries(
+                label=self._label,
+                indices=indices,
+                updates=_prepend_missing(array),
+                length=max_index,
+                times=time_index,
+                float_dtype=float_dtype,
+            )
+        return Series(
+            label=self._label,
+            values=forward_fill(indices, _prepend_missing(array), max_index),
+            times=time_index,
+            float_dtype=float_dtype,
         )
-        return Series(label=self._label, values=array, times=None)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Measurements collected while loading data."""
+
+from typing import Dict, Optional
+
+STAGES = ("read", "decode", "update", "freeze")
+
+
+class IngestStats:
+    """Measurements collected while loading data.
+
+    Attributes:
+        bytes_read: Number of bytes read from the input. MessagePack files
+            are counted once they are entirely decoded.
+        durations: Time spent in each stage of loading, in seconds: reading
+            from the input, decoding dictionaries, updating the data tree with
+            each dictionary, and freezing series to arrays. MessagePack files
+            are read by their decoder, so that reading them counts as
+            decoding.
+        interrupted: Whether loading was interrupted before the end of the
+            input.
+        nb_leaves: Number of series in the data tree.
+        nb_records: Number of dictionaries read from the input.
+        peak_memory: Peak memory allocated while loading, in bytes, if it was
+            measured.
+    """
+
+    bytes_read: int
+    durations: Dict[str, float]
+    interrupted: bool
+    nb_leaves: int
+    nb_records: int
+    peak_memory: Optional[int]
+
+    def __init__(self):
+        """Initialize measurements to zero."""
+        self.bytes_read = 0
+        self.durations = {stage: 0.0 for stage in STAGES}
+        self.interrupted = False
+        self.nb_leaves = 0
+        self.nb_records = 0
+        self.peak_memory = None
+
+    def __repr__(self) -> str:
+        """String representation of the measurements."""
+        return f"Ingest stats: {self.as_dict()}"
+
+    @property
+    def total_duration(self) -> float:
+        """Total time spent loading, in seconds."""
+        return sum(self.durations.values())
+
+    @property
+    def records_per_second(self) -> float:
+        """Average number of dictionaries loaded per second."""
+        duration = self.total_duration
+        return self.nb_records / duration if duration > 0.0 else 0.0
+
+    def as_dict(self) -> dict:
+        """Get measurements as a dictionary.
+
+        Returns:
+            Dictionary of measurements, with durations in seconds and memory
+            sizes in bytes.
+        """
+        return {
+            "bytes_read": self.bytes_read,
+            "durations": dict(self.durations),
+            "interrupted": self.interrupted,
+            "nb_leaves": self.nb_leaves,
+            "nb_records": self.nb_records,
+            "peak_memory": self.peak_memory,
+            "records_per_second": self.records_per_second,
+            "total_duration": self.total_duration,
+        }
+
+    def summary(self) -> str:
+        """Get a human-readable summary of measurements.
+
+        Returns:
+            Multi-line summary.
+        """
+        total = self.total_duration
+        lines = [
+            f"Loaded {self.nb_records} records ({self.bytes_read} bytes) "
+            f"into {self.nb_leaves} series in {total:.3f} s "
+            f"({self.records_per_second:.0f} records/s)"
+            + (" before being interrupted" if self.interrupted else ""),
+        ]
+        for stage, duration in self.durations.items():
+            ratio = 100.0 * duration / total if total > 0.0 else 0.0
+            lines.append(f"- {stage}: {duration:.3f} s ({ratio:.1f}%)")
+        if self.peak_memory is not None:
+            lines.append(f"- peak memory: {self.peak_memory / 1e6:.1f} MB")
+        return "\n".join(lines)
@@ -6,11 +6,141 @@
 
 """Internal node used to access data in interactive mode."""
 
-from typing import Any, Dict, List, Union, cast
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
+import numpy as np
+from numpy.typing import NDArray
+
+from .cache import _identify, transform_cache
+from .categorical_series import CategoricalSeries
 from .exceptions import FoxplotError
-from .hot_series import HotSeries
-from .series import Series
+from .hot_series import (
+    HotSeries,
+    _prepend_missing,
+    _single_if_exact,
+    _smallest_int_dtype,
+)
+from .parallel import parallel_map
+from .series import (
+    UNIT_TO_SECONDS,
+    Series,
+    _as_float,
+    _operator_label,
+    _requested_dtype,
+)
+from .sparse_series import forward_fill
+from .time_index import TimeIndex
+
+Path = List[Union[str, int]]
+
+
+def _numeric_shape(value: Any) -> Optional[Tuple[int, ...]]:
+    """Get the shape of a nested list of numbers.
+
+    Args:
+        value: Value from an input dictionary.
+
+    Returns:
+        Shape of the array of the value if it is a non-empty list of numbers,
+        or of nested lists of numbers with the same shape, ``None`` otherwise.
+    """
+    if not isinstance(value, list) or not value:
+        return None
+    if all(type(item) in (bool, int, float) for item in value):
+        return (len(value),)
+    shapes = {_numeric_shape(item) for item in value}
+    shape = shapes.pop()
+    if shapes or shape is None:
+        return None
+    return (len(value), *shape)
+
+
+def _compact_array(
+    array: NDArray, missing: bool, float_dtype: Optional[np.dtype] = None
+) -> NDArray:
+    """Convert a numeric array to the most compact type that holds it exactly.
+
+    This is :func:`hot_series._numeric_array` for arrays of any shape.
+
+    Args:
+        array: Boolean, integer or floating-point array.
+        missing: If set, the output array needs to represent missing values,
+            which rules out boolean and integer arrays.
+        float_dtype: If set, store floating-point values with this type
+            rather than the most compact exact one.
+
+    Returns:
+        Boolean, integer, single- or double-precision array.
+    """
+    if array.dtype.kind == "b" and not missing:
+        return array
+    if array.dtype.kind in "iu" and not missing and array.size > 0:
+        low, high = int(array.min()), int(array.max())
+        return array.astype(_smallest_int_dtype(low, high))
+    array = array.astype(np.float64)
+    if float_dtype is not None:
+        return array.astype(float_dtype)
+    return _single_if_exact(array)
+
+
+def _deriv_rows(
+    times: NDArray[np.float64],
+    timesteps: NDArray[np.float64],
+    values: NDArray,
+    cutoff_period: float,
+) -> NDArray[np.float64]:
+    """Time-derivatives of the rows of an array, with low-pass filtering.
+
+    This is the computation of :func:`Series.deriv` applied to all rows at
+    once, with outputs in value units per second.
+
+    Args:
+        times: Time values, one per column.
+        timesteps: Durations between consecutive time values.
+        values: Array with one series per row.
+        cutoff_period: Cutoff period of low-pass filtering, in seconds.
+
+    Returns:
+        Array of derivatives with the same shape as values.
+    """
+    nb_rows, nb_steps = values.shape
+    with np.errstate(divide="ignore", invalid="ignore"):
+        finite_diffs = np.diff(values, axis=1) / timesteps
+    for step in np.flatnonzero(timesteps < 0.0):
+        logging.warning(
+            "Invalid timestep dt=%f at time=%f", timesteps[step], times[step]
+        )
+    finite_diffs[:, timesteps < 0.0] = np.nan
+    filtered = ~(timesteps < 0.0)
+    if np.any(cutoff_period >= 2 * timesteps[filtered]):
+        first = int(np.argmax(filtered))  # first valid step starts filter
+        output = finite_diffs[:, first].copy()
+        for i in range(first + 1, nb_steps - 1):
+            dt = timesteps[i]
+            if dt < 0.0:
+                continue
+            if cutoff_period < 2 * dt:  # Nyquist-Shannon sampling theorem
+                output = finite_diffs[:, i].copy()
+            else:  # low-pass filtering
+                gamma = 1.0 - np.exp(-dt / cutoff_period)
+                output += gamma * (finite_diffs[:, i] - output)
+                finite_diffs[:, i] = output
+    outputs = np.empty((nb_rows, nb_steps))
+    outputs[:, :-1] = finite_diffs
+    outputs[:, -1] = finite_diffs[:, -1]
+    return outputs
 
 
 class Node:
@@ -38,11 +168,104 @@ class Node:
         """String representation of the node."""
         keys = ", ".join(
             str(key)
-            for key in self.__dict__
+            for key in list(self.__dict__)  # may grow while loading
             if isinstance(key, int) or not key.startswith("_")
         )
         return f"{self._label}: [{keys}]"
 
+    def __add__(self, other: Union[float, Series, "Node"]) -> "Node":
+        """Sum of all series of the node with a scalar, series or node.
+
+        Args:
+            other: Scalar, series added to each series of the node, or node
+                with the same structure.
+        """
+        return self.__arithmetic("+", np.add, other)
+
+    def __sub__(self, other: Union[float, Series, "Node"]) -> "Node":
+        """Difference between all series of the node and another operand.
+
+        Args:
+            other: Scalar, series subtracted from each series of the node,
+                or node with the same structure.
+        """
+        return self.__arithmetic("-", np.subtract, other)
+
+    def __mul__(self, other: Union[float, Series, "Node"]) -> "Node":
+        """Elementwise product of all series of the node with an operand.
+
+        Args:
+            other: Scalar, series multiplied with each series of the node,
+                or node with the same structure.
+        """
+        return self.__arithmetic("*", np.multiply, other)
+
+    def __truediv__(self, other: Union[float, Series, "Node"]) -> "Node":
+        """Elementwise ratio between all series of the node and an operand.
+
+        Args:
+            other: Scalar, series dividing each series of the node, or node
+                with the same structure.
+        """
+        return self.__arithmetic("/", np.true_divide, other)
+
+    def __neg__(self) -> "Node":
+        """Unitary minus applied to all series of the node."""
+        paths, leaves, values = self._stack()
+        return self.__unstack(
+            f"-{self._label}",
+            paths,
+            [f"-{leaf._label}" for leaf in leaves],
+            -values,
+            leaves[0]._time_index,
+            _requested_dtype(*leaves),
+        )
+
+    def __arithmetic(self, op: str, ufunc, other) -> "Node":
+        """Apply an arithmetic operator to all numeric series of the node.
+
+        Args:
+            op: Symbol of the operator, used in output labels.
+            ufunc: NumPy ufunc of the operator.
+            other: Scalar, series or node with the same structure.
+
+        Returns:
+            Node of results with the same structure as this node.
+        """
+        paths, leaves, values = self._stack()
+        other_values: Any
+        operands: List[Any] = [*leaves]
+        if isinstance(other, Node):
+            other_paths, other_leaves, other_values = other._stack()
+            if other_paths != paths:
+                raise FoxplotError(
+                    f"Nodes '{self._label}' and '{other._label}' do not "
+                    "have the same series"
+                )
+            other_labels = [leaf._label for leaf in other_leaves]
+            operands.extend(other_leaves)
+        elif isinstance(other, Series):
+            other_values = _as_float(other._values)[np.newaxis, :]
+            other_labels = [other._label] * len(leaves)
+            operands.append(other)
+        elif isinstance(other, (int, float, np.number)):
+            other_values = other
+            other_labels = [str(other)] * len(leaves)
+        else:
+            return NotImplemented
+        other_label = getattr(other, "_label", str(other))
+        return self.__unstack(
+            _operator_label(op, self._label, other_label),
+            paths,
+            [
+                _operator_label(op, leaf._label, label)
+                for leaf, label in zip(leaves, other_labels)
+            ],
+            ufunc(values, other_values),
+            leaves[0]._time_index,
+            _requested_dtype(*operands),
+        )
+
     def _get_child(self, keys: List[str]) -> Series:
         """Get leaf descendant in the tree from a list of keys.
 
@@ -56,21 +279,271 @@ class Node:
             raise FoxplotError(f"{child._label} is not a time series")
         return child
 
+    def _insert(self, keys: List[Union[str, int]], series: Series) -> None:
+        """Insert a series in the tree, creating intermediate nodes.
+
+        Args:
+            keys: List of keys uniquely identifying the series.
+            series: Series to insert.
+        """
+        # Explicitly signal to the type checker that keys can be integers
+        self_dict = cast(Dict[Union[str, int], Any], self.__dict__)
+        if len(keys) == 1:
+            self_dict[keys[0]] = series
+            return
+        if keys[0] not in self_dict:
+            sep = "/" if not self._label.endswith("/") else ""
+            self_dict[keys[0]] = Node(f"{self._label}{sep}{keys[0]}")
+        self_dict[keys[0]]._insert(keys[1:], series)
+
     def _items(self):
-        for key, child in self.__dict__.items():
+        # Copy items as keys may be added while loading in the background
+        for key, child in list(self.__dict__.items()):
             if isinstance(key, str) and key.startswith("_"):
                 continue
             yield (key, child)
 
+    def _leaves(self) -> Generator[Series, None, None]:
+        """Iterate over all series in the tree rooted at this node.
+
+        Yields:
+            Series in depth-first order.
+        """
+        for _, child in self._items():
+            if isinstance(child, Series):
+                yield child
+            elif isinstance(child, Node):
+                yield from child._leaves()
+
     def _list_labels(self) -> List[str]:
         """List all labels reachable from this node."""
         labels = []
-        for key, child in self.__dict__.items():
+        for key, child in list(self.__dict__.items()):
             if isinstance(key, int) or key.startswith("_"):
                 continue
             labels.extend(child._list_labels())
         return labels
 
+    def _map(
+        self,
+        function: Callable[[Series], Any],
+        workers: Optional[int] = 1,
+    ) -> "Node":
+        """Apply a function to all series in the tree rooted at this node.
+
+        Args:
+            function: Function applied to each series.
+            workers: Number of threads applying the function, see
+                :func:`parallel_map`. Series are processed in the calling
+                thread by default.
+
+        Returns:
+            New tree with the same structure, where each series is replaced
+            by the output of the function.
+        """
+        node = Node(self._label)
+        targets: List[Tuple[Node, Union[str, int], Series]] = []
+
+        def visit(source: Node, target: Node) -> None:
+            for key, child in source._items():
+                if isinstance(child, Series):
+                    targets.append((target, key, child))
+                elif isinstance(child, Node):
+                    target.__dict__[key] = Node(child._label)
+                    visit(child, target.__dict__[key])
+
+        visit(self, node)
+        outputs = parallel_map(
+            function, [series for _, _, series in targets], workers
+        )
+        for (target, key, _), output in zip(targets, outputs):
+            target.__dict__[key] = output  # type: ignore[index]
+        return node
+
+    def _merge(self, other: "Node", offset: int) -> None:
+        """Append a tree of series decoded from a later input.
+
+        Args:
+            other: Tree decoded from the later input.
+            offset: Time index of the first dictionary of the later input.
+        """
+        # Explicitly signal to the type checker that keys can be integers
+        self_dict = cast(Dict[Union[str, int], Any], self.__dict__)
+        for key, child in other._items():
+            if key not in self_dict:
+                ChildClass = (
+                    type(child) if isinstance(child, HotSeries) else Node
+                )
+                self_dict[key] = ChildClass(label=child._label)
+            mine = self_dict[key]
+            if isinstance(mine, HotArray) and type(child) is Node:
+                node = Node(mine._label)  # lists became ragged
+                mine._replay(node)
+                self_dict[key] = mine = node
+            if type(mine) is Node and isinstance(child, HotArray):
+                child._replay(mine, offset)
+                continue
+            if isinstance(mine, HotSeries) and isinstance(child, HotSeries):
+                mine._merge(child, offset)  # lists or numbers, or both
+                continue
+            if type(mine) is not type(child):
+                logging.warning(
+                    "Skipping '%s' as it is both a node and a series",
+                    child._label,
+                )
+                continue
+            mine._merge(child, offset)
+
+    def _stack(self) -> Tuple[List[Path], List[Series], NDArray]:
+        """Stack the numeric series of the tree rooted at this node.
+
+        The stacked array is kept in the cache of series transforms, keyed
+        on the identities and versions of the series, so that consecutive
+        transforms of the node do not stack again.
+
+        Returns:
+            Tuple of the path to each series from this node, the series, and
+            a contiguous array with the values of one series per row, in
+            double precision.
+        """
+        paths: List[Path] = []
+        leaves: List[Series] = []
+
+        def visit(node: Node, path: Path) -> None:
+            for key, child in node._items():
+                if isinstance(child, Node):
+                    visit(child, path + [key])
+                elif isinstance(child, Series) and not isinstance(
+                    child, CategoricalSeries
+                ):
+                    if child._dtype.kind in "biuf":
+                        paths.append(path + [key])
+                        leaves.append(child)
+
+        visit(self, [])
+        if not leaves:
+            raise FoxplotError(f"Node '{self._label}' has no numeric series")
+        time_index = leaves[0]._time_index
+        for leaf in leaves[1:]:
+            if leaf._time_index is not time_index:
+                raise FoxplotError(
+                    f"Series '{leaf._label}' and '{leaves[0]._label}' do "
+                    "not share the same time index"
+                )
+        identities = [_identify(leaf) for leaf in leaves]
+        key = ("Node._stack", tuple(leaf_key for leaf_key, _ in identities))
+        values = transform_cache.get(key)
+        if values is None:
+            values = _as_float(np.stack([leaf._values for leaf in leaves]))
+            sources = tuple(ref for _, refs in identities for ref in refs)
+            transform_cache.put(key, values, sources)
+        return paths, leaves, values
+
+    def __unstack(
+        self,
+        label: str,
+        paths: List[Path],
+        labels: List[str],
+        values: NDArray,
+        time_index: TimeIndex,
+        float_dtype: Optional[np.dtype],
+    ) -> "Node":
+        """Build a node of results from an array with one series per row.
+
+        Args:
+            label: Label of the output node.
+            paths: Path to each output series from the output node.
+            labels: Label of each output series.
+            values: Array of results, one series per row.
+            time_index: Time index shared by output series.
+            float_dtype: Floating-point type requested for output series, or
+                ``None`` to keep them in double precision.
+
+        Returns:
+            Node of output series, whose values are rows of the array.
+        """
+        if float_dtype is not None and values.dtype.kind == "f":
+            values = values.astype(float_dtype, copy=False)  # all rows at once
+        node = Node(label)
+        for path, series_label, row in zip(paths, labels, values):
+            node._insert(
+                path, Series(series_label, row, time_index, float_dtype)
+            )
+        return node
+
+    def abs(self) -> "Node":
+        """Absolute values of all numeric series of the node.
+
+        Returns:
+            Node of absolute values with the same structure as this node.
+        """
+        paths, leaves, values = self._stack()
+        return self.__unstack(
+            f"abs({self._label})",
+            paths,
+            [f"abs({leaf._label})" for leaf in leaves],
+            np.abs(values),
+            leaves[0]._time_index,
+            _requested_dtype(*leaves),
+        )
+
+    def deriv(
+        self,
+        unit: Literal["s", "M", "H", "d", "m", "y"],
+        cutoff: float = 0.0,
+    ) -> "Node":
+        """Time-derivatives of all numeric series of the node.
+
+        Args:
+            unit: Time unit of derivatives, as in :func:`Series.deriv`.
+            cutoff: Cutoff period of low-pass filtering, in the time unit.
+
+        Returns:
+            Node of derivatives with the same structure as this node.
+        """
+        paths, leaves, values = self._stack()
+        times = leaves[0]._times
+        if times is None:
+            raise FoxplotError(f"Unset time values for node '{self._label}'")
+        scale = UNIT_TO_SECONDS[unit]
+        timesteps = leaves[0]._time_index.timesteps
+        outputs = _deriv_rows(times, timesteps, values, scale * cutoff)
+        outputs *= scale
+        suffix = f", unit={unit}"
+        if cutoff > 1e-10:
+            suffix += f", cutoff={cutoff} {unit}"
+        return self.__unstack(
+            f"deriv({self._label}{suffix})",
+            paths,
+            [f"deriv({leaf._label}{suffix})" for leaf in leaves],
+            outputs,
+            leaves[0]._time_index,
+            _requested_dtype(*leaves),
+        )
+
+    def std(self, window_size: int) -> "Node":
+        """Rolling standard deviations of all numeric series of the node.
+
+        Args:
+            window_size: Size of the rolling window in which to compute
+                standard deviations.
+
+        Returns:
+            Node of standard deviations with the same structure as this node.
+        """
+        paths, leaves, values = self._stack()
+        windows = np.lib.stride_tricks.sliding_window_view(
+            values, window_size, axis=1
+        )
+        return self.__unstack(
+            f"std({self._label}, {window_size})",
+            paths,
+            [f"std({leaf._label}, {window_size})" for leaf in leaves],
+            np.std(windows, axis=-1),
+            leaves[0]._time_index,
+            _requested_dtype(*leaves),
+        )
+
     def _update(self, index: int, unpacked: Union[None, dict, list]) -> None:
         """Update node from a new unpacked dictionary.
 
@@ -93,16 +566,164 @@ class Node:
             else:  # key not in self.__dict__
                 sep = "/" if not self._label.endswith("/") else ""
                 is_primitive = not isinstance(value, (dict, list))
-                ChildClass = HotSeries if is_primitive else Node
+                ChildClass = (
+                    HotSeries
+                    if is_primitive
+                    else HotArray
+                    if _numeric_shape(value) is not None
+                    else Node
+                )
                 child = ChildClass(label=f"{self._label}{sep}{key}")
                 self_dict[key] = child
             child._update(index, value)
 
-    def _freeze(self, max_index: int) -> None:
+    def _freeze(
+        self,
+        max_index: int,
+        float_dtype: Optional[np.dtype] = None,
+        time_index: Optional[TimeIndex] = None,
+        sparse_threshold: float = 0.0,
+    ) -> None:
+        """Convert all series that are still receiving values to arrays.
+
+        Args:
+            max_index: Number of values in each output series.
+            float_dtype: If set, store floating-point values with this type.
+            time_index: Time index shared by all output series. A new one is
+                created for the tree if not provided.
+            sparse_threshold: Series updated in less than this ratio of time
+                indices are stored sparsely.
+        """
+        if time_index is None:
+            time_index = TimeIndex()
         update = {}
         for key, child in self.__dict__.items():
             if isinstance(child, HotSeries):
-                update[key] = child._freeze(max_index)
+                update[key] = child._freeze(
+                    max_index, float_dtype, time_index, sparse_threshold
+                )
             elif isinstance(child, Node):
-                child._freeze(max_index)
+                child._freeze(
+                    max_index, float_dtype, time_index, sparse_threshold
+                )
         self.__dict__.update(update)
+
+
+class ArrayNode(Node):
+    """Node whose series are the columns of a single array.
+
+    Attributes:
+        _array: Array with one row per time index. Its columns are the values
+            of the child series, or of child nodes for nested lists.
+    """
+
+    _array: NDArray
+
+    def __init__(
+        self,
+        label: str,
+        array: NDArray,
+        time_index: Optional[TimeIndex] = None,
+        float_dtype: Optional[np.dtype] = None,
+    ):
+        """Initialize node from an array of two or more dimensions.
+
+        Args:
+            label: Node label.
+            array: Array with one row per time index.
+            time_index: Time index shared by child series.
+            float_dtype: Floating-point type requested for results computed
+                from child series, if any.
+        """
+        super().__init__(label)
+        self._array = array
+        sep = "/" if not label.endswith("/") else ""
+        for i in range(array.shape[1]):
+            column = array[:, i]  # view, not a copy
+            child_label = f"{label}{sep}{i}"
+            self.__dict__[i] = (  # type: ignore[index]
+                Series(child_label, column, time_index, float_dtype)
+                if column.ndim == 1
+                else ArrayNode(child_label, column, time_index, float_dtype)
+            )
+
+
+class HotArray(HotSeries):
+    """Hot series of lists of numbers, frozen to a single array.
+
+    Each input dictionary stores its whole list at once, rather than one
+    value per component. The frozen output is an :class:`ArrayNode` whose
+    components are views on the same array, so that ``data.scan[17]`` is
+    still a series.
+
+    Lists that turn out to be ragged or to contain other types than numbers
+    are frozen to regular nodes, one series per component. Series that also
+    receive values other than lists are frozen like regular hot series.
+    """
+
+    def __getitem__(self, key: int) -> Union[Series, Node]:
+        """Get a component of the frozen node, waiting for it if needed.
+
+        Args:
+            key: Index of the component in the lists.
+        """
+        frozen = self._wait()
+        if not isinstance(frozen, Node):
+            raise FoxplotError(f"{self._label} is not a node")
+        return frozen[key]
+
+    def _update(self, index: int, value: Any) -> None:
+        """Update the list at a given time index.
+
+        Args:
+            index: Time index.
+            value: New list, or ``None`` to keep the previous one.
+        """
+        if value is not None:
+            super()._update(index, value)
+
+    def _replay(self, node: Node, offset: int = 0) -> None:
+        """Update a regular node with all lists of the series.
+
+        Args:
+            node: Node to update.
+            offset: Offset added to time indices.
+        """
+        indices, values = self._sorted_items()
+        for index, value in zip(indices.tolist(), values):
+            node._update(offset + index, value)
+
+    def _convert(
+        self,
+        max_index: int,
+        float_dtype: Optional[np.dtype],
+        time_index: Optional[TimeIndex],
+        sparse_threshold: float,
+    ) -> Union[Series, Node]:
+        """Convert lists to a node, see :func:`HotSeries._freeze`.
+
+        Arrays are always stored densely, regardless of the sparse threshold,
+        which only applies to series of the regular node fallback.
+        """
+        indices, values = self._sorted_items()
+        if not all(isinstance(value, list) for value in values):
+            return super()._convert(
+                max_index, float_dtype, time_index, sparse_threshold
+            )
+        try:
+            array = np.array(values)
+        except (OverflowError, ValueError):  # ragged lists
+            array = np.empty(0, dtype=object)
+        if array.ndim < 2 or array.dtype.kind not in "biuf":
+            node = Node(self._label)
+            self._replay(node)
+            node._freeze(max_index, float_dtype, time_index, sparse_threshold)
+            return node
+        missing = max_index > 0 and (len(indices) < 1 or indices[0] > 0)
+        array = _compact_array(array, missing, float_dtype)
+        return ArrayNode(
+            self._label,
+            forward_fill(indices, _prepend_missing(array), max_index),
+            time_index,
+            float_dtype,
+        )
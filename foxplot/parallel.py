@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Thread pool for per-series computations."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+Input = TypeVar("Input")
+Output = TypeVar("Output")
+
+
+def parallel_map(
+    function: Callable[[Input], Output],
+    items: Iterable[Input],
+    workers: Optional[int] = None,
+) -> List[Output]:
+    """Apply a function to items in a pool of threads.
+
+    NumPy releases the global interpreter lock in most array operations, so
+    that functions computing on series values run concurrently on several
+    cores.
+
+    Args:
+        function: Function applied to each item.
+        items: Items to apply the function to.
+        workers: Number of threads. Defaults to the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`. Items are
+            processed in the calling thread when set to one.
+
+    Returns:
+        Outputs of the function, in the same order as the items.
+    """
+    items = list(items)
+    if len(items) < 2 or (workers is not None and workers <= 1):
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Report progress while loading data."""
+
+import sys
+from time import perf_counter
+from typing import Optional, TextIO
+
+
+def _format_bytes(nb_bytes: float) -> str:
+    for unit in ("B", "kB", "MB", "GB"):
+        if nb_bytes < 1000.0:
+            return f"{nb_bytes:.1f} {unit}"
+        nb_bytes /= 1000.0
+    return f"{nb_bytes:.1f} TB"
+
+
+class Progress:
+    """Progress report of bytes consumed while loading data.
+
+    Reports are written on a single line, refreshed at most once per period.
+    """
+
+    __last_report: float
+    __start: float
+    file: TextIO
+    period: float
+    total_bytes: Optional[int]
+
+    def __init__(
+        self,
+        total_bytes: Optional[int],
+        file: Optional[TextIO] = None,
+        period: float = 0.2,
+    ):
+        """Start reporting progress.
+
+        Args:
+            total_bytes: Total number of bytes to consume, if known.
+            file: Stream to write reports to, by default the standard error.
+            period: Minimum duration between two reports, in seconds.
+        """
+        self.__start = perf_counter()
+        self.__last_report = self.__start
+        self.file = file if file is not None else sys.stderr
+        self.period = period
+        self.total_bytes = total_bytes
+
+    def format(self, bytes_read: int, nb_records: int, elapsed: float) -> str:
+        """Format a progress report.
+
+        Args:
+            bytes_read: Number of bytes consumed so far.
+            nb_records: Number of records loaded so far.
+            elapsed: Time elapsed since loading started, in seconds.
+
+        Returns:
+            Progress report.
+        """
+        rate = nb_records / elapsed if elapsed > 0.0 else 0.0
+        report = f"Loaded {nb_records} records ({_format_bytes(bytes_read)}"
+        if self.total_bytes:
+            ratio = min(bytes_read / self.total_bytes, 1.0)
+            report += (
+                f" / {_format_bytes(self.total_bytes)}, {100.0 * ratio:.1f}%"
+            )
+        report += f") at {rate:.0f} records/s"
+        if self.total_bytes and 0.0 < bytes_read < self.total_bytes:
+            eta = elapsed * (self.total_bytes - bytes_read) / bytes_read
+            report += f", ETA {eta:.0f} s"
+        return report
+
+    def update(self, bytes_read: int, nb_records: int) -> None:
+        """Report progress if the last report is older than the period.
+
+        Args:
+            bytes_read: Number of bytes consumed so far.
+            nb_records: Number of records loaded so far.
+        """
+        now = perf_counter()
+        if now - self.__last_report < self.period:
+            return
+        self.__last_report = now
+        report = self.format(bytes_read, nb_records, now - self.__start)
+        self.file.write(f"\r{report}\033[K")
+        self.file.flush()
+
+    def close(self, bytes_read: int, nb_records: int) -> None:
+        """Write the final report and end its line.
+
+        Args:
+            bytes_read: Number of bytes consumed in total.
+            nb_records: Number of records loaded in total.
+        """
+        elapsed = perf_counter() - self.__start
+        report = self.format(bytes_read, nb_records, elapsed)
+        self.file.write(f"\r{report}\033[K\n")
+        self.file.flush()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Render plots to HTML files without opening them."""
+
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Label of the time values in plot data.
+TIME_LABEL = "#time"
+
+# Name of the JavaScript variable holding shared plot data.
+PAYLOAD_VARIABLE = "foxplotData"
+
+
+class PlotPage:
+    """Everything needed to render a plot to an HTML page.
+
+    Attributes:
+        arrays: Arrays of the plot, starting with time values, or ``None``
+            when they are read from a shared data payload.
+        labels: Label of each array, starting with :data:`TIME_LABEL`.
+        nb_left: Number of series on the left axis, whose arrays follow
+            time values, before those of the right axis.
+        series: uPlot series options.
+        timestamped: If set, time values are treated as timestamps.
+        title: Plot title.
+    """
+
+    arrays: Optional[List[NDArray]]
+    labels: List[str]
+    nb_left: int
+    series: List[dict]
+    timestamped: bool
+    title: str
+
+    def __init__(
+        self,
+        title: str,
+        labels: List[str],
+        arrays: Optional[List[NDArray]],
+        nb_left: int,
+        series: List[dict],
+        timestamped: bool,
+    ):
+        """Initialize page.
+
+        Args:
+            title: Plot title.
+            labels: Label of each array, starting with :data:`TIME_LABEL`.
+            arrays: Arrays of the plot, starting with time values.
+            nb_left: Number of series on the left axis.
+            series: uPlot series options.
+            timestamped: If set, time values are treated as timestamps.
+        """
+        self.arrays = arrays
+        self.labels = labels
+        self.nb_left = nb_left
+        self.series = series
+        self.timestamped = timestamped
+        self.title = title
+
+
+def render_html(
+    page: PlotPage,
+    payload: Optional[str] = None,
+    payload_indices: Optional[Dict[str, int]] = None,
+) -> str:
+    """Render a plot to an HTML page.
+
+    The options of the plot are those of :func:`uplot.plot2`.
+
+    Args:
+        page: Plot to render.
+        payload: If set, path of the shared data payload, relative to the
+            page, to read plot data from rather than embedding it.
+        payload_indices: Index of each label in the shared data payload.
+
+    Returns:
+        HTML contents of the page.
+    """
+    from uplot.generate_html import generate_html
+    from uplot.plot2 import add_axes, add_default_options
+
+    opts: dict = {"series": page.series}
+    add_default_options(opts)
+    opts["id"] = "chart1"
+    opts["title"] = page.title
+    opts["scales"] = {"x": {"time": page.timestamped}}
+    add_axes(opts)
+    if payload is None:
+        assert page.arrays is not None
+        return generate_html(opts, page.arrays, resize=True)
+    assert payload_indices is not None
+    html = generate_html(opts, [], resize=True)
+    html = html.replace(
+        "</head>", f'    <script src="{payload}"></script>\n    </head>', 1
+    )
+    refs = ", ".join(
+        f"{PAYLOAD_VARIABLE}[{payload_indices[label]}]"
+        for label in page.labels
+    )
+    return html.replace(
+        "let opts = ", f"data = [{refs}];\n\n            let opts = ", 1
+    )
+
+
+def write_page(
+    page: PlotPage,
+    path: str,
+    payload: Optional[str] = None,
+    payload_indices: Optional[Dict[str, int]] = None,
+) -> str:
+    """Render a plot to an HTML file.
+
+    Args:
+        page: Plot to render.
+        path: Path to the output file.
+        payload: If set, path of the shared data payload, relative to the
+            page, to read plot data from rather than embedding it.
+        payload_indices: Index of each label in the shared data payload.
+
+    Returns:
+        Path to the output file.
+    """
+    html = render_html(page, payload, payload_indices)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(html)
+    return path
+
+
+def write_payload(path: str, arrays: Sequence[NDArray]) -> None:
+    """Write data shared by several pages to a JavaScript file.
+
+    Args:
+        path: Path to the output file.
+        arrays: Arrays to write, referred to by their index in pages.
+    """
+    from uplot.utils import array2string
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"const {PAYLOAD_VARIABLE} = [\n")
+        for array in arrays:
+            file.write(f"{array2string(np.asarray(array))},\n")
+        file.write("];\n")
+
+
+def page_path(directory: str, name: str) -> str:
+    """Get the path to the HTML file of a page.
+
+    Args:
+        directory: Output directory.
+        name: Page name, with or without the ``.html`` extension.
+
+    Returns:
+        Path to the HTML file.
+    """
+    if not name.endswith(".html"):
+        name += ".html"
+    return os.path.join(directory, name)
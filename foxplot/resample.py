@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Vectorized resampling and interpolation of time series values."""
+
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .exceptions import FoxplotError
+
+Aggregation = Literal["mean", "last", "min", "max"]
+
+Interpolation = Literal["linear", "zoh"]
+
+
+def resample_values(
+    times: NDArray[np.float64],
+    values: NDArray,
+    bin_starts: NDArray[np.float64],
+    how: Aggregation,
+) -> NDArray:
+    """Aggregate values over consecutive time bins.
+
+    Args:
+        times: Sorted time values of the input series.
+        values: Values of the input series.
+        bin_starts: Sorted start times of the output bins, the first of which
+            should not be after the first input time. Each bin ends where
+            the next one starts, and the last bin spans until the end of
+            the input.
+        how: Aggregation function applied to values in each bin: "mean",
+            "min" or "max" of these values, or the "last" value received
+            so far, which holds the previous value over empty bins.
+
+    Returns:
+        Aggregated values, one per bin. Empty bins are NaN for all
+        aggregations except "last".
+    """
+    starts = np.searchsorted(times, bin_starts, side="left")
+    ends = np.append(starts[1:], len(times))
+    if how == "last":
+        return values[np.maximum(ends - 1, 0)]
+    reduce = {
+        "max": np.maximum.reduceat,
+        "mean": np.add.reduceat,
+        "min": np.minimum.reduceat,
+    }.get(how)
+    if reduce is None:
+        raise FoxplotError(f"Unknown aggregation '{how}'")
+    counts = ends - starts
+    nonempty = counts > 0
+    output = np.full(len(bin_starts), np.nan)
+    if how == "mean" and values.dtype.kind in "biu":
+        values = values.astype(np.float64)  # sums of integers may overflow
+    reduced = reduce(values, starts[nonempty])
+    if how == "mean":
+        reduced = reduced / counts[nonempty]
+    output[nonempty] = reduced
+    return output
+
+
+def interpolate_values(
+    times: NDArray[np.float64],
+    values: NDArray,
+    new_times: NDArray[np.float64],
+    method: Interpolation,
+) -> NDArray:
+    """Interpolate values at new times.
+
+    Args:
+        times: Sorted time values of the input series.
+        values: Values of the input series.
+        new_times: Times at which to interpolate values.
+        method: Either "linear" interpolation between surrounding values, or
+            "zoh" (zero-order hold) to repeat the last value received.
+
+    Returns:
+        Interpolated values, NaN at times before the first input time, and
+        also after the last input time for linear interpolation.
+    """
+    if method == "linear":
+        return np.interp(new_times, times, values, left=np.nan, right=np.nan)
+    if method != "zoh":
+        raise FoxplotError(f"Unknown interpolation method '{method}'")
+    indices = np.searchsorted(times, new_times, side="right") - 1
+    output = values[np.maximum(indices, 0)]
+    if np.any(indices < 0):
+        output = output.astype(np.result_type(output.dtype, np.float64))
+        output[indices < 0] = np.nan
+    return output
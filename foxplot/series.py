@@ -8,13 +8,47 @@
 
 import logging
 from os.path import commonprefix
-from typing import Dict, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 from numpy.typing import NDArray
 
+from .cache import memoize
+from .events import (
+    Direction,
+    crossing_indices,
+    debounce,
+    hysteresis_state,
+)
 from .exceptions import FoxplotError
 from .labeled_series import LabeledSeries
+from .resample import (
+    Aggregation,
+    Interpolation,
+    interpolate_values,
+    resample_values,
+)
+from .spectral import (
+    Window,
+    amplitude_spectrum,
+    make_uniform,
+    spectrogram,
+    welch,
+)
+from .time_index import TimeIndex
+
+if TYPE_CHECKING:
+    from .expression import Expression
+    from .node import Node
 
 UNIT_TO_SECONDS: Dict[str, float] = {
     "s": 1.0,
@@ -32,92 +66,349 @@ def _operator_label(op: str, label: str, other_label: str) -> str:
     return f"{prefix}({label[n:]} {op} {other_label[n:]})"
 
 
+def _as_float(values: NDArray) -> NDArray:
+    """Promote compactly stored values to double precision.
+
+    Booleans, integers and floats are stored in the smallest type that holds
+    them exactly, in which sums, differences or quotients may overflow, be
+    undefined or lose precision, so they are promoted before any arithmetic.
+
+    Args:
+        values: Array of values.
+
+    Returns:
+        Double-precision copy of boolean, integer and single-precision
+        values, other values unchanged.
+    """
+    if values.dtype.kind in "biu" or (
+        values.dtype.kind == "f" and values.dtype.itemsize < 8
+    ):
+        return values.astype(np.float64)
+    return values
+
+
+def _requested_dtype(*operands: Any) -> Optional[np.dtype]:
+    """Floating-point type requested for results computed from operands.
+
+    Args:
+        operands: Series, or other values, the result is computed from.
+
+    Returns:
+        Floating-point type requested by the user for any of the operand
+        series, or ``None`` to keep results in double precision.
+    """
+    dtypes = [
+        operand._float_dtype
+        for operand in operands
+        if isinstance(operand, Series) and operand._float_dtype is not None
+    ]
+    return np.result_type(*dtypes) if dtypes else None
+
+
 class Series(LabeledSeries):
-    """Front class for time-series that users interact with."""
+    """Front class for time-series that users interact with.
 
-    _times: Optional[NDArray[np.float64]]
-    _values: NDArray[np.float64]
+    Attributes:
+        _float_dtype: Floating-point type requested for the values of the
+            series and of results computed from it, or ``None`` if results
+            are computed and stored in double precision.
+        _version: Number of times values were written to, so that results
+            computed from previous values are not reused.
+    """
+
+    __values: NDArray[np.float64]
+    _float_dtype: Optional[np.dtype] = None
+    _time_index: TimeIndex
+    _version: int = 0
 
     def __init__(
         self,
         label: str,
         values: NDArray[np.float64],
-        times: Optional[NDArray[np.float64]],
+        times: Union[None, NDArray[np.float64], TimeIndex],
+        float_dtype: Optional[np.dtype] = None,
     ):
         """Initialize a new series.
 
         Args:
             label: Label of the series in the input data.
             values: Values as a NumPy array.
-            times: Corresponding time values as a NumPy array.
+            times: Corresponding time index, shared with other series, or
+                time values as a NumPy array.
+            float_dtype: If set, store floating-point values, and results
+                computed from them, with this type.
         """
         super().__init__(label)
-        self._times = times
+        if float_dtype is not None and values.dtype.kind == "f":
+            values = values.astype(float_dtype, copy=False)
+        self._float_dtype = float_dtype
+        self._time_index = TimeIndex.wrap(times)
         self._values = values
 
-    def __add__(self, other) -> "Series":
-        """Sum of two series.
+    @property
+    def _values(self) -> NDArray[np.float64]:
+        """Values of the series."""
+        return self.__values
+
+    @_values.setter
+    def _values(self, values: NDArray[np.float64]) -> None:
+        self.__values = values
+        self._version += 1
+
+    @property
+    def _dtype(self) -> np.dtype:
+        """Data type of the values of the series."""
+        return self._values.dtype
+
+    @property
+    def _nbytes(self) -> int:
+        """Memory used by the values of the series, in bytes."""
+        return self._values.nbytes
+
+    def __array__(self, dtype=None, copy=None) -> NDArray:
+        """Values of the series as a NumPy array, without copy if possible.
 
         Args:
-            other: Other series.
+            dtype: Optional data type of the output array.
+            copy: If True, always copy values. If False, raise an error when
+                a copy is needed.
         """
-        return Series(
-            label=_operator_label("+", self._label, other._label),
-            values=self._values + other._values,
-            times=self._times,
+        values = self._values
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+            if copy is False and values is not self._values:
+                raise ValueError(
+                    f"Cannot convert '{self._label}' without copy"
+                )
+        return values.copy() if copy else values
+
+    def __array_function__(self, func, types, args, kwargs):
+        """Apply a NumPy function to the values of series.
+
+        Functions other than ufuncs, such as ``np.mean`` or ``np.std``,
+        return plain NumPy values.
+
+        Args:
+            func: NumPy function.
+            types: Types of the arguments implementing the protocol.
+            args: Positional arguments of the function.
+            kwargs: Keyword arguments of the function.
+        """
+
+        def unwrap(arg):
+            if isinstance(arg, Series):
+                return arg._values
+            if isinstance(arg, (list, tuple)):
+                return type(arg)(unwrap(item) for item in arg)
+            return arg
+
+        return func(
+            *unwrap(args), **{key: unwrap(arg) for key, arg in kwargs.items()}
         )
 
-    def __len__(self) -> int:
-        """Length of the indexed series."""
-        return self._values.shape[0]
+    def __array_ufunc__(self, ufunc, method: str, *inputs, **kwargs):
+        """Apply a NumPy ufunc to series.
 
-    def __mul__(self, other: Union[float, "Series"]) -> "Series":
-        """Elementwise product between two series.
+        Series inputs are replaced by their values, and array outputs of the
+        same length as the series are wrapped into series sharing its time
+        index. Reductions, such as ``np.add.reduce(series)``, return plain
+        NumPy values.
 
         Args:
-            other: Other series.
+            ufunc: NumPy ufunc.
+            method: Ufunc method, for instance "__call__" or "reduce".
+            inputs: Input arguments, including at least one series.
+            kwargs: Keyword arguments, including ``out`` arrays or series
+                that results are written to.
         """
-        if isinstance(other, Series):
-            return Series(
-                label=_operator_label("*", self._label, other._label),
-                values=self._values * other._values,
-                times=self._times,
+        labels: List[str] = []
+        args: List[Any] = []
+        for item in inputs:
+            if isinstance(item, Series):
+                if len(item) != len(self):
+                    raise FoxplotError(
+                        f"Series '{item._label}' and '{self._label}' "
+                        "have different lengths"
+                    )
+                labels.append(item._label)
+                args.append(item._values)
+            elif isinstance(item, (int, float, bool, complex, np.generic)):
+                labels.append(str(item))
+                args.append(item)
+            elif isinstance(item, np.ndarray):
+                labels.append("array")
+                args.append(item)
+            else:  # let other types handle the operation
+                return NotImplemented
+        outputs = kwargs.get("out")
+        if outputs is not None:
+            kwargs["out"] = tuple(
+                output._values if isinstance(output, Series) else output
+                for output in outputs
+            )
+        results = getattr(ufunc, method)(*args, **kwargs)
+        for output in outputs or ():
+            if isinstance(output, Series):
+                output._version += 1  # values written in place
+        if method not in ("__call__", "accumulate"):
+            return results
+        name = (
+            ufunc.__name__
+            if method == "__call__"
+            else f"{ufunc.__name__}.accumulate"
+        )
+        label = f"{name}({', '.join(labels)})"
+        if ufunc.nout == 1:
+            results = (results,)
+        wrapped = tuple(
+            self.__wrap_result(
+                result,
+                label,
+                outputs[i] if outputs is not None else None,
             )
+            for i, result in enumerate(results)
+        )
+        return wrapped[0] if ufunc.nout == 1 else wrapped
+
+    def __wrap_result(self, result, label: str, output) -> Any:
+        if isinstance(output, Series):
+            return output
+        if output is not None or not isinstance(result, np.ndarray):
+            return result  # preallocated array or scalar
+        if result.shape[:1] != (len(self),):
+            return result
+        return Series(label=label, values=result, times=self._time_index)
+
+    def __arithmetic(
+        self, op: str, ufunc, other, reflected: bool = False
+    ) -> "Series":
+        """Apply an arithmetic operator with a series or a scalar.
+
+        Args:
+            op: Symbol of the operator, used in the output label.
+            ufunc: NumPy ufunc of the operator.
+            other: Other operand: series or scalar.
+            reflected: If set, the other operand is on the left-hand side.
+
+        Returns:
+            Series of results, sharing the time index of this series.
+        """
+        other_values: Any
+        comparison = op in ("<", "<=", ">", ">=")
+        self_values = self._values if comparison else _as_float(self._values)
+        if isinstance(other, Series):
+            other_label, other_values = other._label, other._values
+            if not comparison:
+                other_values = _as_float(other_values)
+        elif isinstance(other, (int, float, np.number)):
+            other_label, other_values = str(other), other
+        else:  # let other types, such as lazy expressions, handle it
+            return NotImplemented
+        if reflected:
+            label = _operator_label(op, other_label, self._label)
+            values = ufunc(other_values, self_values)
+        else:  # self is the left-hand side
+            label = _operator_label(op, self._label, other_label)
+            values = ufunc(self_values, other_values)
         return Series(
-            label=_operator_label("*", self._label, str(other)),
-            values=self._values * other,
-            times=self._times,
+            label=label,
+            values=values,
+            times=self._time_index,
+            float_dtype=_requested_dtype(self, other),
         )
 
+    def __add__(self, other: Union[float, "Series"]) -> "Series":
+        """Sum of two series.
+
+        Args:
+            other: Other series or scalar.
+        """
+        return self.__arithmetic("+", np.add, other)
+
+    def __radd__(self, other: float) -> "Series":
+        """Sum of a scalar and a series."""
+        return self.__arithmetic("+", np.add, other, reflected=True)
+
+    def __sub__(self, other: Union[float, "Series"]) -> "Series":
+        """Difference between two series.
+
+        Args:
+            other: Other series or scalar.
+        """
+        return self.__arithmetic("-", np.subtract, other)
+
+    def __rsub__(self, other: float) -> "Series":
+        """Difference between a scalar and a series."""
+        return self.__arithmetic("-", np.subtract, other, reflected=True)
+
+    def __mul__(self, other: Union[float, "Series"]) -> "Series":
+        """Elementwise product between two series.
+
+        Args:
+            other: Other series or scalar.
+        """
+        return self.__arithmetic("*", np.multiply, other)
+
+    def __rmul__(self, other: float) -> "Series":
+        """Elementwise product between a scalar and a series."""
+        return self.__arithmetic("*", np.multiply, other, reflected=True)
+
+    def __truediv__(self, other: Union[float, "Series"]) -> "Series":
+        """Elementwise ratio between two series.
+
+        Args:
+            other: Other series or scalar.
+        """
+        return self.__arithmetic("/", np.true_divide, other)
+
+    def __rtruediv__(self, other: float) -> "Series":
+        """Elementwise ratio between a scalar and a series."""
+        return self.__arithmetic("/", np.true_divide, other, reflected=True)
+
+    def __lt__(self, other: Union[float, "Series"]) -> "Series":
+        """Elementwise comparison, true where this series is lower."""
+        return self.__arithmetic("<", np.less, other)
+
+    def __le__(self, other: Union[float, "Series"]) -> "Series":
+        """Elementwise comparison, true where this series is lower or equal."""
+        return self.__arithmetic("<=", np.less_equal, other)
+
+    def __gt__(self, other: Union[float, "Series"]) -> "Series":
+        """Elementwise comparison, true where this series is greater."""
+        return self.__arithmetic(">", np.greater, other)
+
+    def __ge__(self, other: Union[float, "Series"]) -> "Series":
+        """Elementwise comparison, true where this series is not lower."""
+        return self.__arithmetic(">=", np.greater_equal, other)
+
+    def __len__(self) -> int:
+        """Length of the indexed series."""
+        return self._values.shape[0]
+
     def __neg__(self) -> "Series":
         """Unitary minus applied to the series."""
+        values = _as_float(self._values)
         return Series(
             label=f"-{self._label}",
-            values=-self._values,
-            times=self._times,
+            values=-values,
+            times=self._time_index,
+            float_dtype=self._float_dtype,
         )
 
     def __repr__(self) -> str:
         """String representation of the series."""
         return f"Time series with values: {self._values}"
 
-    def __truediv__(self, other: Union[int, float, "Series"]) -> "Series":
-        """Elementwise ratio between two series.
+    @property
+    def _times(self) -> Optional[NDArray[np.float64]]:
+        """Time values of the series, or ``None`` if they are unset."""
+        return self._time_index.values
 
-        Args:
-            other: Other series.
-        """
-        if isinstance(other, Series):
-            return Series(
-                label=_operator_label("/", self._label, other._label),
-                values=self._values / other._values,
-                times=self._times,
-            )
-        return Series(
-            label=_operator_label("/", self._label, str(other)),
-            values=self._values / other,
-            times=self._times,
-        )
+    def __require_times(self) -> NDArray[np.float64]:
+        times = self._times
+        if times is None:
+            raise FoxplotError(f"Unset time values for series '{self._label}'")
+        return times
 
     def abs(self) -> "Series":
         """Return the series of absolute values of this series.
@@ -125,12 +416,45 @@ class Series(LabeledSeries):
         Returns:
             Array of windowed standard deviations along the series.
         """
+        values = _as_float(self._values)
         return Series(
             label=f"abs({self._label})",
-            values=np.abs(self._values),
-            times=self._times,
+            values=np.abs(values),
+            times=self._time_index,
+            float_dtype=self._float_dtype,
         )
 
+    def crossings(
+        self,
+        threshold: float,
+        direction: Direction = "both",
+        hysteresis: float = 0.0,
+        min_duration: float = 0.0,
+    ) -> NDArray[np.float64]:
+        """Find times at which the series crosses a threshold.
+
+        Args:
+            threshold: Threshold value.
+            direction: Either "up" for crossings from below to above the
+                threshold, "down" for crossings from above to below, or
+                "both".
+            hysteresis: Width of a band around the threshold that values
+                need to cross entirely, so that noise around the threshold
+                does not count as many crossings.
+            min_duration: Minimum time spent on each side of the threshold,
+                in seconds, for a crossing to count.
+
+        Returns:
+            Time of the first value after each crossing.
+        """
+        times = self.__require_times()
+        if self._values.dtype.kind not in "biuf":
+            raise FoxplotError(f"Series '{self._label}' is not numeric")
+        state = hysteresis_state(self._values, threshold, hysteresis)
+        state = debounce(state, times, min_duration)
+        return times[crossing_indices(state, direction)]
+
+    @memoize
     def deriv(
         self,
         unit: Literal["s", "M", "H", "d", "m", "y"],
@@ -150,23 +474,24 @@ class Series(LabeledSeries):
             unit [U], its time-derivative will be in [U] / [T] where [T] is the
             time unit specified by ``unit`` (default: second).
         """
-        if self._times is None:
-            raise FoxplotError(f"Unset time values for series '{self._label}'")
-        nb_steps = len(self._times)
+        times = self.__require_times()
+        timesteps = self._time_index.timesteps
+        values = _as_float(self._values)
+        nb_steps = len(times)
         filtered_output = None
         outputs = []
         cutoff_period_s = UNIT_TO_SECONDS[unit] * cutoff
         for i in range(nb_steps - 1):
-            dt = self._times[i + 1] - self._times[i]
+            dt = timesteps[i]
             if dt < 0.0:
                 logging.warning(
                     "Invalid timestep dt=%f at time=%f",
                     dt,
-                    self._times[i],
+                    times[i],
                 )
                 outputs.append(np.nan)
                 continue
-            finite_diff = (self._values[i + 1] - self._values[i]) / dt
+            finite_diff = (values[i + 1] - values[i]) / dt
             if cutoff_period_s < 2 * dt or filtered_output is None:
                 # Nyquist-Shannon sampling theorem (again)
                 filtered_output = finite_diff
@@ -176,7 +501,7 @@ class Series(LabeledSeries):
                 filtered_output += gamma * (finite_diff - filtered_output)
                 outputs.append(filtered_output)
         outputs.append(outputs[-1])
-        assert len(outputs) == len(self._values) == len(self._times)
+        assert len(outputs) == len(values) == len(times)
         label = f"deriv({self._label}, unit={unit}"
         if cutoff > 1e-10:
             label += f", cutoff={cutoff} {unit}"
@@ -184,9 +509,28 @@ class Series(LabeledSeries):
         return Series(
             label=label,
             values=np.array(outputs) * UNIT_TO_SECONDS[unit],
-            times=self._times,
+            times=self._time_index,
+            float_dtype=self._float_dtype,
         )
 
+    def lazy(self) -> "Expression":
+        """Start a lazy expression from this series.
+
+        Arithmetic on the returned expression builds an expression tree,
+        whose values are only computed, in a single pass, when it is
+        evaluated or plotted. For instance, ``(a.lazy() - b).abs() * k / c``
+        allocates one output array rather than one per operation.
+
+        Returns:
+            Expression of this series.
+        """
+        from .expression import Expression
+
+        expression = Expression.wrap(self)
+        assert isinstance(expression, Expression)
+        return expression
+
+    @memoize
     def low_pass_filter(self, cutoff_period: float) -> "Series":
         """Apply low-pass filter to a time series.
 
@@ -196,33 +540,213 @@ class Series(LabeledSeries):
         Returns:
             Low-pass filtered time series.
         """
-        if self._times is None:
-            raise FoxplotError(f"Unset time values for series '{self._label}'")
-        nb_steps = len(self._times)
-        output = self._values[0]
+        times = self.__require_times()
+        timesteps = self._time_index.timesteps
+        values = _as_float(self._values)
+        nb_steps = len(times)
+        output = values[0]
         outputs = [output]
         for i in range(nb_steps - 1):
-            dt = self._times[i + 1] - self._times[i]
+            dt = timesteps[i]
             if cutoff_period < 2 * dt:
                 logging.warning(
                     "Nyquist-Shannon sampling theorem: "
                     "at time=%f, dt=%f but cutoff_period=%f",
-                    self._times[i],
+                    times[i],
                     dt,
                     cutoff_period,
                 )
                 outputs.append(np.nan)
                 continue
             forgetting_factor = np.exp(-dt / cutoff_period)
-            output += (1.0 - forgetting_factor) * (self._values[i] - output)
+            output += (1.0 - forgetting_factor) * (values[i] - output)
             outputs.append(output)
-        assert len(outputs) == len(self._values) == len(self._times)
+        assert len(outputs) == len(values) == len(times)
         return Series(
             label=f"low_pass_filter({self._label}, {cutoff_period=})",
             values=np.array(outputs),
-            times=self._times,
+            times=self._time_index,
+            float_dtype=self._float_dtype,
         )
 
+    @memoize
+    def align(
+        self, other: "Series", method: Interpolation = "linear"
+    ) -> "Series":
+        """Interpolate this series on the time index of another series.
+
+        Args:
+            other: Series whose time index the output series will share.
+            method: Either "linear" interpolation between surrounding values,
+                or "zoh" (zero-order hold) to repeat the last value.
+
+        Returns:
+            Values of this series at the times of the other series.
+        """
+        new_times = other.__require_times()
+        return Series(
+            label=f"align({self._label}, {other._label}, {method=})",
+            values=interpolate_values(
+                self.__require_times(),
+                _as_float(self._values),
+                new_times,
+                method,
+            ),
+            times=other._time_index,
+            float_dtype=self._float_dtype,
+        )
+
+    @memoize
+    def resample(self, period: float, how: Aggregation = "mean") -> "Series":
+        """Resample the series at a uniform rate.
+
+        Args:
+            period: Time between two consecutive output values.
+            how: Aggregation of the values received during each period: their
+                "mean", "min", "max", or the "last" value received.
+
+        Returns:
+            Resampled series. Its time index is shared with all series
+            resampled with the same period from the same time index.
+        """
+        times = self.__require_times()
+        values = _as_float(self._values)
+        time_index = self._time_index.uniform(period)
+        assert time_index.values is not None
+        return Series(
+            label=f"resample({self._label}, {period=}, {how=})",
+            values=resample_values(times, values, time_index.values, how),
+            times=time_index,
+            float_dtype=self._float_dtype,
+        )
+
+    def slice(
+        self, start: Optional[float] = None, stop: Optional[float] = None
+    ) -> "Series":
+        """Restrict the series to a time interval.
+
+        The sliced series is a view on the values of this series, and its
+        time index is shared by all series sliced with the same bounds.
+
+        Args:
+            start: Start time of the interval, or ``None`` to start from the
+                beginning of the series.
+            stop: End time of the interval (excluded), or ``None`` to go to
+                the end of the series.
+
+        Returns:
+            Series restricted to the time interval.
+        """
+        index_slice, time_index = self._time_index.slice(start, stop)
+        return Series(
+            label=self._label,
+            values=self._values[index_slice],
+            times=time_index,
+            float_dtype=self._float_dtype,
+        )
+
+    def __uniform_values(self) -> Tuple[NDArray, float, float]:
+        """Get values at a uniform rate, interpolating them if needed.
+
+        Returns:
+            Tuple of uniform values, their sampling period and start time.
+        """
+        times = self.__require_times()
+        if not self._time_index.is_monotonic:
+            raise FoxplotError(f"Unsorted time values for '{self._label}'")
+        values, period = make_uniform(times, self._values)
+        return values, period, float(times[0])
+
+    @memoize
+    def fft(self) -> "Series":
+        """Compute the amplitude spectrum of the series.
+
+        Values are resampled at their median rate, by linear interpolation,
+        if their times are not uniform. Time values should be in seconds.
+
+        Returns:
+            One-sided amplitude spectrum, indexed by frequency in hertz. A
+            sine wave of amplitude A yields a peak of height A.
+        """
+        values, period, _ = self.__uniform_values()
+        frequencies, amplitudes = amplitude_spectrum(values, period)
+        return Series(
+            label=f"fft({self._label})",
+            values=amplitudes,
+            times=TimeIndex(frequencies, axis="frequency"),
+        )
+
+    @memoize
+    def psd(
+        self,
+        segment_length: int = 256,
+        overlap: float = 0.5,
+        window: Window = "hann",
+    ) -> "Series":
+        """Estimate the power spectral density of the series.
+
+        The estimate averages the periodograms of overlapping segments
+        (Welch's method). Segments are processed in chunks to keep memory
+        bounded on long series. Values are resampled at their median rate, by
+        linear interpolation, if their times are not uniform.
+
+        Args:
+            segment_length: Number of values in each segment. The frequency
+                resolution is the sampling rate divided by this number.
+            overlap: Ratio of each segment shared with the next one.
+            window: Window function applied to each segment: "hann",
+                "hamming", "blackman", "bartlett" or "boxcar".
+
+        Returns:
+            One-sided power spectral density, in squared units of the series
+            per hertz, indexed by frequency in hertz.
+        """
+        values, period, _ = self.__uniform_values()
+        frequencies, densities = welch(
+            values, period, segment_length, overlap, window
+        )
+        return Series(
+            label=f"psd({self._label}, {segment_length=})",
+            values=densities,
+            times=TimeIndex(frequencies, axis="frequency"),
+        )
+
+    @memoize
+    def spectrogram(
+        self,
+        segment_length: int = 256,
+        overlap: float = 0.5,
+        window: Window = "hann",
+    ) -> "Node":
+        """Compute the power spectral density of the series over time.
+
+        Args:
+            segment_length: Number of values in each segment.
+            overlap: Ratio of each segment shared with the next one.
+            window: Window function applied to each segment: "hann",
+                "hamming", "blackman", "bartlett" or "boxcar".
+
+        Returns:
+            Node with one series per frequency bin, keyed by bin index, of
+            the densities of each segment at the time of its center. The
+            frequency of each bin, in hertz, is in the ``_frequencies``
+            attribute of the node.
+        """
+        from .node import Node
+
+        values, period, start = self.__uniform_values()
+        frequencies, centers, power = spectrogram(
+            values, period, segment_length, overlap, window
+        )
+        label = f"spectrogram({self._label}, {segment_length=})"
+        node = Node(label)
+        time_index = TimeIndex(start + centers)
+        for i, densities in enumerate(power):
+            node._insert([i], Series(f"{label}/{i}", densities, time_index))
+        node._frequencies = frequencies  # type: ignore[attr-defined]
+        return node
+
+    @memoize
     def std(self, window_size: int) -> "Series":
         """Return the rolling standard deviation of the series.
 
@@ -237,9 +761,10 @@ class Series(LabeledSeries):
             label=f"std({self._label}, {window_size})",
             values=np.std(
                 np.lib.stride_tricks.sliding_window_view(
-                    self._values, window_size
+                    _as_float(self._values), window_size
                 ),
                 axis=-1,
             ),
-            times=self._times,
+            times=self._time_index,
+            float_dtype=self._float_dtype,
         )
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Series of rarely-updated values stored only where they change."""
+
+from typing import Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .cache import memoize
+from .labeled_series import LabeledSeries
+from .series import Series
+from .time_index import TimeIndex
+
+
+def forward_fill(
+    indices: NDArray[np.int64], updates: NDArray, length: int
+) -> NDArray:
+    """Expand updates to dense values repeating the last value received.
+
+    Args:
+        indices: Sorted time indices at which values were received.
+        updates: Missing value followed by the values received at each
+            update, so that ``len(updates) == len(indices) + 1``.
+        length: Number of dense values.
+
+    Returns:
+        Dense array of values.
+    """
+    # positions[i] is the number of values received up to index i
+    positions = np.searchsorted(indices, np.arange(length), side="right")
+    return updates[positions]
+
+
+class SparseSeries(Series):
+    """Time series stored as the values it received and their indices.
+
+    Values between two updates repeat the last value received. The dense
+    array of values is only materialized on demand, for instance to plot the
+    series or compute arithmetic operations on it.
+    """
+
+    _indices: NDArray[np.int64]
+    _length: int
+    _updates: NDArray
+
+    def __init__(
+        self,
+        label: str,
+        indices: NDArray[np.int64],
+        updates: NDArray,
+        length: int,
+        times: Union[None, NDArray[np.float64], TimeIndex],
+        float_dtype: Optional[np.dtype] = None,
+    ):
+        """Initialize a new sparse series.
+
+        Args:
+            label: Label of the series in the input data.
+            indices: Sorted time indices at which the series was updated.
+            updates: Missing value followed by the values received at each
+                update, so that ``len(updates) == len(indices) + 1``.
+            length: Number of values of the dense series.
+            times: Corresponding time index, shared with other series, or
+                time values as a NumPy array.
+            float_dtype: If set, store floating-point values, and results
+                computed from them, with this type.
+        """
+        LabeledSeries.__init__(self, label)
+        if float_dtype is not None and updates.dtype.kind == "f":
+            updates = updates.astype(float_dtype, copy=False)
+        self._float_dtype = float_dtype
+        self._indices = indices
+        self._length = length
+        self._time_index = TimeIndex.wrap(times)
+        self._updates = updates
+
+    def __len__(self) -> int:
+        """Length of the indexed series."""
+        return self._length
+
+    @property
+    def _dtype(self) -> np.dtype:
+        """Data type of the values of the series."""
+        return self._updates.dtype
+
+    @property
+    def _nbytes(self) -> int:
+        """Memory used by the updates of the series, in bytes."""
+        return self._indices.nbytes + self._updates.nbytes
+
+    @property  # type: ignore[misc]
+    def _values(self) -> NDArray:
+        """Dense values of the series, materialized on demand.
+
+        The dense array is kept in the cache of series transforms, within
+        its memory budget, so that successive accesses do not rebuild it.
+        """
+        return self.__dense()
+
+    @memoize
+    def __dense(self) -> NDArray:
+        return forward_fill(self._indices, self._updates, self._length)
+
+    def dense(self) -> Series:
+        """Convert to a series that stores all its values.
+
+        Returns:
+            Dense series sharing the time index of this one.
+        """
+        return Series(
+            self._label,
+            self._values.copy(),  # writable, unlike the cached dense view
+            self._time_index,
+            self._float_dtype,
+        )
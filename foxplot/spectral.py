@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Spectral analysis of time series values."""
+
+from typing import Generator, Literal, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .exceptions import FoxplotError
+from .resample import interpolate_values
+
+Window = Literal["hann", "hamming", "blackman", "bartlett", "boxcar"]
+
+# Number of samples processed at once by chunked transforms.
+CHUNK_SIZE = 1 << 20
+
+# Relative deviation from the median timestep above which times are
+# considered non-uniform.
+UNIFORM_TOLERANCE = 1e-3
+
+
+def make_uniform(
+    times: NDArray[np.float64], values: NDArray
+) -> Tuple[NDArray, float]:
+    """Get values at a uniform rate, interpolating them if needed.
+
+    Args:
+        times: Sorted time values of the input series, in seconds.
+        values: Values of the input series.
+
+    Returns:
+        Pair of values sampled at a uniform rate and of their sampling
+        period. Values are returned as is if their times are already uniform.
+    """
+    if len(times) < 2:
+        raise FoxplotError("Spectral analysis needs at least two values")
+    timesteps = np.diff(times)
+    period = float(np.median(timesteps))
+    if period <= 0.0:
+        raise FoxplotError("Spectral analysis needs increasing times")
+    if np.all(np.abs(timesteps - period) <= UNIFORM_TOLERANCE * period):
+        return values, period
+    nb_values = int((times[-1] - times[0]) // period) + 1
+    new_times = times[0] + period * np.arange(nb_values)
+    return interpolate_values(times, values, new_times, "linear"), period
+
+
+def get_window(window: Window, length: int) -> NDArray[np.float64]:
+    """Get the coefficients of a window function.
+
+    Args:
+        window: Name of the window function.
+        length: Number of coefficients.
+
+    Returns:
+        Window coefficients.
+    """
+    if window == "boxcar":
+        return np.ones(length)
+    functions = {
+        "bartlett": np.bartlett,
+        "blackman": np.blackman,
+        "hamming": np.hamming,
+        "hann": np.hanning,
+    }
+    if window not in functions:
+        raise FoxplotError(f"Unknown window '{window}'")
+    return functions[window](length)
+
+
+def _segment_chunks(
+    values: NDArray,
+    segment_length: int,
+    overlap: float,
+    chunk_size: int,
+) -> Generator[NDArray, None, None]:
+    """Iterate over overlapping segments, a few at a time.
+
+    Args:
+        values: Values sampled at a uniform rate.
+        segment_length: Number of values in each segment.
+        overlap: Ratio of each segment shared with the next one, in [0, 1).
+        chunk_size: Approximate number of values in each chunk of segments.
+
+    Yields:
+        Views of shape ``(nb_segments, segment_length)`` on consecutive
+        segments. Segments are not copied until they are processed.
+    """
+    if not 0.0 <= overlap < 1.0:
+        raise FoxplotError(f"Invalid segment overlap {overlap}")
+    if segment_length < 2 or segment_length > len(values):
+        raise FoxplotError(
+            f"Invalid segment length {segment_length} for {len(values)} values"
+        )
+    step = max(1, int(segment_length * (1.0 - overlap)))
+    segments = np.lib.stride_tricks.sliding_window_view(
+        values, segment_length
+    )[::step]
+    nb_per_chunk = max(1, chunk_size // segment_length)
+    for start in range(0, len(segments), nb_per_chunk):
+        yield segments[start : start + nb_per_chunk]
+
+
+def _periodograms(
+    segments: NDArray, window: NDArray[np.float64], period: float
+) -> NDArray[np.float64]:
+    """Compute one-sided power spectral densities of segments.
+
+    Args:
+        segments: Segments of shape ``(nb_segments, segment_length)``.
+        window: Window coefficients.
+        period: Sampling period, in seconds.
+
+    Returns:
+        Densities of shape ``(nb_segments, segment_length // 2 + 1)``.
+    """
+    detrended = segments - segments.mean(axis=1, keepdims=True)
+    spectrum = np.fft.rfft(detrended * window, axis=1)
+    power = np.abs(spectrum) ** 2 * (period / np.sum(window**2))
+    last = None if segments.shape[1] % 2 else -1  # Nyquist bin if even
+    power[:, 1:last] *= 2.0
+    return power
+
+
+def welch(
+    values: NDArray,
+    period: float,
+    segment_length: int = 256,
+    overlap: float = 0.5,
+    window: Window = "hann",
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[NDArray, NDArray]:
+    """Estimate the power spectral density of values with Welch's method.
+
+    Segments are processed in chunks, so that memory stays bounded by the
+    chunk size regardless of the number of values.
+
+    Args:
+        values: Values sampled at a uniform rate.
+        period: Sampling period, in seconds.
+        segment_length: Number of values in each segment.
+        overlap: Ratio of each segment shared with the next one.
+        window: Window function applied to each segment.
+        chunk_size: Approximate number of values processed at once.
+
+    Returns:
+        Pair of frequencies, in hertz, and power spectral densities, in
+        squared units of the values per hertz.
+    """
+    coefficients = get_window(window, segment_length)
+    total = np.zeros(segment_length // 2 + 1)
+    nb_segments = 0
+    for chunk in _segment_chunks(values, segment_length, overlap, chunk_size):
+        total += _periodograms(chunk, coefficients, period).sum(axis=0)
+        nb_segments += len(chunk)
+    frequencies = np.fft.rfftfreq(segment_length, d=period)
+    return frequencies, total / nb_segments
+
+
+def spectrogram(
+    values: NDArray,
+    period: float,
+    segment_length: int = 256,
+    overlap: float = 0.5,
+    window: Window = "hann",
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[NDArray, NDArray, NDArray]:
+    """Compute power spectral densities over consecutive segments.
+
+    Args:
+        values: Values sampled at a uniform rate.
+        period: Sampling period, in seconds.
+        segment_length: Number of values in each segment.
+        overlap: Ratio of each segment shared with the next one.
+        window: Window function applied to each segment.
+        chunk_size: Approximate number of values processed at once.
+
+    Returns:
+        Tuple of frequencies, in hertz, offsets of segment centers from the
+        first value, in seconds, and densities of shape ``(nb_frequencies,
+        nb_segments)``, so that the densities of each frequency are
+        contiguous.
+    """
+    coefficients = get_window(window, segment_length)
+    step = max(1, int(segment_length * (1.0 - overlap)))
+    nb_segments = max(0, (len(values) - segment_length) // step + 1)
+    power = np.empty((segment_length // 2 + 1, nb_segments))
+    start = 0
+    for chunk in _segment_chunks(values, segment_length, overlap, chunk_size):
+        end = start + len(chunk)
+        power[:, start:end] = _periodograms(chunk, coefficients, period).T
+        start = end
+    centers = period * (step * np.arange(nb_segments) + segment_length / 2)
+    frequencies = np.fft.rfftfreq(segment_length, d=period)
+    return frequencies, centers, power
+
+
+def amplitude_spectrum(
+    values: NDArray, period: float
+) -> Tuple[NDArray, NDArray]:
+    """Compute the one-sided amplitude spectrum of values.
+
+    Args:
+        values: Values sampled at a uniform rate.
+        period: Sampling period, in seconds.
+
+    Returns:
+        Pair of frequencies, in hertz, and amplitudes, in units of the values,
+        such that a sine wave of amplitude A yields a peak of height A.
+    """
+    nb_values = len(values)
+    amplitudes = np.abs(np.fft.rfft(values)) / nb_values
+    last = None if nb_values % 2 else -1  # Nyquist bin if even
+    amplitudes[1:last] *= 2.0
+    return np.fft.rfftfreq(nb_values, d=period), amplitudes
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Time values shared by all series of a data tree."""
+
+from typing import Any, Dict, Literal, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .exceptions import FoxplotError
+from .timestamps import NAT, to_seconds
+
+Axis = Literal["time", "frequency"]
+
+
+class TimeIndex:
+    """Time values shared by all the series that refer to it.
+
+    Series hold a reference to their time index rather than to an array of
+    times, so that changing the time values of a whole data tree is a single
+    assignment. Properties derived from time values, such as their median
+    timestep, are computed once and cached until time values change.
+
+    Timestamps can be stored exactly as integer nanoseconds since the epoch,
+    in which case their values in seconds are only computed when needed, and
+    timesteps are computed from the integers.
+
+    Attributes:
+        axis: Either "time" for time values, in seconds, or "frequency" for
+            the frequencies of a spectrum, in hertz.
+    """
+
+    __cache: Dict[Any, Any]
+    __nanoseconds: Optional[NDArray[np.int64]]
+    __values: Optional[NDArray[np.float64]]
+    __version: int
+    axis: Axis
+
+    @staticmethod
+    def wrap(
+        times: Union[None, NDArray[np.float64], "TimeIndex"],
+    ) -> "TimeIndex":
+        """Get a time index from times that may already be one.
+
+        Args:
+            times: Time index, array of time values, or ``None``.
+
+        Returns:
+            Time index, either the input one or a new one wrapping values.
+        """
+        if isinstance(times, TimeIndex):
+            return times
+        return TimeIndex(times)
+
+    def __init__(
+        self,
+        values: Optional[NDArray[np.float64]] = None,
+        axis: Axis = "time",
+    ):
+        """Initialize time index.
+
+        Args:
+            values: Time values, or ``None`` if they are not known yet.
+            axis: Either "time" for time values or "frequency" for the
+                frequencies of a spectrum.
+        """
+        self.__cache = {}
+        self.__nanoseconds = None
+        self.__values = values
+        self.__version = 0
+        self.axis = axis
+
+    def __len__(self) -> int:
+        """Number of time values, zero if they are unset."""
+        if self.__nanoseconds is not None:
+            return self.__nanoseconds.shape[0]
+        return 0 if self.__values is None else self.__values.shape[0]
+
+    def __repr__(self) -> str:
+        """String representation of the time index."""
+        return f"Time index with values: {self.values}"
+
+    def __require_values(self) -> NDArray[np.float64]:
+        values = self.values
+        if values is None:
+            raise FoxplotError("Unset time values")
+        return values
+
+    def __cached(self, key, compute):
+        if key not in self.__cache:
+            self.__cache[key] = compute()
+        return self.__cache[key]
+
+    def matches(self, other: "TimeIndex") -> bool:
+        """Check whether another index has the same time values.
+
+        Args:
+            other: Other time index.
+
+        Returns:
+            True if the other index is this one, or if both have equal time
+            values along the same axis.
+        """
+        if other is self:
+            return True
+        values, other_values = self.values, other.values
+        if values is None or other_values is None:
+            return False
+        return self.axis == other.axis and np.array_equal(values, other_values)
+
+    @property
+    def nanoseconds(self) -> Optional[NDArray[np.int64]]:
+        """Nanoseconds since the epoch, if set from timestamps."""
+        return self.__nanoseconds
+
+    @property
+    def values(self) -> Optional[NDArray[np.float64]]:
+        """Time values in seconds, or ``None`` if they are unset."""
+        nanoseconds = self.__nanoseconds
+        if nanoseconds is not None:
+            return self.__cached("values", lambda: to_seconds(nanoseconds))
+        return self.__values
+
+    @property
+    def version(self) -> int:
+        """Number of times the values of this index have changed."""
+        return self.__version
+
+    def set_values(self, values: Optional[NDArray[np.float64]]) -> None:
+        """Change time values for all series referring to this index.
+
+        Args:
+            values: New time values, in seconds.
+        """
+        self.__cache.clear()
+        self.__nanoseconds = None
+        self.__values = values
+        self.__version += 1
+
+    def set_nanoseconds(self, nanoseconds: NDArray[np.int64]) -> None:
+        """Change time values to timestamps for all series of this index.
+
+        Args:
+            nanoseconds: New time values, in nanoseconds since the epoch.
+        """
+        self.__cache.clear()
+        self.__nanoseconds = nanoseconds
+        self.__values = None
+        self.__version += 1
+
+    @property
+    def timesteps(self) -> NDArray[np.float64]:
+        """Durations between consecutive time values, in seconds.
+
+        Timesteps between timestamps are computed from integer nanoseconds,
+        so that they keep their full precision.
+        """
+
+        def compute() -> NDArray[np.float64]:
+            nanoseconds = self.__nanoseconds
+            if nanoseconds is None or np.any(nanoseconds == NAT):
+                return np.diff(self.__require_values())
+            return np.diff(nanoseconds) / 1e9
+
+        return self.__cached("timesteps", compute)
+
+    @property
+    def is_monotonic(self) -> bool:
+        """Check whether time values never decrease."""
+        return self.__cached(
+            "is_monotonic",
+            lambda: bool(np.all(self.timesteps >= 0.0)),
+        )
+
+    @property
+    def median_dt(self) -> float:
+        """Median timestep between consecutive time values."""
+        return self.__cached(
+            "median_dt",
+            lambda: float(np.median(self.timesteps)),
+        )
+
+    def gaps(self, factor: float = 10.0) -> NDArray[np.int64]:
+        """Find gaps in time values.
+
+        Args:
+            factor: A gap is a timestep larger than this factor times the
+                median timestep.
+
+        Returns:
+            Indices ``i`` such that there is a gap between time values ``i``
+            and ``i + 1``.
+        """
+        return self.__cached(
+            ("gaps", factor),
+            lambda: np.flatnonzero(self.timesteps > factor * self.median_dt),
+        )
+
+    def uniform(self, period: float) -> "TimeIndex":
+        """Get a uniform time index spanning the same interval as this one.
+
+        Uniform indices are cached, so that all series resampled with the
+        same period share the same time index.
+
+        Args:
+            period: Time between two consecutive values of the new index.
+
+        Returns:
+            Time index starting from the first time value of this index, with
+            a constant timestep, and ending before the last time value.
+        """
+
+        def compute() -> "TimeIndex":
+            values = self.values
+            if values is None or len(values) < 1:
+                raise FoxplotError("Cannot resample unset time values")
+            if period <= 0.0:
+                raise FoxplotError(f"Invalid resampling period {period}")
+            if not self.is_monotonic:
+                raise FoxplotError("Cannot resample unsorted time values")
+            nb_values = int((values[-1] - values[0]) // period) + 1
+            return TimeIndex(values[0] + period * np.arange(nb_values))
+
+        return self.__cached(("uniform", period), compute)
+
+    def slice(
+        self, start: Optional[float], stop: Optional[float]
+    ) -> Tuple[slice, "TimeIndex"]:
+        """Get the time index restricted to a time interval.
+
+        Sub-indices are cached, so that all series sliced with the same
+        bounds share the same sub-index. Time values are assumed sorted.
+
+        Args:
+            start: Start of the interval, or ``None`` to start from the first
+                time value.
+            stop: End of the interval (excluded), or ``None`` to end at the
+                last time value.
+
+        Returns:
+            Pair of the slice of time indices in the interval, and the time
+            index restricted to the interval.
+        """
+
+        def compute() -> Tuple[slice, "TimeIndex"]:
+            values = self.values
+            if values is None:
+                raise FoxplotError("Cannot slice unset time values")
+            i = 0 if start is None else np.searchsorted(values, start)
+            j = len(values) if stop is None else np.searchsorted(values, stop)
+            index_slice = slice(int(i), int(j))
+            sub_index = TimeIndex(values[index_slice], self.axis)
+            if self.__nanoseconds is not None:
+                sub_index.set_nanoseconds(self.__nanoseconds[index_slice])
+            return index_slice, sub_index
+
+        return self.__cached(("slice", start, stop), compute)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 Inria
+
+"""Vectorized parsing of time values to seconds or nanoseconds."""
+
+import warnings
+from typing import Literal, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .exceptions import FoxplotError
+
+EpochUnit = Literal["s", "ms", "us", "ns"]
+
+# Not-a-time marker of missing timestamps in int64 nanoseconds.
+NAT = np.iinfo(np.int64).min
+
+UNIT_TO_NANOSECONDS = {"s": 10**9, "ms": 10**6, "us": 10**3, "ns": 1}
+
+# Smallest magnitude of present-day epoch times in each unit, from the finest
+# unit: about 1.7e18 ns, 1.7e15 us and 1.7e12 ms since 1970.
+_EPOCH_MAGNITUDES = (("ns", 1e17), ("us", 1e14), ("ms", 1e11))
+
+
+def guess_epoch_unit(values: NDArray) -> EpochUnit:
+    """Guess the unit of epoch times from their magnitude.
+
+    Args:
+        values: Integer or floating-point times since the epoch.
+
+    Returns:
+        Finest unit in which the largest value is a present-day epoch time,
+        or seconds for values that are smaller than that in every unit.
+    """
+    if values.dtype.kind == "f":
+        values = values[~np.isnan(values)]
+    magnitudes = np.abs(values)
+    if magnitudes.size < 1:
+        return "s"
+    highest = float(magnitudes.max())
+    for unit, magnitude in _EPOCH_MAGNITUDES:
+        if highest >= magnitude:
+            return unit  # type: ignore[return-value]
+    return "s"
+
+
+def parse_timestamps(strings: NDArray) -> NDArray[np.int64]:
+    """Parse ISO 8601 timestamps to nanoseconds since the epoch.
+
+    Args:
+        strings: Timestamps such as ``2024-03-01T12:00:00.25Z``. Timestamps
+            with a UTC offset are converted to UTC. ``None`` values are
+            parsed to :data:`NAT`.
+
+    Returns:
+        Nanoseconds since the epoch.
+    """
+    with warnings.catch_warnings():  # NumPy warns about UTC offsets
+        warnings.simplefilter("ignore", UserWarning)
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            datetimes = np.array(strings, dtype="datetime64[ns]")
+        except ValueError as exn:
+            raise FoxplotError(f"Cannot parse timestamps: {exn}") from exn
+    return datetimes.view(np.int64)
+
+
+def parse_times(values: NDArray, unit: Optional[EpochUnit] = None) -> NDArray:
+    """Convert time values to numbers in a single vectorized pass.
+
+    Args:
+        values: Time values: ISO 8601 strings, datetimes, integers or floats.
+        unit: Unit of numeric time values. If ``None``, numbers are read as
+            epoch seconds, milliseconds, microseconds or nanoseconds
+            depending on their magnitude, see :func:`guess_epoch_unit`.
+
+    Returns:
+        Nanoseconds since the epoch, as 64-bit integers, for strings,
+        datetimes and integers; seconds, as double-precision floats, for
+        floating-point values and for integers whose nanoseconds do not fit
+        in 64 bits.
+    """
+    kind = values.dtype.kind
+    if kind == "M":
+        return values.astype("datetime64[ns]").view(np.int64)
+    if kind in "OSU":
+        return parse_timestamps(values)
+    if unit is not None and unit not in UNIT_TO_NANOSECONDS:
+        raise FoxplotError(f"Unknown time unit '{unit}'")
+    if kind in "iu":
+        factor = UNIT_TO_NANOSECONDS[unit or guess_epoch_unit(values)]
+        limit = np.iinfo(np.int64).max // factor
+        if values.size < 1 or (
+            -limit <= values.min() and values.max() <= limit
+        ):
+            return values.astype(np.int64) * factor
+        # Beyond about 292 years from the epoch in 64-bit nanoseconds
+        return values.astype(np.float64) * (factor / 1e9)
+    if kind == "f":
+        factor = UNIT_TO_NANOSECONDS[unit or guess_epoch_unit(values)]
+        seconds = values.astype(np.float64, copy=False)
+        return seconds if factor == 10**9 else seconds * (factor / 1e9)
+    raise FoxplotError(f"Cannot use values of type {values.dtype} as times")
+
+
+def to_seconds(nanoseconds: NDArray[np.int64]) -> NDArray[np.float64]:
+    """Convert nanoseconds to seconds.
+
+    Args:
+        nanoseconds: Integer nanoseconds, with :data:`NAT` for missing ones.
+
+    Returns:
+        Seconds, with NaN for missing values.
+    """
+    seconds = nanoseconds / 1e9
+    seconds[nanoseconds == NAT] = np.nan
+    return seconds
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import gc
+import unittest
+import weakref
+
+import numpy as np
+from foxplot.cache import DEFAULT_MAX_BYTES, TransformCache, transform_cache
+from foxplot.categorical_series import CategoricalSeries
+from foxplot.fox import Fox
+from foxplot.series import Series
+from foxplot.time_index import TimeIndex
+
+
+class TestTransformCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = TransformCache(max_bytes=160)
+        series = [Series(f"/{i}", np.zeros(10), None) for i in range(3)]
+        cache.put("a", series[0], ())
+        cache.put("b", series[1], ())
+        self.assertIs(cache.get("a"), series[0])  # "b" is now the oldest
+        cache.put("c", series[2], ())
+        self.assertIsNone(cache.get("b"))
+        self.assertIs(cache.get("a"), series[0])
+        self.assertIs(cache.get("c"), series[2])
+        self.assertEqual(cache.info()["nbytes"], 160)
+
+    def test_result_over_budget(self):
+        cache = TransformCache(max_bytes=8)
+        cache.put("a", Series("/a", np.zeros(10), None), ())
+        self.assertEqual(len(cache), 0)
+
+    def test_resize(self):
+        cache = TransformCache()
+        cache.put("a", Series("/a", np.zeros(10), None), ())
+        cache.resize(0)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info()["max_bytes"], 0)
+
+
+class TestMemoize(unittest.TestCase):
+    def setUp(self):
+        transform_cache.clear()
+        times = TimeIndex(np.array([0.0, 1.0, 2.0, 3.0]))
+        self.series = Series("/x", np.array([0.0, 1.0, 4.0, 9.0]), times)
+
+    def tearDown(self):
+        transform_cache.resize(DEFAULT_MAX_BYTES)
+        transform_cache.clear()
+
+    def test_repeated_call(self):
+        deriv = self.series.deriv("s", cutoff=0.1)
+        self.assertIs(self.series.deriv("s", cutoff=0.1), deriv)
+        self.assertIs(self.series.deriv(unit="s", cutoff=0.1), deriv)
+        info = transform_cache.info()
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["misses"], 1)
+
+    def test_default_arguments(self):
+        self.assertIs(self.series.deriv("s"), self.series.deriv("s", 0.0))
+
+    def test_different_parameters(self):
+        self.assertIsNot(
+            self.series.deriv("s"), self.series.deriv("s", cutoff=1.0)
+        )
+        self.assertIsNot(self.series.std(2), self.series.std(3))
+
+    def test_new_time_values(self):
+        deriv = self.series.deriv("s")
+        self.series._time_index.set_values(np.array([0.0, 2.0, 4.0, 6.0]))
+        new_deriv = self.series.deriv("s")
+        self.assertIsNot(new_deriv, deriv)
+        self.assertEqual(new_deriv._values.tolist(), [0.5, 1.5, 2.5, 2.5])
+
+    def test_values_written_in_place(self):
+        deriv = self.series.deriv("s")
+        np.multiply(self.series, 10.0, out=(self.series,))
+        new_deriv = self.series.deriv("s")
+        self.assertIsNot(new_deriv, deriv)
+        self.assertEqual(new_deriv._values.tolist(), [10, 30, 50, 50])
+
+    def test_values_replaced(self):
+        deriv = self.series.deriv("s")
+        self.series._values = np.zeros(4)
+        self.assertEqual(self.series.deriv("s")._values.tolist(), [0] * 4)
+        self.assertIsNot(self.series.deriv("s"), deriv)
+
+    def test_sources_are_not_kept_alive(self):
+        self.series.deriv("s")
+        source = weakref.ref(self.series)
+        del self.series
+        gc.collect()
+        self.assertIsNone(source())
+
+    def test_dead_sources_leave_budget(self):
+        self.series.deriv("s")
+        self.assertEqual(transform_cache.info()["entries"], 1)
+        del self.series
+        gc.collect()
+        info = transform_cache.info()
+        self.assertEqual(info["entries"], 0)
+        self.assertEqual(info["nbytes"], 0)
+
+    def test_cached_results_are_read_only(self):
+        deriv = self.series.deriv("s")
+        with self.assertRaises(ValueError):
+            np.multiply(deriv, 10.0, out=(deriv,))
+        self.assertEqual(self.series.deriv("s")._values.tolist(), [1, 3, 5, 5])
+
+    def test_cached_result_replaced(self):
+        deriv = self.series.deriv("s")
+        deriv._values = np.zeros(4)
+        new_deriv = self.series.deriv("s")
+        self.assertIsNot(new_deriv, deriv)
+        self.assertEqual(new_deriv._values.tolist(), [1, 3, 5, 5])
+
+    def test_categorical_result_size(self):
+        series = CategoricalSeries(
+            "/mode",
+            np.array([0, 1, 1, 0], dtype=np.uint8),
+            np.array(["idle", "run"], dtype=object),
+            self.series._time_index,
+        )
+        result = series.resample(2.0)
+        self.assertEqual(
+            transform_cache.info()["nbytes"],
+            result._codes.nbytes + result._categories.nbytes,
+        )
+
+    def test_series_argument(self):
+        other = Series("/y", np.zeros(2), np.array([0.5, 1.5]))
+        self.assertIs(self.series.align(other), self.series.align(other))
+
+    def test_disabled(self):
+        transform_cache.resize(0)
+        self.assertIsNot(self.series.std(2), self.series.std(2))
+
+    def test_fox_cache_info(self):
+        fox = Fox.empty()
+        self.series.low_pass_filter(2.0)
+        self.series.low_pass_filter(2.0)
+        self.assertEqual(fox.cache_info()["hits"], 1)
+        self.assertEqual(fox.cache_info()["entries"], 1)
+        fox.clear_cache()
+        self.assertEqual(fox.cache_info()["entries"], 0)
+        fox.set_cache_limit(1024)
+        self.assertEqual(fox.cache_info()["max_bytes"], 1024)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from foxplot.cli import main
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.runs = {}
+        for name, start in (("a", 10_000), ("b", 20_000)):
+            path = os.path.join(self.directory.name, f"{name}.jsonl")
+            with open(path, "w", encoding="utf-8") as file:
+                for i in range(3):
+                    record = {
+                        "time": float(i),
+                        "stamp": start + 10 * i,
+                        "x": float(i),
+                    }
+                    file.write(json.dumps(record) + "\n")
+            self.runs[name] = path
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_main(self, *args: str):
+        argv = ["foxplot", *args]
+        with patch.object(sys, "argv", argv), patch("uplot.plot2") as plot2:
+            main()
+        plot2.assert_called_once()
+        return plot2.call_args
+
+    def test_plot_label_in_each_run(self):
+        call = self.run_main(
+            "--run", f"a={self.runs['a']}",
+            "--run", f"b={self.runs['b']}",
+            "-l", "/x",
+        )  # fmt: skip
+        self.assertEqual(len(call.args[1]), 2)
+
+    def test_time_in_each_run(self):
+        call = self.run_main(
+            "--run", f"a={self.runs['a']}",
+            "--run", f"b={self.runs['b']}",
+            "-t", "stamp",
+            "--time-unit", "ms",
+            "-l", "/x",
+        )  # fmt: skip
+        times = call.args[0]
+        np.testing.assert_allclose(
+            times, [10.0, 10.01, 10.02, 20.0, 20.01, 20.02]
+        )
+
+    def test_describe_waits_for_loading(self):
+        argv = ["foxplot", self.runs["a"], "--describe", "-i"]
+        with (
+            patch.object(sys, "argv", argv),
+            patch("IPython.embed"),
+            patch("builtins.print") as print_,
+        ):
+            main()
+        printed = [str(call.args[0]) for call in print_.call_args_list]
+        self.assertIn("Detected", printed[0])  # once loading is complete
+        self.assertIn("/x", printed[1])
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from foxplot.categorical_series import CategoricalSeries
+from foxplot.columnar import is_columnar, read_columns, write_columns
+from foxplot.exceptions import FoxplotError
+from foxplot.series import Series
+from foxplot.time_index import TimeIndex
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.series_dict = {
+            "/time": Series("/time", np.array([0.0, 0.5, 1.0]), None),
+            "/a/b": Series("/a/b", np.array([1, 2, 3], dtype=np.int8), None),
+            "/mode": CategoricalSeries(
+                "/mode",
+                codes=np.array([0, 1, 2], dtype=np.int8),
+                categories=np.array([None, "idle", "run"], dtype=object),
+                times=None,
+            ),
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def round_trip(self, suffix):
+        path = os.path.join(self.directory.name, f"test{suffix}")
+        write_columns(path, self.series_dict)
+        time_index = TimeIndex()
+        series_dict = read_columns(path, time_index)
+        self.assertEqual(set(series_dict), set(self.series_dict))
+        self.assertEqual(series_dict["/a/b"]._values.tolist(), [1, 2, 3])
+        self.assertEqual(series_dict["/a/b"]._values.dtype, np.int8)
+        self.assertIs(series_dict["/a/b"]._time_index, time_index)
+        mode = series_dict["/mode"]
+        self.assertIsInstance(mode, CategoricalSeries)
+        self.assertEqual(mode._values.tolist(), [None, "idle", "run"])
+
+    def test_is_columnar(self):
+        self.assertTrue(is_columnar("log.npz"))
+        self.assertTrue(is_columnar("log.parquet"))
+        self.assertFalse(is_columnar("log.jsonl"))
+
+    def test_npz(self):
+        self.round_trip(".npz")
+
+    def test_npz_columns_are_memory_mapped(self):
+        path = os.path.join(self.directory.name, "test.npz")
+        write_columns(path, self.series_dict)
+        values = read_columns(path, TimeIndex())["/time"]._values
+        self.assertIsInstance(values.base, np.memmap)
+
+    def test_skip_mixed_types(self):
+        path = os.path.join(self.directory.name, "test.npz")
+        mixed = Series("/mixed", np.array([1, "two"], dtype=object), None)
+        with self.assertLogs(level="WARNING"):
+            write_columns(path, {"/mixed": mixed})
+        self.assertEqual(read_columns(path, TimeIndex()), {})
+
+    def test_unknown_format(self):
+        with self.assertRaises(FoxplotError):
+            write_columns("test.csv", self.series_dict)
+
+    @unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_parquet(self):
+        self.round_trip(".parquet")
+
+    @unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_arrow(self):
+        self.round_trip(".arrow")
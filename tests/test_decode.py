@@ -5,6 +5,7 @@
 # Copyright 2023 Inria
 
 import json
+import os
 import sys
 import tempfile
 import unittest
@@ -14,6 +15,7 @@ import msgpack
 
 from foxplot.decode import decode, decode_json
 from foxplot.exceptions import FoxplotError
+from foxplot.ingest_stats import IngestStats
 
 
 class TestDecoders(unittest.TestCase):
@@ -33,12 +35,56 @@ class TestDecoders(unittest.TestCase):
 
     def tearDown(self):
         self.json_file.close()
+        self.msgpack_file.close()
 
     def test_decode_json(self):
         read_dicts = list(decode_json(file=self.json_file.file))
         for read, expected in zip(read_dicts, self.EXPECTED_DICTS):
             self.assertDictEqual(read, expected)
 
+    def test_decode_stats(self):
+        stats = IngestStats()
+        list(decode_json(file=self.json_file.file, stats=stats))
+        expected_size = sum(
+            len(json.dumps(d)) + 1 for d in self.EXPECTED_DICTS
+        )
+        self.assertEqual(stats.bytes_read, expected_size)
+        self.assertGreater(stats.durations["read"], 0.0)
+
+    def test_decode_stats_counts_encoded_bytes(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", encoding="utf-8", delete=False
+        ) as f:
+            f.write('{"temp": "25 \u00b0C"}\n')
+        stats = IngestStats()
+        self.assertEqual(list(decode(f.name, stats)), [{"temp": "25 °C"}])
+        self.assertEqual(stats.bytes_read, os.path.getsize(f.name))
+        os.unlink(f.name)
+
+    def test_decode_mpack_stats(self):
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".mpack", delete=False
+        ) as f:
+            for d in self.EXPECTED_DICTS:
+                f.write(msgpack.packb(d))
+        stats = IngestStats()
+        self.assertEqual(list(decode(f.name, stats)), self.EXPECTED_DICTS)
+        self.assertEqual(stats.bytes_read, os.path.getsize(f.name))
+        os.unlink(f.name)
+
+    def test_decode_mpack_stats_while_reading(self):
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".mpack", delete=False
+        ) as f:
+            for d in self.EXPECTED_DICTS:
+                f.write(msgpack.packb(d))
+        stats = IngestStats()
+        records = decode(f.name, stats)
+        self.assertEqual(next(records), self.EXPECTED_DICTS[0])
+        self.assertGreater(stats.bytes_read, 0)
+        records.close()
+        os.unlink(f.name)
+
 
 class TestDecode(unittest.TestCase):
     def test_decode_stdin(self):
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from foxplot.describe import Description, describe_values
+
+
+class TestDescribe(unittest.TestCase):
+    def test_numbers(self):
+        values = np.array([1.0, 1.0, np.nan, np.nan, 4.0, 2.0, 2.0, 7.0])
+        for chunk_size in (2, 3, 100):
+            stats = describe_values(values, chunk_size)
+            numbers = values[~np.isnan(values)]
+            self.assertEqual(stats["count"], 8)
+            self.assertEqual(stats["nan_count"], 2)
+            self.assertEqual(stats["min"], 1.0)
+            self.assertEqual(stats["max"], 7.0)
+            self.assertAlmostEqual(stats["mean"], numbers.mean())
+            self.assertAlmostEqual(stats["std"], numbers.std())
+            self.assertEqual(stats["first"], 1.0)
+            self.assertEqual(stats["last"], 7.0)
+            self.assertEqual(stats["changes"], 4)
+
+    def test_integers(self):
+        stats = describe_values(np.array([3, 1, 2], dtype=np.int8))
+        self.assertEqual((stats["min"], stats["max"]), (1.0, 3.0))
+        self.assertEqual(stats["changes"], 2)
+
+    def test_all_missing(self):
+        stats = describe_values(np.array([np.nan, np.nan]))
+        self.assertEqual(stats["nan_count"], 2)
+        self.assertTrue(np.isnan(stats["mean"]))
+        self.assertEqual(stats["changes"], 0)
+
+    def test_empty(self):
+        stats = describe_values(np.array([]))
+        self.assertEqual(stats["count"], 0)
+        self.assertIsNone(stats["first"])
+
+    def test_objects(self):
+        values = np.array([None, "idle", "idle", "run"], dtype=object)
+        stats = describe_values(values)
+        self.assertEqual(stats["nan_count"], 1)
+        self.assertEqual(stats["changes"], 2)
+        self.assertEqual(stats["last"], "run")
+        self.assertTrue(np.isnan(stats["mean"]))
+
+    def test_table(self):
+        description = Description(
+            {
+                "/a": describe_values(np.array([1.0, 2.0])),
+                "/long/label": describe_values(np.array([0.5])),
+            }
+        )
+        lines = str(description).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("label"))
+        self.assertTrue(lines[2].startswith("/long/label"))
+        self.assertEqual(len(description), 2)
+        self.assertEqual(description["/a"]["mean"], 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
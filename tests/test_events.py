@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from foxplot.events import (
+    crossing_indices,
+    debounce,
+    find_intervals,
+    hysteresis_state,
+)
+from foxplot.exceptions import FoxplotError
+
+
+class TestEvents(unittest.TestCase):
+    def test_hysteresis_state(self):
+        values = np.array([np.nan, 0.0, 1.1, 0.9, 1.3, 0.5, np.nan, 2.0])
+        state = hysteresis_state(values, 1.0)
+        self.assertEqual(state.tolist(), [-1, 0, 1, 0, 1, 0, 0, 1])
+        state = hysteresis_state(values, 1.0, hysteresis=0.5)
+        self.assertEqual(state.tolist(), [-1, 0, 0, 0, 1, 0, 0, 1])
+
+    def test_invalid_hysteresis(self):
+        with self.assertRaises(FoxplotError):
+            hysteresis_state(np.zeros(3), 1.0, hysteresis=-1.0)
+
+    def test_crossing_indices(self):
+        state = np.array([-1, 1, 0, 0, 1, 1, 0], dtype=np.int8)
+        self.assertEqual(crossing_indices(state, "up").tolist(), [4])
+        self.assertEqual(crossing_indices(state, "down").tolist(), [2, 6])
+        self.assertEqual(crossing_indices(state).tolist(), [2, 4, 6])
+        with self.assertRaises(FoxplotError):
+            crossing_indices(state, "sideways")
+
+    def test_debounce(self):
+        state = np.array([0, 0, 1, 0, 0, 1, 1, 1, 0], dtype=np.int8)
+        times = np.arange(9.0)
+        debounced = debounce(state, times, min_duration=2.0)
+        self.assertEqual(debounced.tolist(), [0, 0, 0, 0, 0, 1, 1, 1, 1])
+        self.assertIs(debounce(state, times, 0.0), state)
+
+    def test_find_intervals(self):
+        mask = np.array(
+            [
+                [False, True, True, False, True],
+                [False, False, False, False, False],
+                [True, False, False, False, False],
+            ]
+        )
+        times = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        rows, intervals = find_intervals(mask, times)
+        self.assertEqual(rows.tolist(), [0, 0, 2])
+        self.assertEqual(
+            intervals.tolist(), [[1.0, 3.0], [4.0, 4.0], [0.0, 1.0]]
+        )
+        rows, intervals = find_intervals(mask, times, min_duration=1.5)
+        self.assertEqual(rows.tolist(), [0])
+        self.assertEqual(intervals.tolist(), [[1.0, 3.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
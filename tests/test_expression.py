@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from foxplot.exceptions import FoxplotError
+from foxplot.expression import Expression
+from foxplot.series import Series
+from foxplot.time_index import TimeIndex
+
+
+def fake_numexpr():
+    """Mock of numexpr evaluating its string with NumPy."""
+    numexpr = MagicMock()
+    numexpr.evaluate.side_effect = lambda string, local_dict: eval(
+        string, {"abs": np.abs}, dict(local_dict)
+    )
+    return numexpr
+
+
+@patch("foxplot.expression._import_numexpr", return_value=None)
+class TestExpression(unittest.TestCase):
+    def setUp(self):
+        times = TimeIndex(np.array([0.0, 1.0, 2.0]))
+        self.a = Series("/a", np.array([1.0, -2.0, 3.0]), times)
+        self.b = Series("/b", np.array([2.0, 2.0, 2.0]), times)
+        self.c = Series("/c", np.array([1.0, 2.0, 4.0]), times)
+
+    def test_lazy_is_not_computed(self, _):
+        expression = (self.a.lazy() - self.b).abs() * 3.0 / self.c
+        self.assertIsInstance(expression, Expression)
+        self.assertEqual(expression.label, "((abs(/(a - b)) * 3.0) / /c)")
+        self.assertEqual(expression.leaves(), [self.a, self.b, self.c])
+
+    def test_evaluate(self, _):
+        expression = (self.a.lazy() - self.b).abs() * 3.0 / self.c
+        result = expression.evaluate()
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result._values.tolist(), [3.0, 6.0, 0.75])
+        self.assertIs(result._time_index, self.a._time_index)
+        self.assertEqual(result._label, expression.label)
+
+    def test_evaluate_matches_eager(self, _):
+        eager = -(self.a * 2.0 + self.b) / self.c
+        lazy = (-(self.a.lazy() * 2.0 + self.b) / self.c).evaluate()
+        np.testing.assert_array_equal(lazy._values, eager._values)
+
+    def test_evaluate_integers(self, _):
+        counts = Series("/n", np.int8([100, -100, 1]), self.a._time_index)
+        result = (counts.lazy() + counts - counts.lazy().abs()).evaluate()
+        self.assertEqual(result._values.tolist(), [100.0, -300.0, 1.0])
+
+    def test_evaluate_is_cached(self, _):
+        expression = self.a.lazy() + self.b
+        self.assertIs(expression.evaluate(), expression.evaluate())
+
+    def test_leaves_are_not_overwritten(self, _):
+        (-(self.a.lazy() + 1.0)).abs().evaluate()
+        self.assertEqual(self.a._values.tolist(), [1.0, -2.0, 3.0])
+
+    def test_shared_subexpression(self, _):
+        diff = self.a.lazy() - self.b
+        result = (diff * 2.0 + diff.abs()).evaluate()
+        self.assertEqual(result._values.tolist(), [-1.0, -4.0, 3.0])
+
+    def test_reflected_operators(self, _):
+        result = (1.0 - self.a.lazy() / 2).evaluate()
+        self.assertEqual(result._values.tolist(), [0.5, 2.0, -0.5])
+
+    def test_double_precision(self, _):
+        a = Series("/a", np.array([1.0, 2.0], dtype=np.float32), None)
+        result = (a.lazy() / 3 + a).evaluate()
+        self.assertEqual(result._values.dtype, np.float64)
+
+    def test_preserve_requested_float32(self, _):
+        values = np.array([1.0, 2.0], dtype=np.float32)
+        a = Series("/a", values, None, np.dtype(np.float32))
+        result = (a.lazy() * 0.5 + a).evaluate()
+        self.assertEqual(result._values.dtype, np.float32)
+
+    def test_integer_division(self, _):
+        a = Series("/a", np.array([1, 2], dtype=np.int64), None)
+        result = ((a.lazy() + 1) / 2).evaluate()
+        self.assertEqual(result._values.tolist(), [1.0, 1.5])
+
+    def test_different_lengths(self, _):
+        short = Series("/s", np.array([1.0]), None)
+        with self.assertRaises(FoxplotError):
+            (self.a.lazy() + short).evaluate()
+
+    def test_different_time_indexes(self, _):
+        shifted = TimeIndex(np.array([0.5, 1.5, 2.5]))
+        other = Series("/d", np.array([1.0, 1.0, 1.0]), shifted)
+        with self.assertRaises(FoxplotError):
+            (self.a.lazy() + other).evaluate()
+
+    def test_equal_time_indexes(self, _):
+        times = TimeIndex(np.array([0.0, 1.0, 2.0]))
+        other = Series("/d", np.array([1.0, 1.0, 1.0]), times)
+        result = (self.a.lazy() + other).evaluate()
+        self.assertEqual(result._values.tolist(), [2.0, -1.0, 4.0])
+
+    def test_invalid_operand(self, _):
+        with self.assertRaises(TypeError):
+            self.a.lazy() + "foo"
+
+    def test_numexpr(self, import_numexpr):
+        import_numexpr.return_value = fake_numexpr()
+        expression = (self.a.lazy() - self.b).abs() * 3.0 / self.c
+        result = expression.evaluate()
+        self.assertEqual(result._values.tolist(), [3.0, 6.0, 0.75])
+        string = import_numexpr.return_value.evaluate.call_args.args[0]
+        self.assertEqual(string, "((abs((v0 - v1)) * 3.0) / v2)")
@@ -7,12 +7,14 @@
 import json
 import os
 import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
 import numpy as np
 from foxplot.exceptions import FoxplotError
-from foxplot.fox import Fox, _INTEGER_VALUE_FMT, _is_integer_valued
+from foxplot.fox import Fox, _integer_value_fmt, _is_integer_valued
 from foxplot.series import Series
 
 
@@ -264,6 +266,274 @@ class TestFox(unittest.TestCase):
         finally:
             os.unlink(temp_filename)
 
+    def test_stats(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", delete=False
+        ) as f:
+            for i in range(10):
+                f.write(json.dumps({"time": i, "nested": {"value": i}}) + "\n")
+            temp_filename = f.name
+        collected = []
+        try:
+            fox = Fox(temp_filename, profile=True, on_stats=collected.append)
+            stats = fox.stats()
+            self.assertIs(collected[0], stats)
+            self.assertEqual(stats.nb_records, 10)
+            self.assertEqual(stats.nb_leaves, 2)
+            self.assertEqual(stats.bytes_read, os.path.getsize(temp_filename))
+            self.assertGreater(stats.peak_memory, 0)
+            self.assertGreater(stats.records_per_second, 0.0)
+        finally:
+            os.unlink(temp_filename)
+
+    def test_interrupted_loading_keeps_partial_data(self):
+        def interrupted_decode(filename, stats):
+            for i in range(3):
+                yield {"time": float(i), "value": i}
+            raise KeyboardInterrupt
+
+        with patch("foxplot.fox.decode", interrupted_decode):
+            with self.assertLogs(level="WARNING"):
+                fox = Fox("stdin")
+        self.assertTrue(fox.stats().interrupted)
+        self.assertEqual(fox.length, 3)
+        self.assertEqual(fox.data.value._values.tolist(), [0, 1, 2])
+
+    def test_background_loading(self):
+        release = threading.Event()
+
+        def slow_decode(filename, stats):
+            yield {"time": 0.0, "value": 1.0}
+            release.wait()
+            yield {"time": 1.0, "value": 2.0}
+
+        loaded = []
+        with patch("foxplot.fox.decode", slow_decode):
+            fox = Fox("stdin", background=True, on_loaded=loaded.append)
+            while fox.length < 1:
+                time.sleep(0.001)
+            value = fox.data.value  # series is still receiving values
+            self.assertFalse(fox.wait(timeout=0.0))
+            release.set()
+            self.assertEqual(value._values.tolist(), [1.0, 2.0])
+            self.assertTrue(fox.wait())
+        self.assertEqual(loaded, [fox])
+        self.assertIsInstance(fox.data.value, Series)
+
+    def test_background_loading_error(self):
+        def failing_decode(filename, stats):
+            yield {"value": 1.0}
+            raise ValueError("corrupt input")
+
+        with patch("foxplot.fox.decode", failing_decode):
+            fox = Fox("stdin", background=True)
+            with self.assertRaises(FoxplotError):
+                fox.wait()
+        self.assertEqual(fox.data.value._values.tolist(), [1.0])
+
+    def test_constructor_with_progress(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", delete=False
+        ) as f:
+            f.write('{"time": 0.0}\n')
+            temp_filename = f.name
+        try:
+            with patch("foxplot.progress.sys.stderr") as stderr:
+                Fox(temp_filename, progress=True)
+            report = stderr.write.call_args.args[0]
+            self.assertIn("Loaded 1 records", report)
+            self.assertIn("100.0%", report)
+        finally:
+            os.unlink(temp_filename)
+
+    def write_rotated_logs(self, directory):
+        records = {
+            "run.000.jsonl": [{"time": 2.0, "x": 3}, {"time": 3.0, "x": 4}],
+            "run.001.jsonl": [
+                {"time": 0.0, "x": 1, "mode": "idle"},
+                {"time": 1.0, "x": 2},
+            ],
+            "run.002.jsonl": [{"time": 4.0, "x": 5, "mode": "run"}],
+        }
+        for name, dicts in records.items():
+            with open(os.path.join(directory, name), "w") as file:
+                file.writelines(json.dumps(d) + "\n" for d in dicts)
+
+    def test_constructor_with_several_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_rotated_logs(directory)
+            for workers in (1, 2):
+                fox = Fox(
+                    os.path.join(directory, "run.*.jsonl"), workers=workers
+                )
+                self.assertEqual(fox.length, 5)
+                self.assertEqual(fox.stats().nb_records, 5)
+                self.assertEqual(
+                    fox.data.time._values.tolist(), [0.0, 1.0, 2.0, 3.0, 4.0]
+                )
+                self.assertEqual(fox.data.x._values.tolist(), [1, 2, 3, 4, 5])
+                self.assertEqual(
+                    fox.data.mode._values.tolist(),
+                    ["idle", "idle", "idle", "idle", "run"],
+                )
+
+    def test_constructor_with_list_of_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_rotated_logs(directory)
+            names = ["run.002.jsonl", "run.000.jsonl"]
+            fox = Fox([os.path.join(directory, n) for n in names], workers=1)
+            self.assertEqual(fox.data.x._values.tolist(), [3, 4, 5])
+            self.assertEqual(
+                fox.data.mode._values.tolist(), [None, None, "run"]
+            )
+
+    def test_constructor_with_list_shape_changing_across_files(self):
+        records = {
+            "run.000.jsonl": [{"time": 0.0, "scan": [1.0, 2.0]}],
+            "run.001.jsonl": [{"time": 1.0, "scan": [3.0, [4.0]]}],
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            for name, dicts in records.items():
+                with open(os.path.join(directory, name), "w") as file:
+                    file.writelines(json.dumps(d) + "\n" for d in dicts)
+            fox = Fox(os.path.join(directory, "run.*.jsonl"), workers=1)
+            self.assertEqual(fox.data.scan[0]._values.tolist(), [1.0, 3.0])
+            self.assertEqual(
+                fox.data.scan[1]._values.tolist(), [2.0, [4.0]]
+            )
+
+    def test_constructor_with_unmatched_pattern(self):
+        with self.assertRaises(FoxplotError):
+            Fox("/nonexistent/run.*.jsonl")
+
+    def write_runs(self, directory):
+        runs = {
+            "a": [{"time": 10.0, "x": 1.0}, {"time": 11.0, "x": 2.0}],
+            "b": [
+                {"time": 20.0, "x": 3.0},
+                {"time": 20.5, "x": 4.0},
+                {"time": 21.0, "x": 5.0},
+            ],
+        }
+        files = {}
+        for name, dicts in runs.items():
+            files[name] = os.path.join(directory, f"{name}.jsonl")
+            with open(files[name], "w") as file:
+                file.writelines(json.dumps(d) + "\n" for d in dicts)
+        return files
+
+    def test_constructor_with_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fox = Fox(self.write_runs(directory), workers=1)
+        self.assertEqual(fox.length, 3)
+        self.assertEqual(fox.data.a.x._values.tolist(), [1.0, 2.0])
+        self.assertEqual(fox.data.b.x._values.tolist(), [3.0, 4.0, 5.0])
+        self.assertEqual(fox.data.a.x._label, "/a/x")
+        self.assertIsNot(fox.data.a.x._time_index, fox.data.b.x._time_index)
+        self.assertEqual(fox.data.a.x._time_index.values.tolist(), [10, 11])
+
+    def test_constructor_with_runs_timestamps(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "a.jsonl")
+            with open(path, "w") as file:
+                for stamp in ("2024-03-01T12:00:00Z", "2024-03-01T12:00:01Z"):
+                    file.write(json.dumps({"timestamp": stamp, "x": 1.0}))
+                    file.write("\n")
+            fox = Fox({"a": path}, relative_time=True)
+        self.assertEqual(
+            fox.data.a.x._time_index.values.tolist(), [0.0, 1.0]
+        )
+
+    def test_constructor_with_runs_relative_time(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fox = Fox(self.write_runs(directory), relative_time=True)
+        self.assertEqual(
+            fox.data.b.x._time_index.values.tolist(), [0.0, 0.5, 1.0]
+        )
+        self.assertEqual(fox.data.b.time._values.tolist(), [20.0, 20.5, 21])
+
+    def test_resample_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fox = Fox(self.write_runs(directory), relative_time=True)
+        resampled = fox.resample(0.5, "mean")
+        a, b = resampled.data.a.x, resampled.data.b.x
+        self.assertEqual(a._times.tolist(), [0.0, 0.5, 1.0])
+        self.assertEqual(b._values.tolist(), [3.0, 4.0, 5.0])
+        self.assertIsNot(a._time_index, b._time_index)
+        self.assertEqual(resampled.length, 3)
+
+    def test_plot_overlays_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fox = Fox(self.write_runs(directory), relative_time=True)
+        with patch("uplot.plot2") as plot2:
+            fox.plot("/x")
+        times, (a_values, b_values), _ = plot2.call_args.args
+        self.assertEqual(times.tolist(), [0.0, 0.5, 1.0])
+        self.assertEqual(a_values.tolist(), [1.0, 1.0, 2.0])
+        self.assertEqual(b_values.tolist(), [3.0, 4.0, 5.0])
+
+    def test_export_and_read_back(self):
+        fox = Fox.empty()
+        fox.unpack({"time": 0.0, "obs": {"x": 1.0, "v": [1, 2]}, "y": 5})
+        fox.unpack({"time": 0.5, "obs": {"x": 2.0, "v": [3, 4]}, "y": 6})
+        fox.freeze()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "log.npz")
+            fox.export(path, labels=["/time", "/obs"])
+            loaded = Fox(path)
+            self.assertEqual(loaded.length, 2)
+            self.assertEqual(loaded.stats().nb_leaves, 4)
+            self.assertEqual(loaded.data.obs.x._values.tolist(), [1.0, 2.0])
+            self.assertEqual(loaded.data.obs.v[1]._values.tolist(), [2, 4])
+            self.assertEqual(loaded.data.obs.v[1]._label, "/obs/v/1")
+            self.assertNotIn("y", loaded.data.__dict__)
+            loaded.set_time(loaded.data.time)
+            self.assertIs(loaded.data.obs.x._time_index, loaded.time_index)
+
+    def test_export_invalid_label(self):
+        fox = Fox.empty()
+        fox.unpack({"obs": {"x": 1.0}})
+        fox.freeze()
+        with self.assertRaises(FoxplotError):
+            fox.export("log.npz", labels=["/obs/y"])
+
+    def test_constructor_with_single_precision(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", delete=False
+        ) as f:
+            f.write('{"time": 1681318144.751641, "value": 0.1}\n')
+            f.write('{"time": 1681318144.761641, "value": 0.2}\n')
+            temp_filename = f.name
+        try:
+            fox = Fox(temp_filename, dtype="float32")
+            self.assertEqual(fox.data.value._values.dtype, np.float32)
+            self.assertEqual(fox.data.time._values.dtype, np.float64)
+            result = fox.data.value / 3
+            self.assertEqual(result._values.dtype, np.float32)
+        finally:
+            os.unlink(temp_filename)
+
+    def test_constructor_with_single_precision_time_key(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", delete=False
+        ) as f:
+            f.write('{"header": {"stamp": 1681318144.751641}, "value": 0.1}\n')
+            f.write('{"header": {"stamp": 1681318144.761641}, "value": 0.2}\n')
+            temp_filename = f.name
+        try:
+            fox = Fox(temp_filename, dtype="float32", time_key="/header/stamp")
+            stamp = fox.data.header.stamp
+            self.assertEqual(stamp._values.dtype, np.float64)
+            self.assertEqual(fox.data.value._values.dtype, np.float32)
+            fox.set_time(stamp)
+            self.assertEqual(len(np.unique(fox.time_index.values)), 2)
+        finally:
+            os.unlink(temp_filename)
+
+    def test_constructor_with_invalid_dtype(self):
+        with self.assertRaises(FoxplotError):
+            Fox(None, dtype="int32")
+
     def test_detect_time_with_time_key(self):
         fox = Fox.empty()
         fox.unpack({"time": 0.0, "foo": 1.0})
@@ -272,8 +542,131 @@ class TestFox(unittest.TestCase):
 
         # Test detect_time finds 'time' key
         fox.detect_time()
-        self.assertIsNotNone(fox._Fox__times)
-        self.assertEqual(len(fox._Fox__times), 2)
+        self.assertIsNotNone(fox.time_index.values)
+        self.assertEqual(len(fox.time_index), 2)
+
+    def test_set_time_shares_time_index(self):
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".jsonl", delete=False
+        ) as f:
+            f.write('{"time": 0.0, "nested": {"value": 1.0}}\n')
+            f.write('{"time": 0.5, "nested": {"value": 2.0}}\n')
+            temp_filename = f.name
+        try:
+            fox = Fox(temp_filename)
+            fox.set_time(fox.data.time)
+            value = fox.data.nested.value
+            self.assertIs(value._time_index, fox.time_index)
+            self.assertEqual(value._times.tolist(), [0.0, 0.5])
+            self.assertEqual(value.deriv("s")._values.tolist(), [2.0, 2.0])
+        finally:
+            os.unlink(temp_filename)
+
+    def test_resample(self):
+        fox = Fox.empty()
+        for i in range(10):
+            fox.unpack({"time": 0.1 * i, "x": float(i), "mode": f"m{i // 5}"})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        resampled = fox.resample(0.5, "mean")
+        self.assertEqual(resampled.length, 2)
+        self.assertEqual(resampled.data.x._values.tolist(), [2.0, 7.0])
+        self.assertEqual(resampled.data.mode._values.tolist(), ["m0", "m1"])
+        self.assertIs(resampled.data.x._time_index, resampled.time_index)
+
+    def test_map(self):
+        fox = Fox.empty()
+        for i in range(10):
+            fox.unpack({"time": 0.1 * i, "joints": {"a": i, "b": -i}})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        result = fox.map(lambda s: s.deriv("s"), fox.data.joints, workers=4)
+        self.assertEqual(result._label, "/joints")
+        expected = fox.data.joints.b.deriv("s")
+        self.assertEqual(result.b._values.tolist(), expected._values.tolist())
+        self.assertEqual(fox.map(len, "/joints/a"), 10)
+        self.assertEqual(fox.map(len, ["/joints/a", fox.data.time]), [10, 10])
+        self.assertEqual(fox.map(len).joints.b, 10)
+
+    def test_map_invalid_selection(self):
+        fox = Fox.empty()
+        fox.unpack({"x": 1.0})
+        fox.freeze()
+        with self.assertRaises(TypeError):
+            fox.map(len, [42])
+
+    def test_set_time_iso_strings(self):
+        fox = Fox.empty()
+        fox.unpack({"time": "2024-03-01T12:00:00Z", "x": 0.0})
+        fox.unpack({"time": "2024-03-01T12:00:00.5Z", "x": 1.0})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        self.assertEqual(
+            fox.time_index.values.tolist(), [1709294400.0, 1709294400.5]
+        )
+        self.assertEqual(fox.data.x.deriv("s")._values.tolist(), [2.0, 2.0])
+
+    def test_set_time_epoch_nanoseconds(self):
+        fox = Fox.empty()
+        start = 1_709_294_400_000_000_000
+        for i in range(3):
+            fox.unpack({"time": start + 1000 * i, "x": float(i)})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        self.assertEqual(fox.time_index.nanoseconds[-1], start + 2000)
+        self.assertEqual(fox.data.x.deriv("s")._values.tolist(), [1e6] * 3)
+        fox.set_time(fox.data.x, unit="ms")
+        self.assertEqual(fox.time_index.values.tolist(), [0.0, 0.001, 0.002])
+
+    def test_set_time_leaves_input_index(self):
+        fox = Fox.empty()
+        for i in range(3):
+            fox.unpack({"time": float(i), "x": 10.0 * i})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        window = fox.data.x.slice(1.0)
+        with self.assertRaises(FoxplotError):
+            fox.set_time(window)
+        self.assertEqual(window._times.tolist(), [1.0, 2.0])
+        standalone = Series("/t", np.array([5.0, 6.0, 7.0]), None)
+        fox.set_time(standalone)
+        self.assertIsNone(standalone._times)
+        self.assertEqual(fox.time_index.values.tolist(), [5.0, 6.0, 7.0])
+
+    def test_describe(self):
+        fox = Fox.empty()
+        for i in range(4):
+            fox.unpack({"time": float(i), "x": {"a": i, "b": "on"}})
+        hot = fox.describe()
+        self.assertEqual(hot["/x/a"]["max"], 3.0)
+        fox.unpack({"time": 4.0, "x": {"a": 8}, "scan": [1.0, 2.0]})
+        fox.freeze()
+        description = fox.describe(workers=2)
+        self.assertEqual(
+            list(description), ["/time", "/x/a", "/x/b", "/scan/0", "/scan/1"]
+        )
+        self.assertEqual(description["/x/a"]["mean"], 2.8)
+        self.assertEqual(description["/x/b"]["changes"], 0)
+        self.assertEqual(description["/scan/1"]["nan_count"], 4)
+        selection = fox.describe(["/x/a", fox.data.time])
+        self.assertEqual(list(selection), ["/x/a", "/time"])
+
+    def test_find(self):
+        fox = Fox.empty()
+        currents = [(0, 5), (25, 5), (25, 30), (0, 30), (0, 0)]
+        for i, (a, b) in enumerate(currents):
+            fox.unpack({"time": float(i), "motors": {"a": a, "b": b}})
+        fox.unpack({"time": 5.0, "mode": "idle"})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        events = fox.find(lambda x: x > 20.0, "/motors", workers=2)
+        self.assertEqual(list(events), ["/motors/a", "/motors/b"])
+        self.assertEqual(events["/motors/a"].tolist(), [[1.0, 3.0]])
+        self.assertEqual(events["/motors/b"].tolist(), [[2.0, 4.0]])
+        events = fox.find(lambda x: x > 20.0, min_duration=2.5)
+        self.assertEqual(list(events), [])
+        with self.assertRaises(FoxplotError):
+            fox.find(lambda x: x.any(), "/motors")
 
     def test_detect_time_with_timestamp_key(self):
         fox = Fox.empty()
@@ -283,8 +676,8 @@ class TestFox(unittest.TestCase):
 
         # Test detect_time finds 'timestamp' key
         fox.detect_time()
-        self.assertIsNotNone(fox._Fox__times)
-        self.assertEqual(len(fox._Fox__times), 2)
+        self.assertIsNotNone(fox.time_index.values)
+        self.assertEqual(len(fox.time_index), 2)
 
     def test_detect_time_no_time_key(self):
         fox = Fox.empty()
@@ -293,7 +686,7 @@ class TestFox(unittest.TestCase):
 
         # Test detect_time when no time key is found
         fox.detect_time()
-        self.assertIsNone(fox._Fox__times)
+        self.assertIsNone(fox.time_index.values)
 
     def test_get_series_valid_label(self):
         fox = Fox.empty()
@@ -333,6 +726,33 @@ class TestFox(unittest.TestCase):
         fox.plot(left=fox.data.value)
         fox.plot(left=fox.data.value, right=fox.data.value)
 
+    def test_plot_lazy_expression(self):
+        fox = Fox.empty()
+        fox.unpack({"time": 0.0, "a": 1.0, "b": 3.0})
+        fox.unpack({"time": 1.0, "a": 2.0, "b": 1.0})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        with patch("uplot.plot2") as plot2:
+            fox.plot((fox.data.a.lazy() - fox.data.b).abs())
+        _, (values,), _ = plot2.call_args.args
+        self.assertEqual(values.tolist(), [2.0, 1.0])
+
+    def test_plot_spectrum(self):
+        fox = Fox.empty()
+        for i in range(64):
+            fox.unpack({"time": 0.1 * i, "x": float(i % 2)})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        with patch("uplot.plot2") as plot2:
+            fox.plot(fox.data.x.psd(segment_length=16))
+        frequencies = plot2.call_args.args[0]
+        self.assertAlmostEqual(frequencies[-1], 5.0)
+        self.assertFalse(plot2.call_args.kwargs["timestamped"])
+        series = plot2.call_args.kwargs["series"]
+        self.assertEqual(series[0]["label"], "Frequency (Hz)")
+        with self.assertRaises(FoxplotError):
+            fox.plot([fox.data.x, fox.data.x.fft()])
+
     def test_plot_with_custom_title(self):
         fox = Fox.empty()
         fox.unpack({"time": 0.0, "value": 1.0})
@@ -358,7 +778,7 @@ class TestFox(unittest.TestCase):
 
         # Test __list_to_dict with invalid type
         with self.assertRaises(TypeError):
-            fox._Fox__list_to_dict(["invalid_type"])
+            fox._Fox__list_to_dict([42])
 
     def test_list_to_dict_with_nested_non_series(self):
         fox = Fox.empty()
@@ -400,10 +820,10 @@ class TestFox(unittest.TestCase):
         fox.unpack({"time": 1.0, "count": 108000})
         fox.data._freeze(fox.length)
         fox.set_time(fox.data.time)
-        with patch("foxplot.fox.uplot.plot2") as mock_plot2:
+        with patch("uplot.plot2") as mock_plot2:
             fox.plot(left=[fox.data.count])
         series = mock_plot2.call_args.kwargs["series"]
-        self.assertEqual(series[1]["value"], _INTEGER_VALUE_FMT)
+        self.assertEqual(series[1]["value"], _integer_value_fmt())
 
     def test_plot_mixed_integer_and_float_series(self):
         # Integer series gets k/M/B formatter; float series keeps the default
@@ -412,11 +832,89 @@ class TestFox(unittest.TestCase):
         fox.unpack({"time": 1.0, "count": 90000, "rate": 4.56})
         fox.data._freeze(fox.length)
         fox.set_time(fox.data.time)
-        with patch("foxplot.fox.uplot.plot2") as mock_plot2:
+        with patch("uplot.plot2") as mock_plot2:
             fox.plot(left=[fox.data.count], right=[fox.data.rate])
         series = mock_plot2.call_args.kwargs["series"]
-        self.assertEqual(series[1]["value"], _INTEGER_VALUE_FMT)
-        self.assertNotEqual(series[2]["value"], _INTEGER_VALUE_FMT)
+        self.assertEqual(series[1]["value"], _integer_value_fmt())
+        self.assertNotEqual(series[2]["value"], _integer_value_fmt())
+
+    def test_plot_categorical_and_boolean_series(self):
+        fox = Fox.empty()
+        fox.unpack({"time": 0.0, "mode": "idle", "contact": False})
+        fox.unpack({"time": 1.0, "mode": "run", "contact": True})
+        fox.data._freeze(fox.length)
+        fox.set_time(fox.data.time)
+        with patch("uplot.plot2") as mock_plot2:
+            fox.plot(left=[fox.data.mode, fox.data.contact])
+        left = mock_plot2.call_args.args[1]
+        self.assertEqual(left[0].tolist(), [0, 1])
+        self.assertEqual(left[1].tolist(), [0, 1])
+
+    def test_plot_many(self):
+        fox = Fox.empty()
+        for i in range(3):
+            fox.unpack({"time": float(i), "obs": {"x": i, "y": 0.5 * i}})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        plots = [
+            {"left": ["/obs/x"], "right": "/obs/y", "name": "xy"},
+            {"left": ["/obs"], "title": "Observations"},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            paths = fox.plot_many(plots, directory)
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                ["xy.html", "plot-1.html"],
+            )
+            with open(paths[1]) as file:
+                html = file.read()
+            self.assertIn("<title>Observations</title>", html)
+            self.assertIn("[0.0, 0.5, 1.0]", html)
+
+    def test_plot_many_with_shared_data(self):
+        fox = Fox.empty()
+        for i in range(3):
+            fox.unpack({"obs": {"x": i, "y": 0.5 * i}})
+        fox.freeze()
+        plots = [{"left": ["/obs/x", "/obs/y"]}, {"left": ["/obs/y"]}]
+        with tempfile.TemporaryDirectory() as directory:
+            paths = fox.plot_many(plots, directory, shared_data=True)
+            with open(os.path.join(directory, "data.js")) as file:
+                payload = file.read()
+            self.assertEqual(payload.count("[0.0, 0.5, 1.0]"), 1)
+            with open(paths[1]) as file:
+                html = file.read()
+            self.assertIn('<script src="data.js">', html)
+            self.assertIn("data = [foxplotData[0], foxplotData[2]];", html)
+            self.assertNotIn("[0.0, 0.5, 1.0]", html)
+
+    def test_plot_many_shared_slices(self):
+        fox = Fox.empty()
+        for i in range(4):
+            fox.unpack({"time": float(i), "x": 10.0 * i})
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        plots = [
+            {"left": [fox.data.x.slice(0.0, 2.0)]},
+            {"left": [fox.data.x.slice(2.0)]},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            fox.plot_many(plots, directory, shared_data=True)
+            with open(os.path.join(directory, "data.js")) as file:
+                payload = file.read()
+            self.assertIn("[0.0, 10.0]", payload)
+            self.assertIn("[20.0, 30.0]", payload)
+
+    def test_plot_many_in_parallel(self):
+        fox = Fox.empty()
+        for i in range(3):
+            fox.unpack({"x": i})
+        fox.freeze()
+        plots = [{"left": "/x", "name": f"page{i}"} for i in range(3)]
+        with tempfile.TemporaryDirectory() as directory:
+            paths = fox.plot_many(plots, directory, workers=2)
+            self.assertEqual(len(paths), 3)
+            self.assertTrue(all(os.path.exists(path) for path in paths))
 
     def test_source_attribute(self):
         fox = Fox.empty()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from foxplot.exceptions import FoxplotError
+from foxplot.functions import estimate_lag, estimate_lags
+from foxplot.node import Node
+from foxplot.series import Series
+from foxplot.time_index import TimeIndex
+
+
+def first_order_response(inputs, dt, lag):
+    outputs = np.zeros_like(inputs)
+    for i in range(len(inputs) - 1):
+        gamma = 1.0 - np.exp(-dt / lag)
+        outputs[i + 1] = outputs[i] + gamma * (inputs[i] - outputs[i])
+    return outputs
+
+
+class TestEstimateLags(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        dt = 0.01
+        times = TimeIndex(dt * np.arange(200))
+        self.time = Series("/time", times.values, times)
+        self.inputs = Node("/inputs")
+        self.outputs = Node("/outputs")
+        for key, lag in (("left", 0.05), ("right", 0.2)):
+            inputs = np.cumsum(rng.normal(size=200))
+            outputs = first_order_response(inputs, dt, lag)
+            outputs[50] = np.nan
+            self.inputs._insert([key], Series(f"/inputs/{key}", inputs, times))
+            self.outputs._insert(
+                [key], Series(f"/outputs/{key}", outputs, times)
+            )
+
+    def test_matches_estimate_lag(self):
+        time_constants = [0.015, 0.1, 1.0]
+        with self.assertLogs(level="WARNING"):
+            result = estimate_lags(
+                self.time, self.inputs, self.outputs, time_constants
+            )
+        for key in ("left", "right"):
+            for j, time_constant in enumerate(time_constants):
+                expected = estimate_lag(
+                    self.time,
+                    self.inputs[key],
+                    self.outputs[key],
+                    time_constant,
+                )
+                for name in ("fitting_error", "lag", "slope"):
+                    np.testing.assert_allclose(
+                        result[key][j][name]._values,
+                        expected[name]._values,
+                        rtol=1e-12,
+                    )
+
+    def test_recovers_lag(self):
+        result = estimate_lags(self.time, self.inputs, self.outputs, [1.0])
+        self.assertAlmostEqual(result["left"][0].lag._values[-1], 0.05, 3)
+        self.assertAlmostEqual(result["right"][0].lag._values[-1], 0.2, 3)
+        self.assertEqual(
+            result["right"][0].lag._label,
+            "lags(input=/inputs, output=/outputs)/right/0/lag",
+        )
+        self.assertIs(result.left[0].lag._time_index, self.time._time_index)
+
+    def test_arrays(self):
+        inputs = np.stack([s._values for _, s in self.inputs._items()], 1)
+        outputs = np.stack([s._values for _, s in self.outputs._items()], 1)
+        result = estimate_lags(self.time, inputs, outputs, [1.0])
+        expected = estimate_lags(self.time, self.inputs, self.outputs, [1.0])
+        np.testing.assert_array_equal(
+            result[1][0].lag._values, expected.right[0].lag._values
+        )
+
+    def test_mismatched_channels(self):
+        outputs = Node("/outputs")
+        outputs._insert(["left"], self.outputs.left)
+        with self.assertRaises(FoxplotError):
+            estimate_lags(self.time, self.inputs, outputs, [1.0])
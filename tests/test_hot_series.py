@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from foxplot.categorical_series import CategoricalSeries
+from foxplot.hot_series import HotSeries
+
+
+def freeze(values, max_index=None, start=0):
+    hot = HotSeries("/test")
+    for index, value in enumerate(values):
+        hot._update(start + index, value)
+    return hot._freeze(max_index or start + len(values))
+
+
+class TestHotSeries(unittest.TestCase):
+    def test_freeze_small_integers(self):
+        series = freeze([1, 2, 3])
+        self.assertEqual(series._values.dtype, np.int8)
+        self.assertEqual(series._values.tolist(), [1, 2, 3])
+
+    def test_freeze_large_integers(self):
+        self.assertEqual(freeze([0, 40000])._values.dtype, np.int32)
+        self.assertEqual(freeze([0, 2**40])._values.dtype, np.int64)
+
+    def test_freeze_booleans(self):
+        series = freeze([True, False, True])
+        self.assertEqual(series._values.dtype, bool)
+        self.assertEqual(series._values.tolist(), [True, False, True])
+
+    def test_freeze_lossless_single_precision(self):
+        self.assertEqual(freeze([0.5, 1.25])._values.dtype, np.float32)
+        self.assertEqual(freeze([0.1, 1.25])._values.dtype, np.float64)
+
+    def test_freeze_integers_with_missing_values(self):
+        series = freeze([12, 22], start=1)
+        self.assertEqual(series._values.dtype.kind, "f")
+        self.assertTrue(np.isnan(series._values[0]))
+        self.assertEqual(series._values[1:].tolist(), [12.0, 22.0])
+
+    def test_freeze_last_value_decides_nothing(self):
+        series = freeze([1.5, 2.5, 3])
+        self.assertEqual(series._values.tolist(), [1.5, 2.5, 3.0])
+
+    def test_freeze_forward_fill(self):
+        hot = HotSeries("/test")
+        hot._update(1, 5)
+        hot._update(3, 7)
+        series = hot._freeze(5)
+        self.assertTrue(np.isnan(series._values[0]))
+        self.assertEqual(series._values[1:].tolist(), [5.0, 5.0, 7.0, 7.0])
+
+    def test_freeze_strings(self):
+        series = freeze(["idle", "run", "run", "idle"])
+        self.assertIsInstance(series, CategoricalSeries)
+        self.assertEqual(len(series._categories), 2)
+        self.assertEqual(series._codes.dtype, np.int8)
+        self.assertEqual(
+            series._values.tolist(), ["idle", "run", "run", "idle"]
+        )
+
+    def test_freeze_strings_with_missing_values(self):
+        series = freeze(["idle", "run"], start=1)
+        self.assertIsInstance(series, CategoricalSeries)
+        self.assertEqual(series._values.tolist(), [None, "idle", "run"])
+
+    def test_freeze_mixed_types(self):
+        series = freeze([1, "two", 3.0])
+        self.assertEqual(series._values.dtype, object)
+        self.assertEqual(series._values.tolist(), [1, "two", 3.0])
+
+    def test_attributes_of_frozen_series(self):
+        hot = HotSeries("/test")
+        hot._update(0, 1.0)
+        hot._update(1, 3.0)
+        frozen = hot._freeze(2)
+        self.assertIs(hot._wait(), frozen)
+        self.assertEqual(hot._values.tolist(), [1.0, 3.0])
+        self.assertEqual(hot.abs()._values.tolist(), [1.0, 3.0])
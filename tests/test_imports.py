@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import sys
+import unittest
+
+# Budget for importing the command-line entry point, in seconds
+IMPORT_TIME_BUDGET = 0.2
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+class TestImports(unittest.TestCase):
+    def test_cli_imports_no_heavy_modules(self):
+        heavy = ("IPython", "msgpack", "numpy", "uplot")
+        result = run_python(
+            "import sys, foxplot.cli; "
+            f"print([m for m in {heavy} if m in sys.modules])"
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_fox_imports_no_plotting_modules(self):
+        result = run_python(
+            "import sys, foxplot; foxplot.Fox; "
+            "print([m for m in ('IPython', 'msgpack', 'uplot') "
+            "if m in sys.modules])"
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_cli_import_time_budget(self):
+        result = run_python("import foxplot.cli")
+        # Last line of -X importtime reports the cumulative time of the
+        # top-level import, in microseconds
+        cumulative = int(result.stderr.splitlines()[-1].split("|")[1])
+        self.assertLess(cumulative * 1e-6, IMPORT_TIME_BUDGET)
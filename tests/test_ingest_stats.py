@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from foxplot.ingest_stats import STAGES, IngestStats
+
+
+class TestIngestStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = IngestStats()
+        self.stats.bytes_read = 1000
+        self.stats.durations["read"] = 0.5
+        self.stats.durations["decode"] = 1.5
+        self.stats.nb_leaves = 3
+        self.stats.nb_records = 100
+
+    def test_init(self):
+        stats = IngestStats()
+        self.assertEqual(tuple(stats.durations.keys()), STAGES)
+        self.assertEqual(stats.records_per_second, 0.0)
+        self.assertIsNone(stats.peak_memory)
+
+    def test_records_per_second(self):
+        self.assertAlmostEqual(self.stats.total_duration, 2.0)
+        self.assertAlmostEqual(self.stats.records_per_second, 50.0)
+
+    def test_as_dict(self):
+        stats_dict = self.stats.as_dict()
+        self.assertEqual(stats_dict["bytes_read"], 1000)
+        self.assertEqual(stats_dict["durations"]["decode"], 1.5)
+        self.assertEqual(stats_dict["nb_records"], 100)
+
+    def test_summary(self):
+        self.stats.peak_memory = 2_000_000
+        summary = self.stats.summary()
+        self.assertIn("100 records", summary)
+        self.assertIn("- decode: 1.500 s (75.0%)", summary)
+        self.assertNotIn("interrupted", summary)
+        self.stats.interrupted = True
+        self.assertIn("interrupted", self.stats.summary())
+        self.assertIn("peak memory: 2.0 MB", summary)
@@ -6,10 +6,13 @@
 import unittest
 
 import numpy as np
+from foxplot.cache import transform_cache
 from foxplot.exceptions import FoxplotError
+from foxplot.fox import Fox
 from foxplot.hot_series import HotSeries
-from foxplot.node import Node
+from foxplot.node import ArrayNode, HotArray, Node
 from foxplot.series import Series
+from foxplot.time_index import TimeIndex
 
 
 class TestNode(unittest.TestCase):
@@ -231,3 +234,226 @@ class TestNode(unittest.TestCase):
         self.assertIsInstance(node.hot1, Series)
         self.assertIsInstance(node.hot2, Series)
         self.assertIsInstance(node.child, Node)  # Unchanged
+
+
+class TestNodeTransforms(unittest.TestCase):
+    def setUp(self):
+        fox = Fox.empty()
+        for i, t in enumerate([0.0, 0.5, 1.5, 2.0, 3.0]):
+            fox.unpack(
+                {
+                    "time": t,
+                    "joints": {
+                        "hip": {"position": float(i * i), "mode": "idle"},
+                        "knee": {"position": -2.0 * i},
+                    },
+                }
+            )
+        fox.freeze()
+        fox.set_time(fox.data.time)
+        self.joints = fox.data.joints
+
+    def test_stack_is_cached(self):
+        paths, leaves, values = self.joints._stack()
+        self.assertEqual(paths, [["hip", "position"], ["knee", "position"]])
+        self.assertEqual(values.shape, (2, 5))
+        self.assertTrue(values.flags.c_contiguous)
+        self.assertIs(self.joints._stack()[2], values)
+        self.assertNotIn("_Node__stack", repr(self.joints))
+
+    def test_stack_after_replacing_series(self):
+        values = self.joints._stack()[2]
+        self.joints.knee.position = -self.joints.knee.position
+        self.assertIsNot(self.joints._stack()[2], values)
+
+    def test_stack_after_writing_values(self):
+        self.joints.abs()
+        self.joints.knee.position._values = -np.ones(5)
+        result = self.joints.abs()
+        self.assertEqual(result.knee.position._values.tolist(), [1.0] * 5)
+
+    def test_stack_within_cache_budget(self):
+        transform_cache.clear()
+        values = self.joints._stack()[2]
+        self.assertFalse(values.flags.writeable)
+        self.assertEqual(transform_cache.info()["nbytes"], values.nbytes)
+
+    def test_abs(self):
+        result = self.joints.abs()
+        self.assertEqual(result._label, "abs(/joints)")
+        self.assertEqual(
+            result.knee.position._label, "abs(/joints/knee/position)"
+        )
+        self.assertEqual(
+            result.knee.position._values.tolist(), [0, 2, 4, 6, 8]
+        )
+        self.assertNotIn("mode", result.hip.__dict__)
+
+    def test_deriv_matches_series(self):
+        for cutoff in (0.0, 2.0):
+            result = self.joints.deriv("s", cutoff)
+            for joint in ("hip", "knee"):
+                expected = self.joints[joint].position.deriv("s", cutoff)
+                np.testing.assert_allclose(
+                    result[joint].position._values, expected._values
+                )
+                self.assertEqual(
+                    result[joint].position._label, expected._label
+                )
+
+    def test_std_matches_series(self):
+        result = self.joints.std(3)
+        expected = self.joints.hip.position.std(3)
+        np.testing.assert_allclose(
+            result.hip.position._values, expected._values
+        )
+
+    def test_arithmetic(self):
+        result = self.joints * 2.0 - self.joints
+        np.testing.assert_array_equal(
+            result.hip.position._values, self.joints.hip.position._values
+        )
+        ratio = self.joints / self.joints.hip.position
+        self.assertTrue(np.isnan(ratio.hip.position._values[0]))
+        self.assertEqual(ratio.hip.position._values[1], 1.0)
+        self.assertEqual((-self.joints).knee.position._values[1], 2.0)
+        self.assertEqual(
+            (self.joints + 1).knee.position._label,
+            "(/joints/knee/position + 1)",
+        )
+
+    def test_integer_and_boolean_series(self):
+        times = TimeIndex(np.array([0.0, 1.0]))
+        node = Node("/")
+        node._insert(["count"], Series("/count", np.int8([100, -100]), times))
+        node._insert(["flag"], Series("/flag", np.array([True, False]), times))
+        self.assertEqual((node + node).count._values.tolist(), [200, -200])
+        self.assertEqual((-node).flag._values.tolist(), [-1.0, -0.0])
+        result = node.deriv("s")
+        self.assertEqual(result.count._values.tolist(), [-200.0, -200.0])
+        self.assertEqual(result.flag._values.tolist(), [-1.0, -1.0])
+
+    def test_arithmetic_mismatched_nodes(self):
+        with self.assertRaises(FoxplotError):
+            self.joints + self.joints.hip
+
+    def test_no_numeric_series(self):
+        node = Node("/empty")
+        with self.assertRaises(FoxplotError):
+            node.abs()
+
+
+class TestArrayNode(unittest.TestCase):
+    def update(self, records):
+        node = Node("/")
+        for index, record in enumerate(records):
+            node._update(index, record)
+        node._freeze(len(records))
+        return node
+
+    def test_update_with_numeric_list(self):
+        node = Node("/")
+        node._update(0, {"scan": [1.0, 2.0, 3.0]})
+        self.assertIsInstance(node.scan, HotArray)
+        self.assertEqual(len(node.scan), 1)
+
+    def test_freeze_to_array(self):
+        node = self.update(
+            [
+                {"scan": [1.5, 2.0, 3.0]},
+                {"scan": [4.0, 5.0, 6.0]},
+            ]
+        )
+        self.assertIsInstance(node.scan, ArrayNode)
+        self.assertEqual(node.scan._array.shape, (2, 3))
+        self.assertEqual(node.scan._array.dtype, np.float32)
+        self.assertEqual(node.scan[2]._values.tolist(), [3.0, 6.0])
+        self.assertEqual(node.scan[2]._label, "/scan/2")
+        self.assertTrue(
+            np.shares_memory(node.scan[1]._values, node.scan._array)
+        )
+
+    def test_freeze_repeats_last_list(self):
+        node = self.update(
+            [
+                {"x": 1},
+                {"scan": [1, 2]},
+                {"x": 2},
+                {"scan": [3, 4], "x": 3},
+            ]
+        )
+        values = node.scan[0]._values
+        self.assertTrue(np.isnan(values[0]))
+        self.assertEqual(values[1:].tolist(), [1.0, 1.0, 3.0])
+
+    def test_freeze_integers(self):
+        node = self.update([{"ids": [1, 2]}, {"ids": [3, 300]}])
+        self.assertEqual(node.ids._array.dtype, np.int16)
+        self.assertEqual(node.ids[1]._values.tolist(), [2, 300])
+
+    def test_freeze_nested_lists(self):
+        node = self.update([{"m": [[1.0, 2.0], [3.0, 4.0]]}])
+        self.assertEqual(node.m._array.shape, (1, 2, 2))
+        self.assertIsInstance(node.m[1], ArrayNode)
+        self.assertEqual(node.m[1][0]._values.tolist(), [3.0])
+        self.assertEqual(node.m[1][0]._label, "/m/1/0")
+
+    def test_freeze_ragged_lists(self):
+        node = self.update([{"scan": [1.0, 2.0]}, {"scan": [3.0]}])
+        self.assertNotIsInstance(node.scan, ArrayNode)
+        self.assertEqual(node.scan[0]._values.tolist(), [1.0, 3.0])
+        self.assertEqual(node.scan[1]._values.tolist(), [2.0, 2.0])
+
+    def test_freeze_missing_components(self):
+        node = self.update([{"scan": [1.0, 2.0]}, {"scan": [3.0, None]}])
+        self.assertNotIsInstance(node.scan, ArrayNode)
+        self.assertEqual(node.scan[0]._values.tolist(), [1.0, 3.0])
+
+    def test_merge(self):
+        first = Node("/")
+        first._update(0, {"scan": [1.0, 2.0]})
+        second = Node("/")
+        second._update(0, {"scan": [3.0, 4.0]})
+        first._merge(second, offset=1)
+        first._freeze(2)
+        self.assertIsInstance(first.scan, ArrayNode)
+        self.assertEqual(first.scan[1]._values.tolist(), [2.0, 4.0])
+
+    def test_merge_ragged_after_array(self):
+        first = Node("/")
+        first._update(0, {"scan": [1.0, 2.0]})
+        second = Node("/")
+        second._update(0, {"scan": [3.0, [4.0, 5.0]]})
+        with self.assertNoLogs(level="WARNING"):
+            first._merge(second, offset=1)
+        first._freeze(2)
+        self.assertEqual(first.scan[0]._values.tolist(), [1.0, 3.0])
+        self.assertEqual(first.scan[1]._values.tolist(), [2.0, [4.0, 5.0]])
+
+    def test_merge_scalar_after_array(self):
+        first = Node("/")
+        first._update(0, {"scan": [1.0, 2.0]})
+        second = Node("/")
+        second._update(0, {"scan": 3.0})
+        with self.assertNoLogs(level="WARNING"):
+            first._merge(second, offset=1)
+        first._freeze(2)
+        self.assertEqual(first.scan._values.tolist(), [[1.0, 2.0], 3.0])
+
+    def test_merge_array_after_scalar(self):
+        first = Node("/")
+        first._update(0, {"scan": 3.0})
+        second = Node("/")
+        second._update(0, {"scan": [1.0, 2.0]})
+        first._merge(second, offset=1)
+        first._freeze(2)
+        self.assertEqual(first.scan._values.tolist(), [3.0, [1.0, 2.0]])
+
+    def test_merge_into_node(self):
+        first = Node("/")
+        first._update(0, {"scan": ["a", "b"]})
+        second = Node("/")
+        second._update(0, {"scan": [3.0, 4.0]})
+        first._merge(second, offset=1)
+        first._freeze(2)
+        self.assertEqual(first.scan[1]._values.tolist(), ["b", 4.0])
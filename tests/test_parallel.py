@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+import unittest
+
+from foxplot.parallel import parallel_map
+
+
+class TestParallelMap(unittest.TestCase):
+    def test_order(self):
+        def slow_square(x):
+            time.sleep(0.001 * (10 - x))  # later items finish first
+            return x * x
+
+        outputs = parallel_map(slow_square, range(10), workers=4)
+        self.assertEqual(outputs, [x * x for x in range(10)])
+
+    def test_single_worker(self):
+        threads = parallel_map(
+            lambda _: threading.get_ident(), range(3), workers=1
+        )
+        self.assertEqual(set(threads), {threading.get_ident()})
+
+    def test_empty(self):
+        self.assertEqual(parallel_map(abs, []), [])
+
+    def test_exception(self):
+        def fail(x):
+            raise ValueError(x)
+
+        with self.assertRaises(ValueError):
+            parallel_map(fail, range(3), workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import unittest
+
+from foxplot.progress import Progress
+
+
+class TestProgress(unittest.TestCase):
+    def test_format_with_total(self):
+        progress = Progress(total_bytes=4000, file=io.StringIO())
+        report = progress.format(1000, 50, elapsed=2.0)
+        self.assertIn("50 records (1.0 kB / 4.0 kB, 25.0%)", report)
+        self.assertIn("25 records/s", report)
+        self.assertIn("ETA 6 s", report)
+
+    def test_format_without_total(self):
+        progress = Progress(total_bytes=None, file=io.StringIO())
+        report = progress.format(2_500_000, 10, elapsed=1.0)
+        self.assertIn("(2.5 MB)", report)
+        self.assertNotIn("ETA", report)
+
+    def test_update_is_throttled(self):
+        output = io.StringIO()
+        progress = Progress(total_bytes=100, file=output, period=3600.0)
+        progress.update(10, 1)
+        self.assertEqual(output.getvalue(), "")
+        progress.close(100, 10)
+        self.assertTrue(output.getvalue().endswith("\n"))
+        self.assertIn("Loaded 10 records", output.getvalue())
+
+    def test_update(self):
+        output = io.StringIO()
+        progress = Progress(total_bytes=100, file=output, period=0.0)
+        progress.update(10, 1)
+        self.assertIn("10.0%", output.getvalue())
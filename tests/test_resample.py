@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from foxplot.exceptions import FoxplotError
+from foxplot.resample import interpolate_values, resample_values
+
+
+class TestResample(unittest.TestCase):
+    def setUp(self):
+        self.times = np.array([0.0, 0.1, 0.2, 0.3, 1.5, 1.6])
+        self.values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        self.bin_starts = np.array([0.0, 0.5, 1.0, 1.5])
+
+    def test_resample_mean(self):
+        output = resample_values(
+            self.times, self.values, self.bin_starts, "mean"
+        )
+        np.testing.assert_array_equal(output, [2.5, np.nan, np.nan, 5.5])
+
+    def test_resample_min_max(self):
+        low = resample_values(self.times, self.values, self.bin_starts, "min")
+        high = resample_values(self.times, self.values, self.bin_starts, "max")
+        np.testing.assert_array_equal(low, [1.0, np.nan, np.nan, 5.0])
+        np.testing.assert_array_equal(high, [4.0, np.nan, np.nan, 6.0])
+
+    def test_resample_last_holds_value(self):
+        output = resample_values(
+            self.times, self.values, self.bin_starts, "last"
+        )
+        np.testing.assert_array_equal(output, [4.0, 4.0, 4.0, 6.0])
+
+    def test_resample_unknown_aggregation(self):
+        with self.assertRaises(FoxplotError):
+            resample_values(self.times, self.values, self.bin_starts, "sum")
+
+    def test_interpolate_linear(self):
+        output = interpolate_values(
+            self.times, self.values, np.array([-1.0, 0.05, 0.9]), "linear"
+        )
+        np.testing.assert_allclose(output, [np.nan, 1.5, 4.5])
+
+    def test_interpolate_zoh(self):
+        output = interpolate_values(
+            self.times, self.values, np.array([-1.0, 0.05, 0.9]), "zoh"
+        )
+        np.testing.assert_array_equal(output, [np.nan, 1.0, 4.0])
+
+    def test_interpolate_unknown_method(self):
+        with self.assertRaises(FoxplotError):
+            interpolate_values(self.times, self.values, self.times, "cubic")
@@ -73,6 +73,29 @@ class TestSeries(unittest.TestCase):
         )
         self.assertEqual(result._label, "-test")
 
+    def test_int8_arithmetic_does_not_overflow(self):
+        series = Series("a", np.array([100, -100], dtype=np.int8), [0, 1])
+        self.assertEqual((series + series)._values.tolist(), [200.0, -200.0])
+        self.assertEqual((series * 2)._values.tolist(), [200.0, -200.0])
+        minimum = Series("b", np.array([-128], dtype=np.int8), [0])
+        self.assertEqual((-minimum)._values.tolist(), [128.0])
+        self.assertEqual(minimum.abs()._values.tolist(), [128.0])
+
+    def test_int8_deriv_does_not_overflow(self):
+        series = Series("a", np.array([100, -100], dtype=np.int8), [0, 1])
+        self.assertEqual(series.deriv("s")._values.tolist(), [-200.0, -200.0])
+
+    def test_bool_arithmetic(self):
+        series = Series("a", np.array([False, True, False]), [0, 1, 2])
+        other = Series("b", np.array([True, True, False]), [0, 1, 2])
+        self.assertEqual((series - other)._values.tolist(), [-1.0, 0.0, 0.0])
+        self.assertEqual((-series)._values.tolist(), [-0.0, -1.0, -0.0])
+        self.assertEqual(series.deriv("s")._values.tolist(), [1.0, -1.0, -1.0])
+        self.assertEqual(
+            series.low_pass_filter(10.0)._values.dtype, np.float64
+        )
+        self.assertEqual((series < other)._values.dtype, bool)
+
     def test_len(self):
         self.assertEqual(len(self.series), 5)
 
@@ -119,3 +142,167 @@ class TestSeries(unittest.TestCase):
         result = self.series.std(3)
         self.assertEqual(result._label, "std(test, 3)")
         self.assertEqual(len(result._values), len(self.values) - 2)
+
+    def test_operators_compute_in_double_precision(self):
+        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32)
+        series = Series("single", values, self.times)
+        self.assertEqual((series / 3)._values.dtype, np.float64)
+        self.assertEqual((series / 3)._values[0], 1.0 / 3.0)
+        self.assertEqual(series.deriv("s")._values.dtype, np.float64)
+
+    def test_operators_preserve_requested_precision(self):
+        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32)
+        series = Series("single", values, self.times, np.dtype(np.float32))
+        self.assertEqual((series + series)._values.dtype, np.float32)
+        self.assertEqual((series * np.float64(2.0))._values.dtype, np.float32)
+        self.assertEqual((series / 2.0)._values.dtype, np.float32)
+        self.assertEqual((-series)._values.dtype, np.float32)
+        self.assertEqual(series.abs()._values.dtype, np.float32)
+        self.assertEqual(series.deriv("s")._values.dtype, np.float32)
+        self.assertEqual(series.std(2)._values.dtype, np.float32)
+
+    def test_slice(self):
+        result = self.series.slice(1.0, 3.0)
+        np.testing.assert_array_equal(result._values, [2.0, 3.0])
+        np.testing.assert_array_equal(result._times, [1.0, 2.0])
+        self.assertIs(
+            result._time_index, self.series.abs().slice(1.0, 3.0)._time_index
+        )
+
+    def test_operators_share_time_index(self):
+        self.assertIs((-self.series)._time_index, self.series._time_index)
+
+    def test_resample(self):
+        result = self.series.resample(2.0, "mean")
+        np.testing.assert_array_equal(result._times, [0.0, 2.0, 4.0])
+        np.testing.assert_array_equal(result._values, [1.5, 3.5, 5.0])
+        other = (-self.series).resample(2.0, "max")
+        self.assertIs(other._time_index, result._time_index)
+
+    def test_resample_no_times_error(self):
+        with self.assertRaises(FoxplotError):
+            self.no_times_series.resample(1.0)
+
+    def test_align(self):
+        slow = Series("slow", np.array([0.0, 10.0]), np.array([0.0, 4.0]))
+        result = slow.align(self.series, "linear")
+        self.assertIs(result._time_index, self.series._time_index)
+        np.testing.assert_allclose(result._values, [0.0, 2.5, 5.0, 7.5, 10.0])
+        result = slow.align(self.series, "zoh")
+        np.testing.assert_allclose(result._values, [0.0, 0.0, 0.0, 0.0, 10.0])
+
+    def test_sub_and_reflected_operators(self):
+        result = self.series - self.series * 2.0
+        np.testing.assert_array_equal(result._values, -self.values)
+        self.assertEqual(result._label, "(test - (test * 2.0))")
+        np.testing.assert_array_equal(
+            (1.0 - self.series)._values, 1 - self.values
+        )
+        np.testing.assert_array_equal(
+            (2 * self.series)._values, 2 * self.values
+        )
+        np.testing.assert_array_equal(
+            (6.0 / self.series)._values, 6.0 / self.values
+        )
+        np.testing.assert_array_equal(
+            (1 + self.series)._values, self.values + 1
+        )
+
+    def test_comparisons(self):
+        result = self.series > 2.5
+        self.assertEqual(
+            result._values.tolist(), [False, False, True, True, True]
+        )
+        self.assertIs(result._time_index, self.series._time_index)
+        self.assertEqual((self.series <= 2.0)._values.sum(), 2)
+        self.assertEqual((self.series < self.series)._values.sum(), 0)
+        self.assertEqual((self.series >= self.series)._values.sum(), 5)
+
+    def test_array_protocol(self):
+        array = np.asarray(self.series)
+        self.assertIs(array, self.values)
+        self.assertEqual(
+            np.asarray(self.series, dtype=np.float32).dtype, np.float32
+        )
+        self.assertIsNot(np.array(self.series), self.values)
+
+    def test_ufunc(self):
+        result = np.sqrt(self.series)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result._label, "sqrt(test)")
+        self.assertIs(result._time_index, self.series._time_index)
+        np.testing.assert_allclose(result._values, np.sqrt(self.values))
+        result = np.maximum(self.series, 3.0)
+        self.assertEqual(result._values.tolist(), [3.0, 3.0, 3.0, 4.0, 5.0])
+
+    def test_ufunc_with_array(self):
+        result = self.values + self.series
+        self.assertIsInstance(result, Series)
+        np.testing.assert_array_equal(result._values, 2 * self.values)
+
+    def test_ufunc_out(self):
+        out = np.empty(5)
+        result = np.multiply(self.series, 2.0, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, 2 * self.values)
+        target = Series("target", np.zeros(5), self.times)
+        result = np.add(self.series, 1.0, out=target)
+        self.assertIs(result, target)
+        np.testing.assert_array_equal(target._values, self.values + 1.0)
+
+    def test_ufunc_different_lengths(self):
+        short = Series("short", np.array([1.0]), None)
+        with self.assertRaises(FoxplotError):
+            np.add(self.series, short)
+
+    def test_reductions(self):
+        self.assertEqual(np.mean(self.series), 3.0)
+        self.assertAlmostEqual(np.std(self.series), np.std(self.values))
+        self.assertEqual(np.add.reduce(self.series), 15.0)
+        self.assertEqual(np.max(self.series), 5.0)
+        result = np.add.accumulate(self.series)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result._values.tolist(), [1.0, 3.0, 6.0, 10.0, 15.0])
+
+    def test_psd(self):
+        times = 0.01 * np.arange(1024)
+        series = Series("sine", np.sin(2 * np.pi * 10.0 * times), times)
+        result = series.psd(segment_length=100)
+        self.assertEqual(result._time_index.axis, "frequency")
+        self.assertAlmostEqual(result._times[np.argmax(result._values)], 10.0)
+        self.assertEqual(result._label, "psd(sine, segment_length=100)")
+
+    def test_fft_non_uniform_times(self):
+        times = np.array([0.0, 0.5, 1.0, 2.0, 2.5, 3.0])
+        result = Series("x", np.ones(6), times).fft()
+        self.assertEqual(len(result), 4)  # resampled at 7 values
+        np.testing.assert_allclose(result._values, [1, 0, 0, 0], atol=1e-12)
+
+    def test_spectrogram(self):
+        times = 0.01 * np.arange(1024)
+        series = Series("sine", np.sin(2 * np.pi * 10.0 * times), times)
+        node = series.spectrogram(segment_length=100, overlap=0.0)
+        self.assertEqual(len(node._frequencies), 51)
+        np.testing.assert_allclose(node[10]._times[:2], [0.5, 1.5])
+        self.assertGreater(node[10]._values[0], node[20]._values[0])
+
+    def test_spectral_no_times_error(self):
+        with self.assertRaises(FoxplotError):
+            self.no_times_series.psd()
+
+    def test_crossings(self):
+        times = np.arange(8.0)
+        values = np.array([0.0, 2.0, 0.9, 1.1, 0.0, 3.0, 3.0, 3.0])
+        series = Series("signal", values, times)
+        self.assertEqual(
+            series.crossings(1.0).tolist(), [1.0, 2.0, 3.0, 4.0, 5.0]
+        )
+        self.assertEqual(series.crossings(1.0, "up").tolist(), [1.0, 3.0, 5.0])
+        self.assertEqual(
+            series.crossings(1.0, "up", hysteresis=0.5).tolist(), [1.0, 5.0]
+        )
+        self.assertEqual(
+            series.crossings(1.0, min_duration=2.0).tolist(), [5.0]
+        )
+        with self.assertRaises(FoxplotError):
+            self.no_times_series.crossings(1.0)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from foxplot.fox import Fox
+from foxplot.hot_series import HotSeries
+from foxplot.series import Series
+from foxplot.sparse_series import SparseSeries, forward_fill
+
+
+class TestSparseSeries(unittest.TestCase):
+    def setUp(self):
+        self.series = SparseSeries(
+            "/events",
+            indices=np.array([2, 5]),
+            updates=np.array([np.nan, 1.0, 2.0]),
+            length=7,
+            times=None,
+        )
+
+    def test_forward_fill(self):
+        values = forward_fill(np.array([0, 2]), np.array([-1, 10, 20]), 4)
+        self.assertEqual(values.tolist(), [10, 10, 20, 20])
+
+    def test_len(self):
+        self.assertEqual(len(self.series), 7)
+
+    def test_values(self):
+        np.testing.assert_array_equal(
+            self.series._values, [np.nan, np.nan, 1.0, 1.0, 1.0, 2.0, 2.0]
+        )
+
+    def test_values_materialized_once(self):
+        self.assertIs(self.series._values, self.series._values)
+
+    def test_nbytes(self):
+        self.assertEqual(self.series._nbytes, 2 * 8 + 3 * 8)
+
+    def test_dense(self):
+        dense = self.series.dense()
+        self.assertNotIsInstance(dense, SparseSeries)
+        self.assertIs(dense._time_index, self.series._time_index)
+        np.testing.assert_array_equal(dense._values, self.series._values)
+
+    def test_arithmetic(self):
+        result = self.series * 2.0
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result._values[-1], 4.0)
+
+    def test_freeze_below_threshold(self):
+        hot = HotSeries("/events")
+        hot._update(3, 7)
+        series = hot._freeze(100, sparse_threshold=0.05)
+        self.assertIsInstance(series, SparseSeries)
+        self.assertEqual(series._updates.nbytes, 2 * 4)
+        self.assertEqual(series._values[3:5].tolist(), [7.0, 7.0])
+
+    def test_freeze_above_threshold(self):
+        hot = HotSeries("/events")
+        hot._update(3, 7)
+        series = hot._freeze(10, sparse_threshold=0.05)
+        self.assertNotIsInstance(series, SparseSeries)
+
+    def test_fox_sparse_threshold(self):
+        fox = Fox.empty()
+        for i in range(100):
+            fox.unpack({"x": i, "error": 404} if i == 50 else {"x": i})
+        fox.freeze()
+        self.assertIsInstance(fox.data.error, SparseSeries)
+        self.assertNotIsInstance(fox.data.x, SparseSeries)
+        with patch("uplot.plot2") as mock_plot2:
+            fox.plot(left=[fox.data.error])
+        left = mock_plot2.call_args.args[1]
+        self.assertEqual(len(left[0]), 100)
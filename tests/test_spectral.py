@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+from foxplot.exceptions import FoxplotError
+from foxplot.spectral import (
+    amplitude_spectrum,
+    get_window,
+    make_uniform,
+    spectrogram,
+    welch,
+)
+
+
+class TestSpectral(unittest.TestCase):
+    def setUp(self):
+        self.period = 0.01  # 100 Hz
+        times = self.period * np.arange(4096)
+        self.values = 2.0 * np.sin(2.0 * np.pi * 12.5 * times)
+
+    def test_make_uniform_keeps_uniform_values(self):
+        times = np.array([0.0, 0.1, 0.2, 0.3])
+        values = np.array([1.0, 2.0, 3.0, 4.0])
+        uniform, period = make_uniform(times, values)
+        self.assertIs(uniform, values)
+        self.assertAlmostEqual(period, 0.1)
+
+    def test_make_uniform_interpolates(self):
+        times = np.array([0.0, 1.0, 2.0, 4.0])
+        values = np.array([0.0, 1.0, 2.0, 4.0])
+        uniform, period = make_uniform(times, values)
+        self.assertEqual(period, 1.0)
+        np.testing.assert_allclose(uniform, [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_make_uniform_too_short(self):
+        with self.assertRaises(FoxplotError):
+            make_uniform(np.array([0.0]), np.array([1.0]))
+
+    def test_unknown_window(self):
+        with self.assertRaises(FoxplotError):
+            get_window("triangle", 8)
+
+    def test_welch_peak(self):
+        frequencies, densities = welch(self.values, self.period, 256)
+        self.assertEqual(len(frequencies), 129)
+        self.assertAlmostEqual(frequencies[np.argmax(densities)], 12.5)
+
+    def test_welch_parseval(self):
+        noise = np.random.default_rng(42).normal(size=1 << 14)
+        frequencies, densities = welch(
+            noise, self.period, 128, window="boxcar"
+        )
+        power = np.sum(densities) * (frequencies[1] - frequencies[0])
+        self.assertAlmostEqual(power, np.var(noise), delta=0.05)
+
+    def test_welch_chunks(self):
+        _, full = welch(self.values, self.period, 256)
+        _, chunked = welch(self.values, self.period, 256, chunk_size=300)
+        np.testing.assert_allclose(chunked, full)
+
+    def test_welch_invalid_segments(self):
+        with self.assertRaises(FoxplotError):
+            welch(self.values, self.period, segment_length=1 << 20)
+        with self.assertRaises(FoxplotError):
+            welch(self.values, self.period, overlap=1.0)
+
+    def test_spectrogram(self):
+        frequencies, centers, power = spectrogram(
+            self.values, self.period, 256, overlap=0.5, chunk_size=1000
+        )
+        self.assertEqual(power.shape, (129, 31))
+        self.assertAlmostEqual(centers[0], 1.28)
+        self.assertAlmostEqual(centers[1] - centers[0], 1.28)
+        self.assertTrue(np.all(np.argmax(power, axis=0) == 32))
+        _, full = welch(self.values, self.period, 256)
+        np.testing.assert_allclose(power.mean(axis=1), full)
+
+    def test_amplitude_spectrum(self):
+        frequencies, amplitudes = amplitude_spectrum(self.values, self.period)
+        peak = np.argmax(amplitudes)
+        self.assertAlmostEqual(frequencies[peak], 12.5, places=1)
+        self.assertAlmostEqual(amplitudes[peak], 2.0, places=2)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from foxplot.exceptions import FoxplotError
+from foxplot.time_index import TimeIndex
+
+
+class TestTimeIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TimeIndex(np.array([0.0, 1.0, 2.0, 3.0, 13.0, 14.0]))
+
+    def test_wrap(self):
+        self.assertIs(TimeIndex.wrap(self.index), self.index)
+        self.assertIsNone(TimeIndex.wrap(None).values)
+        self.assertEqual(len(TimeIndex.wrap(np.zeros(3))), 3)
+
+    def test_len_unset(self):
+        self.assertEqual(len(TimeIndex()), 0)
+
+    def test_matches(self):
+        self.assertTrue(self.index.matches(self.index))
+        self.assertTrue(self.index.matches(TimeIndex(self.index.values)))
+        self.assertFalse(self.index.matches(TimeIndex(self.index.values + 1)))
+        self.assertFalse(TimeIndex().matches(TimeIndex()))
+
+    def test_is_monotonic(self):
+        self.assertTrue(self.index.is_monotonic)
+        self.assertFalse(TimeIndex(np.array([0.0, 2.0, 1.0])).is_monotonic)
+
+    def test_median_dt(self):
+        self.assertAlmostEqual(self.index.median_dt, 1.0)
+
+    def test_gaps(self):
+        self.assertEqual(self.index.gaps(factor=5.0).tolist(), [3])
+
+    def test_set_values_clears_cache(self):
+        self.assertAlmostEqual(self.index.median_dt, 1.0)
+        self.index.set_values(np.array([0.0, 2.0, 4.0]))
+        self.assertAlmostEqual(self.index.median_dt, 2.0)
+        self.assertEqual(self.index.version, 1)
+
+    def test_slice(self):
+        index_slice, sub_index = self.index.slice(1.0, 13.0)
+        self.assertEqual(index_slice, slice(1, 4))
+        self.assertEqual(sub_index.values.tolist(), [1.0, 2.0, 3.0])
+        self.assertIs(self.index.slice(1.0, 13.0)[1], sub_index)
+
+    def test_slice_unset(self):
+        with self.assertRaises(FoxplotError):
+            TimeIndex().slice(0.0, 1.0)
+
+    def test_nanoseconds(self):
+        start = 1_709_294_400_000_000_000
+        index = TimeIndex()
+        index.set_nanoseconds(start + np.array([0, 1, 3], dtype=np.int64))
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.values[0], start / 1e9)
+        self.assertEqual(index.timesteps.tolist(), [1e-9, 2e-9])
+        self.assertTrue(index.is_monotonic)
+        _, sub_index = index.slice(None, None)
+        np.testing.assert_array_equal(sub_index.nanoseconds, index.nanoseconds)
+        index.set_values(np.array([0.0, 1.0]))
+        self.assertIsNone(index.nanoseconds)
+        self.assertEqual(index.timesteps.tolist(), [1.0])
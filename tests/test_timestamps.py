@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from foxplot.exceptions import FoxplotError
+from foxplot.timestamps import (
+    NAT,
+    guess_epoch_unit,
+    parse_times,
+    parse_timestamps,
+    to_seconds,
+)
+
+# 2024-03-01T12:00:00Z in nanoseconds since the epoch
+NOON = 1_709_294_400_000_000_000
+
+
+class TestTimestamps(unittest.TestCase):
+    def test_parse_iso(self):
+        strings = np.array(
+            ["2024-03-01T12:00:00", "2024-03-01T12:00:00.000000001"],
+            dtype=object,
+        )
+        self.assertEqual(parse_timestamps(strings).tolist(), [NOON, NOON + 1])
+
+    def test_parse_utc_offsets(self):
+        strings = np.array(
+            ["2024-03-01T12:00:00Z", "2024-03-01T14:00:00+02:00"]
+        )
+        self.assertEqual(parse_timestamps(strings).tolist(), [NOON, NOON])
+
+    def test_parse_missing(self):
+        strings = np.array([None, "2024-03-01T12:00:00"], dtype=object)
+        nanoseconds = parse_timestamps(strings)
+        self.assertEqual(nanoseconds.tolist(), [NAT, NOON])
+        seconds = to_seconds(nanoseconds)
+        self.assertTrue(np.isnan(seconds[0]))
+        self.assertEqual(seconds[1], NOON / 1e9)
+
+    def test_parse_invalid(self):
+        with self.assertRaises(FoxplotError):
+            parse_timestamps(np.array(["yesterday"], dtype=object))
+
+    def test_guess_epoch_unit(self):
+        self.assertEqual(guess_epoch_unit(np.array([NOON // 10**9])), "s")
+        self.assertEqual(guess_epoch_unit(np.array([NOON // 10**6])), "ms")
+        self.assertEqual(guess_epoch_unit(np.array([NOON // 10**3])), "us")
+        self.assertEqual(guess_epoch_unit(np.array([NOON])), "ns")
+        self.assertEqual(guess_epoch_unit(np.array([0, 1, 2])), "s")
+        self.assertEqual(guess_epoch_unit(np.array([np.nan, 1.7e12])), "ms")
+
+    def test_parse_integers(self):
+        for factor in (10**9, 10**6, 10**3, 1):
+            epoch = np.array([NOON // factor], dtype=np.int64)
+            self.assertEqual(parse_times(epoch).tolist(), [NOON])
+        ticks = np.array([1, 2], dtype=np.int16)
+        self.assertEqual(
+            parse_times(ticks, "ms").tolist(), [10**6, 2 * 10**6]
+        )
+
+    def test_parse_integers_beyond_nanoseconds(self):
+        seconds = np.array([0, 10**12], dtype=np.int64)
+        times = parse_times(seconds, "s")
+        self.assertEqual(times.dtype, np.float64)
+        self.assertEqual(times.tolist(), [0.0, 1e12])
+
+    def test_parse_floats(self):
+        seconds = np.array([0.5, 1.5])
+        self.assertIs(parse_times(seconds), seconds)
+        self.assertEqual(parse_times(seconds, "ms").tolist(), [5e-4, 1.5e-3])
+        self.assertEqual(parse_times(np.array([1.7e12])).tolist(), [1.7e9])
+
+    def test_parse_datetimes(self):
+        datetimes = np.array(["2024-03-01T12:00:00"], dtype="datetime64[s]")
+        self.assertEqual(parse_times(datetimes).tolist(), [NOON])
+
+    def test_parse_invalid_unit(self):
+        with self.assertRaises(FoxplotError):
+            parse_times(np.array([1, 2]), "days")
+
+
+if __name__ == "__main__":
+    unittest.main()